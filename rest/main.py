@@ -1,10 +1,28 @@
+import sys
 import asyncio
 from utils.rest import AsyncRestUtil
+from utils.journal import JobJournal
+
+# config 의 domain_{DOMAIN_TYPE} 주소 사용
+DOMAIN_TYPE = "local"
+
+# job 진행 기록
+# - python main.py --resume : 미완료/실패 job 만 재실행
+# - python main.py --fresh  : 미완료 기록이 있어도 지우고 새로 실행
+JOURNAL_PATH = "./journal/batch_patch.sqlite"
 
 
 async def main():
-    rest = AsyncRestUtil("config/config.yml")
+    resume = "--resume" in sys.argv[1:]
+    fresh = "--fresh" in sys.argv[1:]
+
+    # 세션(커넥션 풀)을 실행 전체에서 재사용하고 종료 시 닫는다
+    async with AsyncRestUtil("config/config.yml") as rest:
+        await run(rest, resume, fresh)
+        rest.report_metrics()
 
+
+async def run(rest: AsyncRestUtil, resume: bool = False, fresh: bool = False):
     jobs = [
         {"jobName": "job1", "location": "log1.xml", "server": "111"},
         {"jobName": "job2", "location": "log2.xml", "server": "121"},
@@ -12,13 +30,13 @@ async def main():
     ]
 
     # =========================
-    # 개별 job 단위 요청 실행 (PUT JSON 등)
+    # 전체 job 요청을 한 번에 배치 실행 (PUT JSON 등)
+    # - 동시 실행 수: rest.base.batch_concurrency / domains.<name>.concurrency
+    # - 완료 순서대로 도착하므로 index 로 원래 순서 복원
     # =========================
-    results = []
-
-    for job in jobs:
-        job_requests = [
-            {
+    def job_requests():
+        for job in jobs:
+            yield {
                 "domain_name": "local",
                 "api_name": "batch_patch",
                 "body_params": {
@@ -26,19 +44,47 @@ async def main():
                     "location": job["location"],
                     "server": job["server"],
                 },
-            },
+            }
             # 필요시 GET 요청도 추가 가능
-            # {
+            # yield {
             #     "domain_name": "local",
             #     "api_name": "batch_query",
             #     "path_params": {"jobName": job["jobName"]},
-            # },
-        ]
+            # }
+
+    # =========================
+    # job journal
+    # - 일반 실행: 기록 초기화 후 전체 job 을 pending 으로 등록
+    #   (미완료/실패 job 이 남아 있으면 실행 안 함 → --resume 또는 --fresh 필요)
+    # - --resume : 기록된 spec 중 done 이 아닌 것만 재실행
+    # =========================
+    with JobJournal(JOURNAL_PATH) as journal:
+        if not resume:
+            if journal.unfinished() and not fresh:
+                print(
+                    f"[JOURNAL] {JOURNAL_PATH} 에 미완료 job 이 있습니다 {journal.counts()}\n"
+                    f"  이어서 실행: python main.py --resume / 기록을 지우고 새로 실행: python main.py --fresh"
+                )
+                return
+            journal.reset()
+            journal.register(job_requests())
+        else:
+            print(f"[RESUME] {JOURNAL_PATH} {journal.counts()}")
+
+        seqs = []
+
+        def journal_requests():
+            for seq, spec in journal.pending():
+                seqs.append(seq)
+                yield spec
 
-        job_responses = await rest.call_all(job_requests)
+        results = []
+        async for r in rest.call_batch(DOMAIN_TYPE, journal_requests()):
+            journal.mark(seqs[r["index"]], r)
+            results.append(r)
+        results.sort(key=lambda r: r["index"])
 
-        # job_responses 그대로 results에 추가
-        results.extend(job_responses)
+        print(f"[JOURNAL] {journal.counts()}")
 
     # =========================
     # FINAL RESULT: 개별 요청 출력
@@ -65,7 +111,7 @@ async def main():
     # =========================
     job_names = [job["jobName"] for job in jobs]
 
-    save_responses = await rest.call_all([
+    save_responses = await rest.call_all(DOMAIN_TYPE, [
         {
             "domain_name": "local",
             "api_name": "batch_save",
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+import yaml
+
+# main.py 와 같이 rest/ 를 기준으로 utils 패키지를 import 한다 (cd rest && python main.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from utils.rest import AsyncRestUtil  # noqa: E402
+from support import DOMAIN, DOMAIN_TYPE, LocalServer  # noqa: E402
+
+
+@pytest.fixture
+def serve():
+    """
+    serve({("GET", "/path"): handler}) → 시작된 LocalServer
+    """
+    servers: List[LocalServer] = []
+
+    def start(routes):
+        srv = LocalServer(routes).start()
+        servers.append(srv)
+        return srv
+
+    yield start
+    for srv in servers:
+        srv.stop()
+
+
+@pytest.fixture
+def make_rest(tmp_path):
+    """
+    make_rest(url, apis, base={...}, domain={...}) → AsyncRestUtil
+    도메인 이름은 DOMAIN, domain_type 은 DOMAIN_TYPE
+    """
+
+    def build(url: str, apis: Dict[str, Any], base: Dict[str, Any] = None, domain: Dict[str, Any] = None):
+        cfg = {
+            "rest": {
+                "base": {"is_log": False, "spool_dir": str(tmp_path / "spool"), **(base or {})},
+                "domains": {DOMAIN: {f"domain_{DOMAIN_TYPE}": url, **(domain or {}), "apis": apis}},
+            }
+        }
+        path = tmp_path / "config.yml"
+        path.write_text(yaml.safe_dump(cfg, allow_unicode=True), encoding="utf-8")
+        return AsyncRestUtil(str(path))
+
+    return build
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+from aiohttp import web
+
+DOMAIN = "t"
+DOMAIN_TYPE = "test"
+
+
+class LocalServer:
+    """
+    background thread 의 event loop 에서 도는 aiohttp 서버.
+    테스트 코드는 asyncio.run() 으로 별도 loop 를 쓰므로 서로 막지 않는다.
+    """
+
+    def __init__(self, routes: Dict[Tuple[str, str], Callable]):
+        self.routes = routes
+        self.url = ""
+        self.peers: List[Any] = []   # 요청별 client (host, port) → keep-alive 재사용 확인용
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @web.middleware
+    async def _record_peer(self, request, handler):
+        self.peers.append(request.transport.get_extra_info("peername"))
+        return await handler(request)
+
+    @staticmethod
+    def _coroutine(handler):
+        # aiohttp 는 async 함수만 handler 로 받으므로 callable 객체는 감싼다
+        async def call(request):
+            return await handler(request)
+        return call
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        app = web.Application(middlewares=[self._record_peer], client_max_size=64 * 1024 * 1024)
+        for (method, path), handler in self.routes.items():
+            app.router.add_route(method, path, self._coroutine(handler))
+        self._runner = web.AppRunner(app)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        self._loop.run_until_complete(site.start())
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self) -> "LocalServer":
+        self._thread.start()
+        self._ready.wait(10)
+        return self
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(10)
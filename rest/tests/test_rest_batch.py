@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from support import DOMAIN, DOMAIN_TYPE
+
+APIS = {"job": {"method": "GET", "path": "/job/{n}", "body": {"type": "none"}}}
+
+
+class Jobs:
+    # /job/{n}: n 밀리초 뒤 응답
+    def __init__(self):
+        self.now = 0
+        self.peak = 0
+        self.seen = []
+
+    async def __call__(self, request):
+        n = int(request.match_info["n"])
+        self.seen.append(n)
+        self.now += 1
+        self.peak = max(self.peak, self.now)
+        try:
+            await asyncio.sleep(n / 1000)
+        finally:
+            self.now -= 1
+        return web.json_response({"n": n})
+
+
+def _job(ms):
+    return {"domain_name": DOMAIN, "api_name": "job", "path_params": {"n": ms}}
+
+
+def test_call_all_keeps_input_order(serve, make_rest):
+    srv = serve({("GET", "/job/{n}"): Jobs()})
+    rest = make_rest(srv.url, APIS)
+    delays = [60, 10, 40, 0, 20]
+
+    async def scenario():
+        async with rest:
+            return await rest.call_all(DOMAIN_TYPE, [_job(ms) for ms in delays])
+
+    results = asyncio.run(scenario())
+
+    assert [r["index"] for r in results] == list(range(len(delays)))
+    assert [r["url"].rsplit("/", 1)[1] for r in results] == [str(ms) for ms in delays]
+
+
+def test_call_batch_yields_in_completion_order(serve, make_rest):
+    srv = serve({("GET", "/job/{n}"): Jobs()})
+    rest = make_rest(srv.url, APIS)
+
+    async def scenario():
+        async with rest:
+            return [r["index"] async for r in rest.call_batch(DOMAIN_TYPE, [_job(300), _job(0)])]
+
+    assert asyncio.run(scenario()) == [1, 0]
+
+
+def test_input_is_read_lazily_and_break_cancels_pending(serve, make_rest):
+    jobs = Jobs()
+    srv = serve({("GET", "/job/{n}"): jobs})
+    rest = make_rest(srv.url, APIS)
+    pulled = []
+
+    def requests():
+        for i in range(100):
+            pulled.append(i)
+            yield _job(200 if i else 0)
+
+    async def scenario():
+        async with rest:
+            async for r in rest.call_batch(DOMAIN_TYPE, requests(), concurrency=2):
+                assert r["index"] == 0
+                break
+            await asyncio.sleep(0.3)
+
+    asyncio.run(scenario())
+
+    # 동시 2건 → 입력은 window(2 * 2)개 + 완료 후 보충 1개까지만 읽음
+    assert len(pulled) <= 5
+    assert len(jobs.seen) <= 3
+    assert jobs.peak <= 2
+
+
+def test_async_iterable_input_and_concurrency_argument(serve, make_rest):
+    jobs = Jobs()
+    srv = serve({("GET", "/job/{n}"): jobs})
+    rest = make_rest(srv.url, APIS, base={"batch_concurrency": 10})
+
+    async def requests():
+        for _ in range(8):
+            await asyncio.sleep(0)
+            yield _job(30)
+
+    async def scenario():
+        async with rest:
+            return [r async for r in rest.call_batch(DOMAIN_TYPE, requests(), concurrency=3)]
+
+    results = asyncio.run(scenario())
+
+    assert sorted(r["index"] for r in results) == list(range(8))
+    assert all(r["response_status"] == 200 for r in results)
+    assert jobs.peak == 3
+
+
+def test_domain_type_is_required(make_rest):
+    rest = make_rest("http://127.0.0.1:9", APIS)
+
+    async def scenario():
+        async for _ in rest.call_batch(None, []):
+            pass
+
+    with pytest.raises(TypeError):
+        asyncio.run(scenario())
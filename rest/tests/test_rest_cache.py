@@ -0,0 +1,208 @@
+import asyncio
+import gc
+
+import pytest
+from aiohttp import web
+
+from support import DOMAIN, DOMAIN_TYPE
+from utils.cache import ResponseCache, CACHE_COALESCED, CACHE_HIT, CACHE_MISS
+
+
+class Sender:
+    def __init__(self, delay=0.05, fail=None, result=None):
+        self.delay = delay
+        self.fail = fail
+        self.result = result or {"response_status": 200}
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail is not None:
+            raise self.fail
+        return dict(self.result, n=self.calls)
+
+
+def _run(coro_fn):
+    """
+    loop 에 보고된 예외(예: Future exception was never retrieved)도 함께 반환
+    """
+    reported = []
+
+    async def scenario():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, ctx: reported.append(ctx["message"]))
+        out = await coro_fn()
+        gc.collect()
+        await asyncio.sleep(0)
+        return out
+
+    return asyncio.run(scenario()), reported
+
+
+def test_concurrent_fetches_are_coalesced():
+    cache = ResponseCache({"ttl": 0})
+    send = Sender()
+
+    async def scenario():
+        return await asyncio.gather(*[cache.fetch(("k",), send) for _ in range(5)])
+
+    results, reported = _run(scenario)
+
+    assert send.calls == 1
+    assert sorted(src for _, src in results) == [CACHE_COALESCED] * 4 + [CACHE_MISS]
+    assert all(r is results[0][0] for r, _ in results)
+    assert cache.stats()["entries"] == 0   # ttl 0: 합치기만
+    assert reported == []
+
+
+def test_exception_reaches_every_waiter_and_is_not_cached():
+    cache = ResponseCache({"ttl": 60})
+    send = Sender(fail=ValueError("boom"))
+
+    async def scenario():
+        first = await asyncio.gather(*[cache.fetch(("k",), send) for _ in range(3)], return_exceptions=True)
+        alone = await asyncio.gather(cache.fetch(("solo",), send), return_exceptions=True)
+        return first, alone
+
+    (first, alone), reported = _run(scenario)
+
+    assert [type(e) for e in first] == [ValueError] * 3
+    assert isinstance(alone[0], ValueError)
+    assert send.calls == 2
+    assert cache._inflight == {} and cache.stats()["entries"] == 0
+    assert reported == []
+
+
+def test_error_results_are_shared_but_not_stored():
+    cache = ResponseCache({"ttl": 60})
+    send = Sender(result={"error": "HTTP 500"})
+
+    async def scenario():
+        shared = await asyncio.gather(*[cache.fetch(("k",), send) for _ in range(3)])
+        again = await cache.fetch(("k",), send)
+        return shared, again
+
+    (shared, again), _ = _run(scenario)
+
+    assert {r["n"] for r, _ in shared} == {1}
+    assert again == ({"error": "HTTP 500", "n": 2}, CACHE_MISS)
+
+
+def test_ttl_hit_and_expiry():
+    cache = ResponseCache({"ttl": 0.1})
+    send = Sender(delay=0)
+
+    async def scenario():
+        a = await cache.fetch(("k",), send)
+        b = await cache.fetch(("k",), send)
+        await asyncio.sleep(0.15)
+        c = await cache.fetch(("k",), send)
+        return a, b, c
+
+    (a, b, c), _ = _run(scenario)
+
+    assert [src for _, src in (a, b, c)] == [CACHE_MISS, CACHE_HIT, CACHE_MISS]
+    assert (a[0]["n"], b[0]["n"], c[0]["n"]) == (1, 1, 2)
+
+
+def test_lru_bound():
+    cache = ResponseCache({"ttl": 60, "max_entries": 2})
+    send = Sender(delay=0)
+
+    async def scenario():
+        for k in ("a", "b", "a", "c"):
+            await cache.fetch((k,), send)
+        return [src for k in ("a", "b", "c") for _, src in [await cache.fetch((k,), send)]]
+
+    sources, _ = _run(scenario)
+
+    # "a" 를 다시 썼으므로 "b" 가 밀려난다
+    assert sources[0] == CACHE_HIT and sources[1] == CACHE_MISS
+
+
+def test_cancelled_waiter_does_not_cancel_the_request():
+    cache = ResponseCache({"ttl": 60})
+    send = Sender(delay=0.1)
+
+    async def scenario():
+        owner = asyncio.ensure_future(cache.fetch(("k",), send))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(cache.fetch(("k",), send))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        return await owner, waiter.cancelled()
+
+    ((result, src), waiter_cancelled), _ = _run(scenario)
+
+    assert waiter_cancelled and src == CACHE_MISS and send.calls == 1
+
+
+def test_cancelled_owner_clears_inflight():
+    cache = ResponseCache({"ttl": 60})
+    send = Sender(delay=0.1)
+
+    async def scenario():
+        owner = asyncio.ensure_future(cache.fetch(("k",), send))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(cache.fetch(("k",), send))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        waited = await asyncio.gather(waiter, return_exceptions=True)
+        retry = await cache.fetch(("k",), send)
+        return waited, retry
+
+    (waited, retry), _ = _run(scenario)
+
+    assert isinstance(waited[0], asyncio.CancelledError)
+    assert retry[1] == CACHE_MISS and send.calls == 2
+
+
+def test_key_uses_vary_headers_and_ignores_query_order():
+    cache = ResponseCache({"vary_headers": ["Authorization"]})
+    k1 = cache.key("get", "http://x/a", {"b": 1, "a": 2}, {"Authorization": "t1", "X-Trace": "1"})
+    k2 = cache.key("GET", "http://x/a", {"a": 2, "b": 1}, {"authorization": "t1", "X-Trace": "2"})
+    k3 = cache.key("GET", "http://x/a", {"a": 2, "b": 1}, {"Authorization": "t2"})
+    assert k1 == k2 != k3
+    assert ResponseCache().key("GET", "u", None, {"X": "1"}) != ResponseCache().key("GET", "u", None, {"X": "2"})
+
+
+def test_rest_util_sends_identical_gets_once(serve, make_rest):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.match_info["name"])
+        await asyncio.sleep(0.05)
+        return web.json_response({"job": request.match_info["name"]})
+
+    srv = serve({("GET", "/q/{name}"): handler})
+    rest = make_rest(srv.url, {"q": {
+        "method": "GET", "path": "/q/{name}", "body": {"type": "none"}, "cache": {"ttl": 30},
+    }})
+
+    def req(name):
+        return {"domain_name": DOMAIN, "api_name": "q", "path_params": {"name": name}}
+
+    async def scenario():
+        async with rest:
+            first = await rest.call_all(DOMAIN_TYPE, [req("a")] * 5 + [req("b")])
+            later = await rest.call_all(DOMAIN_TYPE, [req("a")])
+            return first, later
+
+    first, later = asyncio.run(scenario())
+
+    assert sorted(calls) == ["a", "b"]
+    assert sorted(r["cache"] for r in first[:5]) == [CACHE_COALESCED] * 4 + [CACHE_MISS]
+    assert len({r["req_id"] for r in first}) == 6
+    assert [r["index"] for r in first] == list(range(6))
+    assert later[0]["cache"] == CACHE_HIT and later[0]["response_body"] == first[0]["response_body"]
+
+
+def test_cache_on_non_get_api_is_a_config_error(make_rest):
+    rest = make_rest("http://127.0.0.1:9", {"p": {"method": "POST", "path": "/p", "cache": {"ttl": 1}}})
+
+    async def scenario():
+        async with rest:
+            await rest.call_all(DOMAIN_TYPE, [{"domain_name": DOMAIN, "api_name": "p"}])
+
+    with pytest.raises(ValueError, match="cache is only for GET/HEAD"):
+        asyncio.run(scenario())
@@ -0,0 +1,125 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+import yaml
+from aiohttp import web
+
+import main
+from utils.journal import JobJournal, JOB_DONE, JOB_FAILED, JOB_PENDING
+from utils.rest import AsyncRestUtil
+
+REST_DIR = Path(main.__file__).resolve().parent
+
+
+def test_register_pending_mark(tmp_path):
+    path = tmp_path / "j" / "jobs.sqlite"
+    with JobJournal(str(path)) as journal:
+        assert journal.register({"n": i} for i in range(7)) == 7
+        # pending() 은 페이지 단위로 읽으므로 도중에 mark 해도 빠지거나 중복되지 않는다
+        seen = []
+        for seq, spec in journal.pending(page_size=3):
+            seen.append(spec["n"])
+            journal.mark(seq, {"error": "boom", "attempts": 2} if seq % 3 == 0 else {"response_status": 200})
+        assert seen == list(range(7))
+        assert journal.counts() == {JOB_PENDING: 0, JOB_DONE: 4, JOB_FAILED: 3}
+        assert journal.unfinished() == 3
+
+    # 프로세스가 다시 떠도 기록이 남아 있다
+    with JobJournal(str(path)) as journal:
+        assert [spec["n"] for _, spec in journal.pending()] == [0, 3, 6]
+        journal.mark(3, {"response_status": 200, "attempts": 1})
+        row = journal._db.execute("SELECT status, attempts, error FROM jobs WHERE seq = 3").fetchone()
+        assert row == (JOB_DONE, 3, None)
+        journal.reset()
+        assert journal.unfinished() == 0 and list(journal.pending()) == []
+
+
+class BatchServer:
+    def __init__(self):
+        self.fail = {"job2"}
+        self.patched = []
+        self.saved = 0
+
+    async def patch(self, request):
+        body = await request.json()
+        self.patched.append(body["jobName"])
+        if body["jobName"] in self.fail:
+            return web.json_response({"error": "down"}, status=500)
+        return web.json_response({"ok": body["jobName"]})
+
+    async def save(self, request):
+        self.saved += 1
+        return web.json_response({"saved": await request.json()})
+
+
+@pytest.fixture
+def batch(serve, tmp_path, monkeypatch):
+    server = BatchServer()
+    srv = serve({("PUT", "/batch/rest/patch"): server.patch, ("POST", "/batch/rest/save"): server.save})
+
+    # 실제 config.yml 에서 주소/파일 경로만 바꿔 사용
+    cfg = yaml.safe_load((REST_DIR / "config" / "config.yml").read_text(encoding="utf-8"))
+    base = cfg["rest"]["base"]
+    base.update(is_log=False, metrics={"enabled": False})
+    local = cfg["rest"]["domains"]["local"]
+    local["domain_local"] = srv.url
+    patch_body = local["apis"]["batch_patch"]["body"]
+    patch_body["file_path"] = str(REST_DIR / patch_body["file_path"])
+    config = tmp_path / "config.yml"
+    config.write_text(yaml.safe_dump(cfg, allow_unicode=True), encoding="utf-8")
+
+    journal_path = tmp_path / "journal" / "batch.sqlite"
+    monkeypatch.setattr(main, "JOURNAL_PATH", str(journal_path))
+
+    def run(**flags):
+        async def scenario():
+            async with AsyncRestUtil(str(config)) as rest:
+                await main.run(rest, **flags)
+        asyncio.run(scenario())
+        with JobJournal(str(journal_path)) as journal:
+            return journal.counts()
+
+    return server, run
+
+
+def test_resume_reruns_only_unfinished_jobs(batch, capsys):
+    server, run = batch
+
+    assert run() == {JOB_PENDING: 0, JOB_DONE: 2, JOB_FAILED: 1}
+    assert sorted(server.patched) == ["job1", "job2", "job3"]
+
+    server.fail.clear()
+    server.patched.clear()
+    assert run(resume=True) == {JOB_PENDING: 0, JOB_DONE: 3, JOB_FAILED: 0}
+    assert server.patched == ["job2"]
+    assert "[RESUME]" in capsys.readouterr().out
+
+
+def test_plain_run_refuses_to_wipe_unfinished_journal(batch, capsys):
+    server, run = batch
+    run()
+    capsys.readouterr()
+    server.patched.clear()
+    saved = server.saved
+
+    assert run() == {JOB_PENDING: 0, JOB_DONE: 2, JOB_FAILED: 1}
+
+    assert server.patched == [] and server.saved == saved
+    out = capsys.readouterr().out
+    assert "--resume" in out and "--fresh" in out
+
+
+def test_fresh_starts_over(batch):
+    server, run = batch
+    run()
+    server.fail.clear()
+    server.patched.clear()
+
+    assert run(fresh=True) == {JOB_PENDING: 0, JOB_DONE: 3, JOB_FAILED: 0}
+    assert sorted(server.patched) == ["job1", "job2", "job3"]
+
+    # 모두 done 이면 다음 일반 실행은 그대로 새 batch 로 시작
+    server.patched.clear()
+    assert run() == {JOB_PENDING: 0, JOB_DONE: 3, JOB_FAILED: 0}
+    assert sorted(server.patched) == ["job1", "job2", "job3"]
@@ -0,0 +1,96 @@
+import asyncio
+import json
+import threading
+
+from aiohttp import web
+
+from support import DOMAIN, DOMAIN_TYPE
+from utils import log as rest_log
+from utils.log import AsyncLogWriter, EV_REQUEST, EV_RESPONSE, EV_RETRY
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_jsonl_file_sink_keeps_order(tmp_path):
+    path = tmp_path / "logs" / "rest.jsonl"
+    writer = AsyncLogWriter({"console": False, "file": str(path)})
+
+    for i in range(50):
+        writer.emit(EV_REQUEST, f"REQ-{i:04d}", api_name="a", body={"한글": i})
+    writer.stop()
+
+    events = _lines(path)
+    assert [e["req_id"] for e in events] == [f"REQ-{i:04d}" for i in range(50)]
+    assert events[3]["body"] == {"한글": 3} and events[3]["event"] == EV_REQUEST
+
+
+def test_formatting_runs_on_writer_thread(tmp_path, monkeypatch):
+    threads = []
+    orig = rest_log.JsonlFormatter.format
+
+    def record_thread(self, record):
+        threads.append(threading.current_thread())
+        return orig(self, record)
+
+    monkeypatch.setattr(rest_log.JsonlFormatter, "format", record_thread)
+    writer = AsyncLogWriter({"console": False, "file": str(tmp_path / "r.jsonl")})
+
+    writer.emit(EV_RESPONSE, "REQ-0001", api_name="a", status=200, body="{}")
+    writer.stop()
+
+    assert threads and threading.main_thread() not in threads
+
+
+def test_text_format_and_restart_after_stop(tmp_path):
+    path = tmp_path / "r.log"
+    writer = AsyncLogWriter({"console": False, "file": str(path), "file_format": "text"})
+    writer.emit(EV_REQUEST, "REQ-0001", api_name="save", method="POST", url="http://x/save", headers={}, json={"a": 1})
+    writer.stop()
+    writer.emit(EV_RETRY, "REQ-0001", api_name="save", attempt=1, max_attempts=3, delay=0.5, reason="HTTP 503")
+    writer.stop()
+
+    text = path.read_text(encoding="utf-8")
+    assert "===== REQUEST [REQ-0001] =====" in text and "POST http://x/save" in text
+    assert "===== RETRY [REQ-0001] 1/3 in 0.50s (HTTP 503) =====" in text
+
+
+def test_file_sink_rotates(tmp_path):
+    path = tmp_path / "r.jsonl"
+    writer = AsyncLogWriter({"console": False, "file": str(path), "max_bytes": 2000, "backup_count": 2})
+
+    for i in range(100):
+        writer.emit(EV_REQUEST, f"REQ-{i:04d}", pad="x" * 100)
+    writer.stop()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["r.jsonl", "r.jsonl.1", "r.jsonl.2"]
+    assert path.stat().st_size <= 2000
+
+
+def test_rest_util_logs_request_retry_response(serve, make_rest, tmp_path):
+    calls = []
+
+    async def handler(request):
+        calls.append(1)
+        return web.json_response({"n": len(calls)}, status=503 if len(calls) == 1 else 200)
+
+    srv = serve({("GET", "/x"): handler})
+    path = tmp_path / "rest.jsonl"
+    rest = make_rest(
+        srv.url,
+        {"get": {"method": "GET", "path": "/x", "body": {"type": "none"}}},
+        base={"is_log": True, "log": {"console": False, "file": str(path)},
+              "retry": {"max_attempts": 2, "statuses": [503], "backoff_base": 0.01}},
+    )
+
+    async def scenario():
+        async with rest:
+            return await rest.call_all(DOMAIN_TYPE, [{"domain_name": DOMAIN, "api_name": "get"}])
+
+    (r,) = asyncio.run(scenario())
+
+    events = _lines(path)
+    assert [e["event"] for e in events] == ["request", "response", "retry", "request", "response"]
+    assert {e["req_id"] for e in events} == {r["req_id"]}
+    assert events[-1]["status"] == 200
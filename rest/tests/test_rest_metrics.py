@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from support import DOMAIN, DOMAIN_TYPE
+from utils.metrics import LatencyHistogram, RestMetrics
+
+
+def test_histogram_percentiles_are_close():
+    h = LatencyHistogram()
+    for ms in range(1, 1001):
+        h.record(float(ms))
+
+    s = h.summary()
+    assert (s["count"], s["min"], s["max"]) == (1000, 1.0, 1000.0)
+    assert s["avg"] == pytest.approx(500.5)
+    for p, expected in ((50, 500), (95, 950), (99, 990)):
+        assert h.percentile(p) == pytest.approx(expected, rel=0.03)
+
+
+def test_histogram_memory_does_not_grow_with_count():
+    h = LatencyHistogram()
+    for i in range(100_000):
+        h.record(1 + (i % 1000) * 0.37)
+    assert h.count == 100_000
+    assert len(h.buckets) < 200
+
+
+def test_empty_histogram():
+    assert LatencyHistogram().summary() == {"count": 0}
+    assert LatencyHistogram().percentile(99) == 0.0
+
+
+def test_record_computes_phase_spans_and_errors():
+    m = RestMetrics()
+    m.record("d", "a", {"start": 0.0, "end": 0.2, "request_start": 0.01, "headers_received": 0.11}, ok=True)
+    m.record("d", "a", {"start": 0.0, "end": 0.1}, ok=False)
+
+    out = m.to_dict()["d"]["a"]
+    assert (out["requests"], out["errors"]) == (2, 1)
+    assert out["latency_ms"]["ttfb"]["count"] == 1
+    assert out["latency_ms"]["ttfb"]["p50"] == pytest.approx(100, rel=0.03)
+    assert out["latency_ms"]["total"]["count"] == 2
+    assert out["latency_ms"]["connect"] == {"count": 0}
+
+
+def test_rest_util_collects_and_exports_metrics(serve, make_rest, tmp_path, capsys):
+    async def slow(request):
+        await asyncio.sleep(0.05)
+        return web.json_response({})
+
+    srv = serve({("GET", "/slow"): slow})
+    export = tmp_path / "m" / "metrics.json"
+    rest = make_rest(
+        srv.url,
+        {"slow": {"method": "GET", "path": "/slow", "body": {"type": "none"}}},
+        base={"metrics": {"enabled": True, "export": str(export)}},
+    )
+
+    async def scenario():
+        async with rest:
+            for _ in range(3):
+                await rest.call_all(DOMAIN_TYPE, [{"domain_name": DOMAIN, "api_name": "slow"}])
+
+    asyncio.run(scenario())
+    rest.report_metrics()
+
+    stats = json.loads(export.read_text(encoding="utf-8"))[DOMAIN]["slow"]
+    lat = stats["latency_ms"]
+    assert (stats["requests"], stats["errors"]) == (3, 0)
+    assert lat["ttfb"]["count"] == 3 and lat["ttfb"]["min"] >= 45
+    assert lat["total"]["min"] >= lat["ttfb"]["min"]
+    assert lat["connect"]["count"] == 1   # keep-alive: 연결은 한 번만
+    out = capsys.readouterr().out
+    assert "===== METRICS (ms) =====" in out and f"{DOMAIN}/slow" in out
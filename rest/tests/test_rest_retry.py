@@ -0,0 +1,134 @@
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from support import DOMAIN, DOMAIN_TYPE
+from utils.retry import RetryPolicy, TokenBucket, parse_retry_after
+
+
+def test_policy_defaults_to_a_single_attempt():
+    policy = RetryPolicy()
+    assert policy.max_attempts == 1
+    assert not policy.can_retry(1)
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy({"max_attempts": 5, "backoff_base": 0.5, "backoff_max": 1.5, "jitter": False})
+    assert [policy.delay(a) for a in (1, 2, 3, 4)] == [0.5, 1.0, 1.5, 1.5]
+
+
+def test_jitter_stays_within_half_to_full_delay():
+    policy = RetryPolicy({"backoff_base": 2, "jitter": True})
+    assert all(2.0 <= policy.delay(2) <= 4.0 for _ in range(50))
+
+
+def test_retry_after_wins_and_is_capped():
+    policy = RetryPolicy({"retry_after_max": 10, "jitter": False})
+    assert policy.delay(1, "3") == 3
+    assert policy.delay(1, "3600") == 10
+    assert policy.delay(1, "garbage") == 0.5
+    assert RetryPolicy({"respect_retry_after": False, "jitter": False}).delay(1, "3") == 0.5
+
+
+def test_parse_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+    assert parse_retry_after(format_datetime(datetime(2000, 1, 1, tzinfo=timezone.utc), usegmt=True)) == 0
+    assert parse_retry_after("") is None
+
+
+def test_exception_names_are_resolved():
+    policy = RetryPolicy({"exceptions": ["ClientConnectionError", "TimeoutError"]})
+    assert policy.retry_on_exception(aiohttp.ClientConnectionError())
+    assert not policy.retry_on_exception(ValueError())
+    with pytest.raises(ValueError):
+        RetryPolicy({"exceptions": ["NoSuchError"]})
+
+
+def test_token_bucket_limits_rate():
+    async def scenario():
+        bucket = TokenBucket(20, 2)
+        t0 = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - t0
+
+    # burst 2 건은 즉시, 나머지 4건은 1/20 초 간격
+    assert 0.18 <= asyncio.run(scenario()) < 0.5
+
+
+class Flaky:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    async def __call__(self, request):
+        self.calls += 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        return web.json_response({"call": self.calls}, status=status, headers={"Retry-After": "0"})
+
+
+RETRY = {"max_attempts": 3, "statuses": [503], "backoff_base": 0.01, "jitter": False}
+APIS = {"get": {"method": "GET", "path": "/x", "body": {"type": "none"}}}
+REQ = {"domain_name": DOMAIN, "api_name": "get"}
+
+
+def _call(rest):
+    async def scenario():
+        async with rest:
+            (r,) = await rest.call_all(DOMAIN_TYPE, [REQ])
+            return r
+    return asyncio.run(scenario())
+
+
+def test_retryable_status_is_retried_until_success(serve, make_rest):
+    flaky = Flaky([503, 503])
+    srv = serve({("GET", "/x"): flaky})
+
+    r = _call(make_rest(srv.url, APIS, base={"retry": RETRY}))
+
+    assert (r["response_status"], r["attempts"], flaky.calls) == (200, 3, 3)
+
+
+def test_attempts_are_bounded(serve, make_rest):
+    flaky = Flaky([503] * 10)
+    srv = serve({("GET", "/x"): flaky})
+
+    r = _call(make_rest(srv.url, APIS, base={"retry": RETRY}))
+
+    assert "error" in r and "503" in r["error"]
+    assert (r["attempts"], flaky.calls) == (3, 3)
+
+
+def test_other_status_is_not_retried(serve, make_rest):
+    flaky = Flaky([400])
+    srv = serve({("GET", "/x"): flaky})
+
+    r = _call(make_rest(srv.url, APIS, base={"retry": RETRY}))
+
+    assert "400" in r["error"]
+    assert (r["attempts"], flaky.calls) == (1, 1)
+
+
+def test_api_retry_block_overrides_base(serve, make_rest):
+    flaky = Flaky([503, 503])
+    srv = serve({("GET", "/x"): flaky})
+    apis = {"get": {**APIS["get"], "retry": {"max_attempts": 1}}}
+
+    r = _call(make_rest(srv.url, apis, base={"retry": RETRY}))
+
+    assert (r["attempts"], flaky.calls) == (1, 1)
+
+
+def test_connection_error_is_retried(make_rest):
+    rest = make_rest("http://127.0.0.1:9", APIS, base={"retry": {**RETRY, "exceptions": ["ClientConnectionError"]}})
+
+    r = _call(rest)
+
+    assert r["attempts"] == 3
+    assert "error" in r
@@ -0,0 +1,77 @@
+import asyncio
+
+from aiohttp import web
+
+from support import DOMAIN, DOMAIN_TYPE
+
+PING = {"ping": {"method": "GET", "path": "/ping/{n}", "body": {"type": "none"}}}
+
+
+def _requests(n):
+    return [{"domain_name": DOMAIN, "api_name": "ping", "path_params": {"n": i}} for i in range(n)]
+
+
+class InFlight:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.now = 0
+        self.peak = 0
+
+    async def __call__(self, request):
+        self.now += 1
+        self.peak = max(self.peak, self.now)
+        await asyncio.sleep(self.delay)
+        self.now -= 1
+        return web.json_response({"n": request.match_info["n"]})
+
+
+def test_sequential_calls_reuse_one_connection(serve, make_rest):
+    srv = serve({("GET", "/ping/{n}"): InFlight(0)})
+    rest = make_rest(srv.url, PING)
+
+    async def scenario():
+        async with rest:
+            session = rest._session
+            for i in range(5):
+                (r,) = await rest.call_all(DOMAIN_TYPE, _requests(1))
+                assert r["response_status"] == 200
+            assert rest._session is session
+
+    asyncio.run(scenario())
+
+    assert len(srv.peers) == 5
+    assert len(set(srv.peers)) == 1
+
+
+def test_close_releases_session_and_loop_bound_state(serve, make_rest):
+    handler = InFlight(0.02)
+    srv = serve({("GET", "/ping/{n}"): handler})
+    rest = make_rest(srv.url, PING, base={"batch_concurrency": 2}, domain={"rate_limit": {"rps": 1000}})
+
+    async def scenario():
+        async with rest:
+            results = await rest.call_all(DOMAIN_TYPE, _requests(6))
+        assert rest._session is None
+        assert rest._global_sem is None and rest._domain_sems == {}
+        return [r["response_status"] for r in results]
+
+    # 두 번째 실행은 다른 event loop: 이전 loop 에 묶인 세마포어/lock 을 쓰면 실패한다
+    assert asyncio.run(scenario()) == [200] * 6
+    assert asyncio.run(scenario()) == [200] * 6
+    assert handler.peak <= 2
+
+
+def test_domain_concurrency_caps_in_flight_requests(serve, make_rest):
+    handler = InFlight(0.05)
+    srv = serve({("GET", "/ping/{n}"): handler})
+    rest = make_rest(srv.url, PING, base={"batch_concurrency": 10}, domain={"concurrency": 3})
+
+    async def scenario():
+        async with rest:
+            assert set(rest._domain_sems) == {DOMAIN}
+            return await rest.call_all(DOMAIN_TYPE, _requests(12))
+
+    results = asyncio.run(scenario())
+
+    assert [r["response_status"] for r in results] == [200] * 12
+    assert handler.peak == 3
@@ -0,0 +1,147 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+from support import DOMAIN, DOMAIN_TYPE
+from utils.stream import JsonArrayStream
+
+ITEMS = [1, -2.5e3, "a,]b", {"k": [1, {"x": "한글"}]}, None, True, [], "\"quoted\"", 1234567890]
+
+
+def _feed_all(data: bytes, step: int):
+    parser = JsonArrayStream()
+    out = []
+    for i in range(0, len(data), step):
+        out.extend(parser.feed(data[i:i + step]))
+    out.extend(parser.feed(b"", final=True))
+    return out
+
+
+@pytest.mark.parametrize("step", [1, 2, 3, 7, 1000])
+def test_json_array_stream_any_chunking(step):
+    data = json.dumps(ITEMS, ensure_ascii=False, indent=1).encode("utf-8")
+    assert _feed_all(data, step) == ITEMS
+
+
+def test_json_array_stream_waits_for_number_end():
+    parser = JsonArrayStream()
+    assert parser.feed(b"[12") == []
+    assert parser.feed(b"34, 5") == [1234]
+    assert parser.feed(b"]", final=True) == [5]
+
+
+@pytest.mark.parametrize("data", [b"[]", b"  [ ]  "])
+def test_json_array_stream_empty(data):
+    assert _feed_all(data, 1) == []
+
+
+def test_json_array_stream_rejects_non_array_and_truncation():
+    with pytest.raises(ValueError):
+        JsonArrayStream().feed(b'{"a": 1}')
+    parser = JsonArrayStream()
+    parser.feed(b"[1, 2")
+    with pytest.raises(ValueError):
+        parser.feed(b"", final=True)
+
+
+BODY = json.dumps([{"i": i, "pad": "x" * 100} for i in range(2000)]).encode()
+
+
+async def full(request):
+    return web.Response(body=BODY, content_type="application/json")
+
+
+async def broken(request):
+    resp = web.StreamResponse(headers={"Content-Length": str(len(BODY))})
+    await resp.prepare(request)
+    await resp.write(BODY[:50_000])
+    request.transport.close()
+    return resp
+
+
+def _apis(mode, chunk_size=4096, retry=None):
+    api = {"method": "GET", "path": "/{kind}", "body": {"type": "none"},
+           "response": {"mode": mode, "chunk_size": chunk_size}}
+    if retry:
+        api["retry"] = retry
+    return {"get": api}
+
+
+def _call(rest, kind="full", **info):
+    async def scenario():
+        async with rest:
+            (r,) = await rest.call_all(DOMAIN_TYPE, [
+                {"domain_name": DOMAIN, "api_name": "get", "path_params": {"kind": kind}, **info}])
+            return r
+    return asyncio.run(scenario())
+
+
+@pytest.fixture
+def srv(serve):
+    class Twice:
+        calls = 0
+
+        async def __call__(self, request):
+            Twice.calls += 1
+            return web.Response(body=BODY, status=202 if Twice.calls == 1 else 200)
+
+    return serve({("GET", "/full"): full, ("GET", "/broken"): broken, ("GET", "/twice"): Twice()})
+
+
+def test_spool_writes_whole_body_to_file(srv, make_rest, tmp_path):
+    r = _call(make_rest(srv.url, _apis("spool")))
+
+    assert r["response_status"] == 200 and r["response_body"] is None
+    assert r["response_size"] == len(BODY)
+    assert Path(r["response_file"]).read_bytes() == BODY
+    assert [p.name for p in (tmp_path / "spool").iterdir()] == [Path(r["response_file"]).name]
+
+
+def test_spool_removes_partial_file_on_error(srv, make_rest, tmp_path):
+    r = _call(make_rest(srv.url, _apis("spool")), "broken")
+
+    assert "error" in r
+    assert list((tmp_path / "spool").iterdir()) == []
+
+
+def test_spool_removes_file_of_retried_response(srv, make_rest, tmp_path):
+    retry = {"max_attempts": 2, "statuses": [202], "backoff_base": 0.01}
+    r = _call(make_rest(srv.url, _apis("spool", retry=retry)), "twice")
+
+    assert (r["response_status"], r["attempts"]) == (200, 2)
+    assert list((tmp_path / "spool").iterdir()) == [Path(r["response_file"])]
+
+
+def test_callback_receives_every_chunk(srv, make_rest):
+    chunks = []
+
+    async def on_chunk(chunk, meta):
+        chunks.append((len(chunk), meta["api_name"]))
+
+    r = _call(make_rest(srv.url, _apis("callback", chunk_size=1024)), on_chunk=on_chunk)
+
+    assert sum(n for n, _ in chunks) == r["response_size"] == len(BODY)
+    assert max(n for n, _ in chunks) <= 1024
+    assert {api for _, api in chunks} == {"get"}
+
+
+def test_json_items_mode_delivers_each_element(srv, make_rest):
+    seen = []
+    r = _call(make_rest(srv.url, _apis("json_items", chunk_size=333)), on_item=lambda item, meta: seen.append(item["i"]))
+
+    assert r["response_items"] == 2000
+    assert seen == list(range(2000))
+
+
+def test_error_status_is_buffered_not_streamed(serve, make_rest, tmp_path):
+    async def missing(request):
+        return web.Response(status=404, text="nope")
+
+    srv = serve({("GET", "/full"): missing})
+    r = _call(make_rest(srv.url, _apis("spool")))
+
+    assert "404" in r["error"]
+    assert not (tmp_path / "spool").exists() or list((tmp_path / "spool").iterdir()) == []
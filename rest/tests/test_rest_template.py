@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+from aiohttp import web
+
+from support import DOMAIN, DOMAIN_TYPE
+from utils.template import Template
+
+
+def test_render_fills_known_slots_and_keeps_unknown():
+    tpl = Template("/jobs/{name}/runs/{run}?x={missing}")
+
+    assert tpl.render({"name": "a", "run": 3}) == "/jobs/a/runs/3?x={missing}"
+    assert tpl.has_slots
+
+
+def test_render_nested_structures_without_touching_constants():
+    src = {"id": "{id}", "tags": ["t-{id}", 1, None], "meta": {"fixed": "x", "n": 2.5}}
+    tpl = Template(src)
+
+    assert tpl.render({"id": 7}) == {"id": "7", "tags": ["t-7", 1, None], "meta": {"fixed": "x", "n": 2.5}}
+    assert src["id"] == "{id}"   # source 는 그대로
+
+
+def test_render_with_no_params():
+    assert Template("{a}-{b}").render(None) == "{a}-{b}"
+
+
+class Echo:
+    def __init__(self):
+        self.bodies = []
+
+    async def __call__(self, request):
+        self.bodies.append((request.path, dict(request.headers), await request.text()))
+        return web.json_response({"ok": True})
+
+
+def test_request_rendering_and_body_file_read_once(serve, make_rest, tmp_path):
+    echo = Echo()
+    srv = serve({("POST", "/{tail:.*}"): echo})
+    body_file = tmp_path / "body.json"
+    body_file.write_text(json.dumps({"job": "{job}", "items": ["{item}"]}), encoding="utf-8")
+    apis = {
+        "from_file": {
+            "method": "POST", "path": "/run/{job}", "headers": {"X-Job": "{job}"},
+            "body": {"type": "json", "file_path": str(body_file)},
+        },
+        "whole": {"method": "POST", "path": "/whole", "body": {"type": "json", "value": "{payload}"}},
+        "text": {"method": "POST", "path": "/text", "body": {"type": "text", "value": "job={job}"}},
+    }
+    rest = make_rest(srv.url, apis)
+
+    def req(api, **params):
+        return {"domain_name": DOMAIN, "api_name": api, "path_params": params, "header_params": params,
+                "body_params": params}
+
+    async def scenario():
+        async with rest:
+            await rest.call_all(DOMAIN_TYPE, [req("from_file", job="a", item=1)])
+            body_file.unlink()   # 템플릿은 최초 1회만 파일에서 읽는다
+            return await rest.call_all(DOMAIN_TYPE, [
+                req("from_file", job="b", item=2),
+                req("whole", payload=[1, {"k": "v"}]),
+                req("text", job="c"),
+            ])
+
+    results = asyncio.run(scenario())
+
+    assert all(r["response_status"] == 200 for r in results)
+    by_path = {path: (headers, body) for path, headers, body in echo.bodies}
+    assert json.loads(by_path["/run/a"][1]) == {"job": "a", "items": ["1"]}
+    assert json.loads(by_path["/run/b"][1]) == {"job": "b", "items": ["2"]}
+    assert by_path["/run/b"][0]["X-Job"] == "b"
+    assert json.loads(by_path["/whole"][1]) == [1, {"k": "v"}]   # "{key}" 하나면 값의 타입 유지
+    assert by_path["/text"][1] == "job=c"
@@ -0,0 +1,105 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+from support import DOMAIN, DOMAIN_TYPE
+
+APIS = {
+    "upload": {
+        "method": "POST",
+        "path": "/upload",
+        "body": {
+            "type": "multipart",
+            "files": [{"param": "files", "path": "{file1}"}, {"param": "files", "path": "{file2}"}],
+            "data": {"jobName": "{jobName}"},
+        },
+    }
+}
+
+
+class Receiver:
+    def __init__(self, fail_first=False):
+        self.fail_first = fail_first
+        self.received = []
+
+    async def __call__(self, request):
+        headers = dict(request.headers)
+        form = await request.post()
+        files = [(f.filename, f.file.read()) for f in form.getall("files")]
+        self.received.append((headers, files, form.get("jobName")))
+        if self.fail_first and len(self.received) == 1:
+            return web.Response(status=503)
+        return web.json_response({"ok": True})
+
+
+@pytest.fixture
+def files(tmp_path):
+    a = tmp_path / "a.bin"
+    a.write_bytes(os.urandom(700_000))
+    b = tmp_path / "b.txt"
+    b.write_text("second file")
+    return a, b
+
+
+def _upload(rest, a, b, **extra):
+    async def scenario():
+        async with rest:
+            (r,) = await rest.call_all(DOMAIN_TYPE, [{
+                "domain_name": DOMAIN, "api_name": "upload",
+                "body_params": {"file1": str(a), "file2": str(b), "jobName": "job-1"}, **extra,
+            }])
+            return r
+    return asyncio.run(scenario())
+
+
+def _open_fds():
+    return set(os.listdir("/proc/self/fd"))
+
+
+def test_files_are_streamed_with_content_length(serve, make_rest, files):
+    a, b = files
+    recv = Receiver()
+    srv = serve({("POST", "/upload"): recv})
+    progress = []
+
+    r = _upload(make_rest(srv.url, APIS, base={"upload_chunk_size": 65536}), a, b,
+                on_progress=lambda sent, total, meta: progress.append((sent, total)))
+
+    assert r["response_status"] == 200
+    (headers, received, job), = recv.received
+    assert received == [("a.bin", a.read_bytes()), ("b.txt", b"second file")]
+    assert job == "job-1"
+    assert "Content-Length" in headers and "Transfer-Encoding" not in headers
+
+    total = a.stat().st_size + b.stat().st_size
+    assert r["upload_bytes"] == r["upload_total"] == total
+    assert progress[-1] == (total, total)
+    assert all(s2 > s1 for (s1, _), (s2, _) in zip(progress, progress[1:]))
+
+
+@pytest.mark.skipif(not Path("/proc/self/fd").exists(), reason="needs /proc")
+def test_retry_resends_files_and_closes_handles(serve, make_rest, files):
+    a, b = files
+    recv = Receiver(fail_first=True)
+    srv = serve({("POST", "/upload"): recv})
+    rest = make_rest(srv.url, APIS, base={"retry": {"max_attempts": 2, "statuses": [503], "backoff_base": 0.01}})
+    before = _open_fds()
+
+    r = _upload(rest, a, b)
+
+    assert (r["response_status"], r["attempts"]) == (200, 2)
+    assert [files for _, files, _ in recv.received] == [[("a.bin", a.read_bytes()), ("b.txt", b"second file")]] * 2
+    leaked = {os.readlink(f"/proc/self/fd/{fd}") for fd in _open_fds() - before if os.path.exists(f"/proc/self/fd/{fd}")}
+    assert str(a) not in leaked and str(b) not in leaked
+
+
+def test_missing_file_is_reported(serve, make_rest, files, tmp_path):
+    a, _ = files
+    srv = serve({("POST", "/upload"): Receiver()})
+
+    r = _upload(make_rest(srv.url, APIS), a, tmp_path / "nope.bin")
+
+    assert "multipart file not found" in r["error"]
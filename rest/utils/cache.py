@@ -0,0 +1,120 @@
+# cache.py
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+# 결과 출처 (결과 dict 의 "cache" 값)
+CACHE_MISS = "miss"            # 실제 요청
+CACHE_HIT = "hit"              # TTL 캐시에서 반환
+CACHE_COALESCED = "coalesced"  # 진행 중인 동일 요청 결과 공유
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+
+class ResponseCache:
+    """
+    api 1개의 GET 응답 캐시 (apis.<name>.cache)
+
+      cache:
+        ttl: 30              # 초, 0 이면 저장 없이 동시 요청 합치기(coalescing)만
+        max_entries: 1000    # LRU 상한
+        vary_headers: [Authorization]   # key 에 포함할 요청 헤더 (생략 시 전체 헤더)
+
+    - 같은 key 의 요청이 진행 중이면 새로 보내지 않고 그 결과를 기다린다
+    - 에러 결과는 저장하지 않는다
+    """
+
+    def __init__(self, cfg: Optional[Dict[str, Any]] = None):
+        cfg = cfg or {}
+        self.ttl = float(cfg.get("ttl", 0))
+        self.max_entries = max(1, int(cfg.get("max_entries", 1000)))
+        vary = cfg.get("vary_headers")
+        self.vary_headers: Optional[Tuple[str, ...]] = tuple(h.lower() for h in vary) if vary is not None else None
+
+        self._data: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    def key(self, method: str, url: str, query: Optional[Dict[str, Any]], headers: Dict[str, Any]) -> tuple:
+        items: Iterable = (headers or {}).items()
+        if self.vary_headers is not None:
+            items = ((k, v) for k, v in items if k.lower() in self.vary_headers)
+        return (
+            method.upper(),
+            url,
+            tuple(sorted((str(k), str(v)) for k, v in (query or {}).items())),
+            tuple(sorted((k.lower(), str(v)) for k, v in items)),
+        )
+
+    async def fetch(
+        self, key: tuple, send: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        (결과, 출처) 반환. 결과 dict 는 공유되므로 호출 측에서 복사해서 사용
+        """
+        if self.ttl > 0:
+            cached = self._get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached, CACHE_HIT
+
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.coalesced += 1
+            # 대기 중인 쪽이 취소돼도 원래 요청은 계속 진행
+            return await asyncio.shield(fut), CACHE_COALESCED
+
+        self.misses += 1
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await send()
+        except asyncio.CancelledError:
+            self._inflight.pop(key, None)
+            fut.cancel()
+            raise
+        except Exception as e:
+            self._inflight.pop(key, None)
+            fut.set_exception(e)
+            # 기다리는 쪽이 없어도 "Future exception was never retrieved" 로그가 남지 않게 조회 처리
+            fut.exception()
+            raise
+
+        # 결과/캐시를 먼저 채운 뒤 inflight 에서 제거 → 사이에 들어온 요청도 중복 전송 없음
+        fut.set_result(result)
+        if self.ttl > 0 and not result.get("error"):
+            self._put(key, result)
+        self._inflight.pop(key, None)
+        return result, CACHE_MISS
+
+    def _get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return result
+
+    def _put(self, key: tuple, result: Dict[str, Any]) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, result)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.coalesced + self.misses
+        return {
+            "requests": total,
+            "hit": self.hits,
+            "coalesced": self.coalesced,
+            "miss": self.misses,
+            "hit_rate": round((self.hits + self.coalesced) / total, 4) if total else 0.0,
+            "entries": len(self._data),
+        }
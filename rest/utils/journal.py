@@ -0,0 +1,115 @@
+# journal.py
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+# job 상태
+JOB_PENDING = "pending"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq             INTEGER PRIMARY KEY,
+    spec            TEXT    NOT NULL,
+    status          TEXT    NOT NULL,
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    response_status INTEGER,
+    error           TEXT,
+    updated_at      TEXT
+);
+"""
+
+
+class JobJournal:
+    """
+    배치 job 진행 상황을 SQLite 파일에 기록한다 (프로세스가 중간에 죽어도 남음).
+
+    - register(specs) : 요청 spec 을 pending 으로 저장 (JSON 직렬화 가능한 dict 만)
+    - pending()       : done 이 아닌 job 만 (seq, spec) 순서대로 → --resume 재실행 대상
+    - mark(seq, r)    : 결과 1건 기록 (완료마다 commit)
+
+    spec 이 journal 에 있으므로 재개 시 job 목록을 다시 만들 필요가 없다.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        # WAL + NORMAL: 완료마다 commit 해도 fsync 비용이 작음
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def reset(self) -> None:
+        """
+        새 batch 시작 (이전 기록 삭제)
+        """
+        with self._db:
+            self._db.execute("DELETE FROM jobs")
+
+    def register(self, specs: Iterable[Dict[str, Any]]) -> int:
+        now = _now()
+        rows = ((seq, json.dumps(spec, ensure_ascii=False), JOB_PENDING, now) for seq, spec in enumerate(specs))
+        with self._db:
+            cur = self._db.executemany(
+                "INSERT INTO jobs (seq, spec, status, updated_at) VALUES (?, ?, ?, ?)", rows
+            )
+        return cur.rowcount
+
+    def pending(self, page_size: int = 500) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        # 실행 중 mark() 로 갱신되므로 커서를 열어두지 않고 seq 기준으로 나눠 조회
+        last = -1
+        while True:
+            rows = self._db.execute(
+                "SELECT seq, spec FROM jobs WHERE seq > ? AND status != ? ORDER BY seq LIMIT ?",
+                (last, JOB_DONE, page_size),
+            ).fetchall()
+            if not rows:
+                return
+            for seq, spec in rows:
+                yield seq, json.loads(spec)
+            last = rows[-1][0]
+
+    def mark(self, seq: int, result: Dict[str, Any]) -> None:
+        status = JOB_FAILED if result.get("error") else JOB_DONE
+        with self._db:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + ?, response_status = ?, error = ?, updated_at = ? "
+                "WHERE seq = ?",
+                (
+                    status,
+                    int(result.get("attempts", 1)),
+                    result.get("response_status"),
+                    result.get("error"),
+                    _now(),
+                    seq,
+                ),
+            )
+
+    def unfinished(self) -> int:
+        """
+        done 이 아닌 job 수 (0 이 아니면 이전 batch 가 중단되었거나 실패 job 이 남아 있음)
+        """
+        return self._db.execute("SELECT COUNT(*) FROM jobs WHERE status != ?", (JOB_DONE,)).fetchone()[0]
+
+    def counts(self) -> Dict[str, int]:
+        out = {JOB_PENDING: 0, JOB_DONE: 0, JOB_FAILED: 0}
+        for status, n in self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+            out[status] = n
+        return out
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
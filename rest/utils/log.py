@@ -0,0 +1,170 @@
+# log.py
+import sys
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# event 종류
+EV_REQUEST = "request"
+EV_RESPONSE = "response"
+EV_ERROR = "error"
+EV_RETRY = "retry"
+
+
+def _pretty(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+class TextFormatter(logging.Formatter):
+    """
+    기존 콘솔 출력 형식 (===== REQUEST [REQ-0001] ===== ...)
+    pretty JSON 변환은 여기(writer thread)에서만 수행 → event loop 에서는 포맷팅 비용 없음
+    """
+
+    def __init__(self, pretty_head: bool, pretty_req: bool, pretty_res: bool):
+        super().__init__()
+        self.pretty_head = pretty_head
+        self.pretty_req = pretty_req
+        self.pretty_res = pretty_res
+
+    def format(self, record: logging.LogRecord) -> str:
+        ev: Dict[str, Any] = record.msg
+        kind = ev["event"]
+        req_id = ev["req_id"]
+        lines = []
+
+        if kind == EV_REQUEST:
+            lines.append(f"\n===== REQUEST [{req_id}] =====")
+            lines.append(f"> {ev['api_name']}")
+            lines.append(f"{ev['method']} {ev['url']}")
+            if ev.get("headers"):
+                lines.append("Headers:")
+                lines.append(_pretty(ev["headers"]) if self.pretty_head else str(ev["headers"]))
+            lines.append("-----")
+            if "json" in ev:
+                lines.append(_pretty(ev["json"]) if self.pretty_req else str(ev["json"]))
+            elif "text" in ev:
+                lines.append(ev["text"])
+            elif "multipart" in ev:
+                lines.append("MULTIPART: files + data")
+                for param, filename in ev["multipart"]["files"]:
+                    lines.append(f"  File Param: {param}, Filename: {filename}")
+                for k, v in ev["multipart"]["data"].items():
+                    lines.append(f"  Data Param: {k}, Value: {v}")
+            lines.append("==============================")
+
+        elif kind == EV_RESPONSE:
+            body = ev["body"]
+            lines.append(f"\n===== RESPONSE [{req_id}] =====")
+            lines.append(f"> {ev['api_name']}")
+            lines.append(f"STATUS: {ev['status']}")
+            lines.append("-----")
+            if self.pretty_res:
+                try:
+                    body = _pretty(json.loads(body))
+                except Exception:
+                    pass
+            lines.append(str(body))
+            lines.append("==============================")
+
+        elif kind == EV_ERROR:
+            lines.append(f"\n===== ERROR [{req_id}] =====")
+            lines.append(ev["error"])
+            lines.append("============================")
+
+        elif kind == EV_RETRY:
+            lines.append(
+                f"\n===== RETRY [{req_id}] {ev['attempt']}/{ev['max_attempts']} "
+                f"in {ev['delay']:.2f}s ({ev['reason']}) ====="
+            )
+
+        return "\n".join(lines)
+
+
+class JsonlFormatter(logging.Formatter):
+    """
+    event 1건 = JSON 1줄 (req_id 로 요청/응답/재시도/에러 연결)
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(record.msg, ensure_ascii=False, default=str)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    # 기본 QueueHandler.prepare 는 호출 thread 에서 format 해버리므로 그대로 넘긴다
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class AsyncLogWriter:
+    """
+    요청/응답 로그를 queue 에 넣고 background thread 가 sink 로 기록한다.
+    event loop 에서는 dict 를 만들어 queue.put 만 한다 (print / json.dumps 없음).
+
+    sink (rest.base.log):
+      console: true                  # 기존 형식으로 stdout
+      file: ./logs/rest.jsonl        # 파일 (rotating)
+      file_format: jsonl             # jsonl / text
+      max_bytes: 10485760
+      backup_count: 5
+    """
+
+    def __init__(
+        self,
+        cfg: Optional[Dict[str, Any]] = None,
+        pretty_head: bool = False,
+        pretty_req: bool = False,
+        pretty_res: bool = False,
+    ):
+        cfg = cfg or {}
+        text_fmt = TextFormatter(pretty_head, pretty_req, pretty_res)
+        handlers = []
+
+        if cfg.get("console", True):
+            h = logging.StreamHandler(sys.stdout)
+            h.setFormatter(text_fmt)
+            handlers.append(h)
+
+        file_path = cfg.get("file")
+        if file_path:
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            h = logging.handlers.RotatingFileHandler(
+                file_path,
+                maxBytes=int(cfg.get("max_bytes", 10 * 1024 * 1024)),
+                backupCount=int(cfg.get("backup_count", 5)),
+                encoding="utf-8",
+            )
+            h.setFormatter(JsonlFormatter() if cfg.get("file_format", "jsonl") == "jsonl" else text_fmt)
+            handlers.append(h)
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._handler = _LazyQueueHandler(self._queue)
+        self._listener = logging.handlers.QueueListener(self._queue, *handlers, respect_handler_level=False)
+        self._running = False
+        self.start()
+        atexit.register(self.stop)
+
+    def start(self) -> None:
+        if not self._running:
+            self._listener.start()
+            self._running = True
+
+    def emit(self, event: str, req_id: str, **fields) -> None:
+        if not self._running:
+            self.start()   # close() 후 재사용되는 경우
+        ev = {"ts": datetime.now().isoformat(timespec="milliseconds"), "event": event, "req_id": req_id, **fields}
+        record = logging.LogRecord("rest", logging.INFO, "", 0, ev, None, None)
+        self._handler.handle(record)
+
+    def stop(self) -> None:
+        """
+        남은 로그를 모두 기록하고 writer thread 종료
+        """
+        if self._running:
+            self._running = False
+            self._listener.stop()
@@ -0,0 +1,162 @@
+# metrics.py
+import json
+import math
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+# 측정 구간
+PHASE_DNS = "dns"
+PHASE_CONNECT = "connect"    # TCP + TLS (aiohttp trace 는 TLS 를 따로 구분하지 않음)
+PHASE_TTFB = "ttfb"          # 요청 시작 ~ 응답 헤더 수신
+PHASE_TOTAL = "total"        # 요청 시작 ~ body 처리 완료
+
+PHASES = (PHASE_DNS, PHASE_CONNECT, PHASE_TTFB, PHASE_TOTAL)
+
+
+class LatencyHistogram:
+    """
+    HDR 스타일 로그 버킷 히스토그램 (상대 오차 ~ 2.5%)
+    값은 ms 로 기록, 버킷 수는 값의 범위(log)에만 비례 → 요청 수와 무관한 고정 메모리
+    """
+
+    _BASE = 1.05
+    _MIN_MS = 0.01
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _index(self, ms: float) -> int:
+        return int(math.log(max(ms, self._MIN_MS) / self._MIN_MS, self._BASE))
+
+    def _value(self, index: int) -> float:
+        # 버킷 중간값
+        return self._MIN_MS * (self._BASE ** (index + 0.5))
+
+    def record(self, ms: float) -> None:
+        i = self._index(ms)
+        self.buckets[i] = self.buckets.get(i, 0) + 1
+        self.count += 1
+        self.total += ms
+        self.min = min(self.min, ms)
+        self.max = max(self.max, ms)
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for i in sorted(self.buckets):
+            seen += self.buckets[i]
+            if seen >= target:
+                return min(max(self._value(i), self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "min": round(self.min, 2),
+            "avg": round(self.total / self.count, 2),
+            "p50": round(self.percentile(50), 2),
+            "p95": round(self.percentile(95), 2),
+            "p99": round(self.percentile(99), 2),
+            "max": round(self.max, 2),
+        }
+
+
+class RestMetrics:
+    """
+    (domain, api) 별 구간 히스토그램 + 요청/에러 건수
+    """
+
+    def __init__(self):
+        self._hist: Dict[Tuple[str, str], Dict[str, LatencyHistogram]] = {}
+        self._counts: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+    # --------------------------------------------------
+    # aiohttp trace hooks
+    # session.request(..., trace_request_ctx=timing dict) 로 요청별 timing 을 채운다
+    # --------------------------------------------------
+    def trace_config(self) -> aiohttp.TraceConfig:
+        tc = aiohttp.TraceConfig()
+
+        def mark(key: str):
+            async def _cb(session, ctx, params):
+                timing = ctx.trace_request_ctx
+                if isinstance(timing, dict):
+                    timing[key] = time.perf_counter()
+            return _cb
+
+        tc.on_request_start.append(mark("request_start"))
+        tc.on_dns_resolvehost_start.append(mark("dns_start"))
+        tc.on_dns_resolvehost_end.append(mark("dns_end"))
+        tc.on_connection_create_start.append(mark("connect_start"))
+        tc.on_connection_create_end.append(mark("connect_end"))
+        tc.on_request_end.append(mark("headers_received"))
+        return tc
+
+    def record(self, domain_name: str, api_name: str, timing: Dict[str, float], ok: bool) -> None:
+        key = (domain_name, api_name)
+        hist = self._hist.setdefault(key, {p: LatencyHistogram() for p in PHASES})
+        counts = self._counts.setdefault(key, {"requests": 0, "errors": 0})
+        counts["requests"] += 1
+        if not ok:
+            counts["errors"] += 1
+
+        def span(start: str, end: str) -> Optional[float]:
+            if start in timing and end in timing:
+                return (timing[end] - timing[start]) * 1000
+            return None
+
+        for phase, (a, b) in (
+            (PHASE_DNS, ("dns_start", "dns_end")),
+            (PHASE_CONNECT, ("connect_start", "connect_end")),
+            (PHASE_TTFB, ("request_start", "headers_received")),
+            (PHASE_TOTAL, ("start", "end")),
+        ):
+            ms = span(a, b)
+            if ms is not None:
+                hist[phase].record(ms)
+
+    # --------------------------------------------------
+    # 출력
+    # --------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for (domain_name, api_name), hist in sorted(self._hist.items()):
+            out.setdefault(domain_name, {})[api_name] = {
+                **self._counts[(domain_name, api_name)],
+                "latency_ms": {p: hist[p].summary() for p in PHASES},
+            }
+        return out
+
+    def export_json(self, path: str) -> Path:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        return p
+
+    def print_table(self) -> None:
+        print("\n===== METRICS (ms) =====")
+        print(f"{'domain/api':<32} {'phase':<8} {'count':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+        for (domain_name, api_name), hist in sorted(self._hist.items()):
+            counts = self._counts[(domain_name, api_name)]
+            name = f"{domain_name}/{api_name}"
+            print(f"{name:<32} requests={counts['requests']} errors={counts['errors']}")
+            for phase in PHASES:
+                s = hist[phase].summary()
+                if not s["count"]:
+                    continue
+                print(
+                    f"{'':<32} {phase:<8} {s['count']:>6} {s['p50']:>9.2f} "
+                    f"{s['p95']:>9.2f} {s['p99']:>9.2f} {s['max']:>9.2f}"
+                )
+        print("========================")
@@ -3,14 +3,32 @@ import aiohttp
 import asyncio
 import json
 import os
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Iterable, AsyncIterable, AsyncIterator, Union
 from aiohttp import FormData
 
+from .template import Template
+from .retry import RetryPolicy, TokenBucket
+from .stream import read_stream, MODE_BUFFER, MODE_SPOOL, STREAM_MODES, FileStream, UploadProgress
+from .log import AsyncLogWriter, EV_REQUEST, EV_RESPONSE, EV_ERROR, EV_RETRY
+from .metrics import RestMetrics
+from .cache import ResponseCache, CACHEABLE_METHODS
+
 
 class AsyncRestUtil:
     DEFAULT_TIMEOUT = 10
 
+    # TCPConnector 기본값 (rest.base 에서 덮어씀)
+    DEFAULT_CONN_LIMIT = 100
+    DEFAULT_CONN_LIMIT_PER_HOST = 0      # 0 = 호스트별 제한 없음
+    DEFAULT_KEEPALIVE_TIMEOUT = 30
+    DEFAULT_DNS_CACHE_TTL = 300
+
+    # 배치 동시 실행 기본값
+    DEFAULT_BATCH_CONCURRENCY = 10
+
     def __init__(self, config_path: str):
         with open(config_path, "r", encoding="utf-8") as f:
             self.config = yaml.safe_load(f)
@@ -23,8 +41,126 @@ class AsyncRestUtil:
         self.log_pretty_head = base.get("log_pretty_head", False)
         self.is_log = base.get("is_log", True)
 
+        # 로그는 background writer 로 (event loop 에서 print / pretty 포맷팅 안 함)
+        self._logger: Optional[AsyncLogWriter] = None
+        if self.is_log:
+            self._logger = AsyncLogWriter(
+                base.get("log"),
+                pretty_head=self.log_pretty_head,
+                pretty_req=self.log_pretty_req,
+                pretty_res=self.log_pretty_res,
+            )
+
+        self.conn_limit = base.get("conn_limit", self.DEFAULT_CONN_LIMIT)
+        self.conn_limit_per_host = base.get("conn_limit_per_host", self.DEFAULT_CONN_LIMIT_PER_HOST)
+        self.keepalive_timeout = base.get("keepalive_timeout", self.DEFAULT_KEEPALIVE_TIMEOUT)
+        self.dns_cache_ttl = base.get("dns_cache_ttl", self.DEFAULT_DNS_CACHE_TTL)
+
+        # 전체 동시 요청 수 (도메인별 제한은 domains.<name>.concurrency)
+        self.batch_concurrency = base.get("batch_concurrency", self.DEFAULT_BATCH_CONCURRENCY)
+
+        # 스트리밍 응답 (apis.<name>.response.mode: spool / callback / json_items)
+        self.spool_dir = base.get("spool_dir", "./spool")
+        self.stream_chunk_size = int(base.get("stream_chunk_size", 64 * 1024))
+        self.upload_chunk_size = int(base.get("upload_chunk_size", 256 * 1024))
+
+        # 구간별 지연(DNS/connect/TTFB/total) 측정 (rest.base.metrics)
+        metrics_cfg = base.get("metrics") or {}
+        self.metrics: Optional[RestMetrics] = RestMetrics() if metrics_cfg.get("enabled", False) else None
+        self.metrics_export = metrics_cfg.get("export", "")
+
         self.domains = self.config["rest"]["domains"]
         self._req_seq = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+        # 세마포어는 세션과 함께 만들고 close() 에서 버린다 (만든 event loop 에 묶이므로)
+        self._global_sem: Optional[asyncio.Semaphore] = None
+        self._domain_sems: Dict[str, asyncio.Semaphore] = {}
+
+        # (domain_name, api_name) → 컴파일된 path/headers/body 템플릿
+        self._api_templates: Dict[tuple, Dict[str, Any]] = {}
+        self._body_templates: Dict[tuple, Dict[str, Any]] = {}
+
+        # 재시도 정책 (api > domain > base 순으로 retry 블록 적용) / 도메인별 rate limiter
+        self._base_retry = base.get("retry") or {}
+        self._retry_policies: Dict[tuple, RetryPolicy] = {}
+        self._rate_limiters: Dict[str, Optional[TokenBucket]] = {}
+
+        # GET 응답 캐시 / 동시 요청 합치기 (apis.<name>.cache)
+        self._caches: Dict[tuple, Optional[ResponseCache]] = {}
+
+    # ==================================================
+    # SESSION
+    # ==================================================
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        keep-alive 커넥션 풀을 가진 세션을 한 번만 만들어 재사용한다.
+        (call_all 호출마다 TCP/TLS 핸드셰이크, DNS 조회 반복 방지)
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.conn_limit,
+                limit_per_host=self.conn_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            trace_configs = [self.metrics.trace_config()] if self.metrics is not None else None
+            self._session = aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+            self._global_sem = asyncio.Semaphore(max(1, self.batch_concurrency))
+            self._domain_sems = {
+                name: asyncio.Semaphore(max(1, int(d["concurrency"])))
+                for name, d in self.domains.items()
+                if (d or {}).get("concurrency")
+            }
+        return self._session
+
+    def report_metrics(self) -> None:
+        """
+        실행 종료 시 API 별 캐시 적중률 / 지연 통계 표 출력 + (설정 시) JSON 저장
+        """
+        for (domain_name, api_name), cache in sorted(self._caches.items()):
+            if cache is not None:
+                print(f"[CACHE] {domain_name}/{api_name} {cache.stats()}")
+
+        if self.metrics is None:
+            return
+        self.metrics.print_table()
+        if self.metrics_export:
+            print(f"[METRICS] {self.metrics.export_json(self.metrics_export).resolve()}")
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        # 다음 세션(다른 event loop 일 수 있음)에서 새로 만들도록 loop 에 묶인 객체를 버린다
+        self._global_sem = None
+        self._domain_sems = {}
+        self._rate_limiters = {}
+        if self._logger is not None:
+            self._logger.stop()
+
+    @asynccontextmanager
+    async def _slot(self, domain_name: str, global_sem: Optional[asyncio.Semaphore] = None):
+        """
+        동시 실행 슬롯 (전체 + 도메인별 세마포어, _get_session() 에서 생성).
+        실제 HTTP 요청 구간에서만 점유한다.
+        """
+        if global_sem is None:
+            global_sem = self._global_sem
+        domain_sem = self._domain_sems.get(domain_name)
+
+        async with global_sem:
+            if domain_sem is None:
+                yield
+            else:
+                async with domain_sem:
+                    yield
 
     # ==================================================
     # PUBLIC
@@ -37,12 +173,84 @@ class AsyncRestUtil:
         if not domain_type or not isinstance(domain_type, str):
             raise TypeError("call_all expects domain_type: str as first argument")
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._call_one(session, domain_type, info)
-                for info in requests_info
-            ]
-            return await asyncio.gather(*tasks, return_exceptions=False)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests_info)
+        async for r in self.call_batch(domain_type, requests_info):
+            results[r["index"]] = r
+        return results
+
+    async def call_batch(
+        self,
+        domain_type: str,
+        requests_info: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        요청 목록(iterable / async iterator)을 제한된 동시성으로 실행하고
+        완료되는 순서대로 결과를 yield 한다. 결과에는 원래 순번("index")이 붙는다.
+
+          async for r in rest.call_batch("local", requests):
+              ...
+
+        - 동시 요청 수: concurrency 인자 > rest.base.batch_concurrency
+        - 도메인별 동시 요청 수: rest.domains.<name>.concurrency
+        - 입력은 필요한 만큼만 읽는다 (전체 job 목록을 task 로 한 번에 만들지 않음)
+        """
+        if not domain_type or not isinstance(domain_type, str):
+            raise TypeError("call_batch expects domain_type: str as first argument")
+
+        # concurrency 를 지정하면 이 배치 전용 세마포어 사용
+        global_sem = asyncio.Semaphore(max(1, concurrency)) if concurrency else None
+        limit = concurrency or self.batch_concurrency
+
+        session = await self._get_session()
+        window = max(1, limit) * 2
+
+        source = self._aiter(requests_info)
+        pending = set()
+        index = 0
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    try:
+                        info = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.ensure_future(self._call_indexed(session, domain_type, index, info, global_sem)))
+                    index += 1
+
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _call_indexed(
+        self,
+        session: aiohttp.ClientSession,
+        domain_type: str,
+        index: int,
+        info: Dict[str, Any],
+        global_sem: Optional[asyncio.Semaphore] = None,
+    ):
+        result = await self._call_one(session, domain_type, info, global_sem)
+        result["index"] = index
+        return result
+
+    @staticmethod
+    async def _aiter(items):
+        if hasattr(items, "__aiter__"):
+            async for it in items:
+                yield it
+        else:
+            for it in items:
+                yield it
 
     # ==================================================
     # INTERNAL
@@ -52,9 +260,9 @@ class AsyncRestUtil:
         session: aiohttp.ClientSession,
         domain_type: str,
         info: Dict[str, Any],
+        global_sem: Optional[asyncio.Semaphore] = None,
+        use_cache: bool = True,
     ):
-        self._req_seq += 1
-        req_id = f"REQ-{self._req_seq:04d}"
         api_name = info["api_name"]
 
         domain = self.domains[info["domain_name"]]
@@ -76,13 +284,27 @@ class AsyncRestUtil:
 
         base_domain = domain[domain_key]
 
-        url = base_domain + self._replace(
-            api["path"], info.get("path_params")
-        )
+        tpl = self._api_template(info["domain_name"], api_name)
 
-        headers = self._replace_obj(
-            api.get("headers", {}), info.get("header_params") or {}
-        )
+        url = base_domain + tpl["path"].render(info.get("path_params"))
+
+        headers = tpl["headers"].render(info.get("header_params") or {})
+
+        # 동일 GET 은 진행 중인 요청 / 캐시된 결과를 공유 (결과는 요청마다 복사)
+        cache = self._response_cache(info["domain_name"], api_name) if use_cache else None
+        if cache is not None:
+            key = cache.key(api["method"], url, info.get("query_params"), headers)
+            shared, source = await cache.fetch(
+                key, lambda: self._call_one(session, domain_type, info, global_sem, use_cache=False)
+            )
+            result = dict(shared, cache=source)
+            if source != "miss":
+                self._req_seq += 1
+                result["req_id"] = f"REQ-{self._req_seq:04d}"
+            return result
+
+        self._req_seq += 1
+        req_id = f"REQ-{self._req_seq:04d}"
 
         body_def = api.get("body", {"type": "none"})
         body_type = body_def.get("type", "none")
@@ -92,91 +314,254 @@ class AsyncRestUtil:
         data = None
         result_value = None
 
-        try:
-            if body_type == "json":
-                json_data = self._handle_json(body_def, body_params)
-                result_value = json_data
-            elif body_type == "text":
-                data = self._handle_text(body_def, body_params)
-                result_value = data
-            elif body_type == "multipart":
-                data = self._build_multipart(body_def, body_params)
-                result_value = body_params
-
-            self._log_request(
-                req_id,
-                api_name,
-                api["method"],
-                url,
-                headers,
-                json_data,
-                data,
-                body_def,
-                body_params,
-            )
+        resp_cfg = api.get("response") or {}
+        resp_mode = resp_cfg.get("mode", MODE_BUFFER)
+
+        policy = self._retry_policy(info["domain_name"], api_name)
+        limiter = self._rate_limiter(info["domain_name"])
+        attempt = 0
+
+        while True:
+            attempt += 1
+            retry_after = None
+            progress = None
+            upload_streams: List[FileStream] = []
+            timing: Dict[str, float] = {}
+            ok = False
 
-            async with session.request(
-                method=api["method"],
-                url=url,
-                headers=headers if body_type != "multipart" else None,
-                params=info.get("query_params"),
-                json=json_data,
-                data=data,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-            ) as resp:
-                text = await resp.text()
-                self._log_response(req_id, api_name, resp.status, text)
-
-                resp.raise_for_status()
-
-                return {
-                    "req_id": req_id,
-                    "api_name": api_name,
-                    "method": api["method"],
-                    "url": url,
-                    "headers": headers,
-                    "bind_params": body_params,
-                    "response_status": resp.status,
-                    "response_body": text,
-                    "params": result_value,
-                }
-
-        except Exception as e:
-            if self.is_log:
-                print(f"\n===== ERROR [{req_id}] =====")
-                print(str(e))
-                print("============================")
-            return {
-                "req_id": req_id,
-                "api_name": api_name,
-                "error": str(e),
+            try:
+                if body_type != "none":
+                    body_tpl = self._body_template(info["domain_name"], api_name, body_def)
+
+                if body_type == "json":
+                    json_data = self._handle_json(body_tpl, body_params)
+                    result_value = json_data
+                elif body_type == "text":
+                    data = self._handle_text(body_tpl, body_params)
+                    result_value = data
+                elif body_type == "multipart":
+                    # FormData 는 전송 시 소비되므로 시도마다 새로 생성
+                    progress = UploadProgress(
+                        {"req_id": req_id, "api_name": api_name}, info.get("on_progress")
+                    )
+                    data = self._build_multipart(body_tpl, body_params, progress, upload_streams)
+                    result_value = body_params
+
+                self._log_request(
+                    req_id,
+                    api_name,
+                    api["method"],
+                    url,
+                    headers,
+                    json_data,
+                    data,
+                    body_def,
+                    body_params,
+                )
+
+                if limiter is not None:
+                    await limiter.acquire()
+
+                # 슬롯은 실제 요청 동안만 점유 (재시도 대기 중에는 반납)
+                async with self._slot(info["domain_name"], global_sem):
+                    timing["start"] = time.perf_counter()
+                    async with session.request(
+                        method=api["method"],
+                        url=url,
+                        headers=headers if body_type != "multipart" else None,
+                        params=info.get("query_params"),
+                        json=json_data,
+                        data=data,
+                        timeout=aiohttp.ClientTimeout(total=timeout),
+                        trace_request_ctx=timing,
+                    ) as resp:
+                        # 정상 응답 + 스트리밍 모드면 body 를 메모리에 모으지 않음
+                        if resp_mode in STREAM_MODES and resp.status < 400:
+                            body = await read_stream(
+                                resp,
+                                resp_mode,
+                                {"req_id": req_id, "api_name": api_name},
+                                resp_cfg.get("spool_dir", self.spool_dir),
+                                int(resp_cfg.get("chunk_size", self.stream_chunk_size)),
+                                on_chunk=info.get("on_chunk"),
+                                on_item=info.get("on_item"),
+                            )
+                            self._log_response(req_id, api_name, resp.status, self._stream_summary(body))
+                        else:
+                            text = await resp.text()
+                            body = {"response_body": text}
+                            self._log_response(req_id, api_name, resp.status, text)
+
+                        if policy.retry_on_status(resp.status) and policy.can_retry(attempt):
+                            retry_after = resp.headers.get("Retry-After")
+                            reason = f"HTTP {resp.status}"
+                            # 재시도할 응답을 spool 했으면 그 파일은 결과로 쓰이지 않으므로 삭제
+                            if body.get("response_file"):
+                                Path(body["response_file"]).unlink(missing_ok=True)
+                        else:
+                            resp.raise_for_status()
+                            ok = True
+
+                            return {
+                                "req_id": req_id,
+                                "api_name": api_name,
+                                "method": api["method"],
+                                "url": url,
+                                "headers": headers,
+                                "bind_params": body_params,
+                                "response_status": resp.status,
+                                **body,
+                                "params": result_value,
+                                "attempts": attempt,
+                                **self._upload_summary(progress),
+                            }
+
+            except Exception as e:
+                if not (policy.retry_on_exception(e) and policy.can_retry(attempt)):
+                    if self._logger is not None:
+                        self._logger.emit(EV_ERROR, req_id, api_name=api_name, error=str(e))
+                    return {
+                        "req_id": req_id,
+                        "api_name": api_name,
+                        "error": str(e),
+                        "attempts": attempt,
+                    }
+                reason = f"{type(e).__name__}: {e}"
+
+            finally:
+                # 업로드 파일 핸들은 성공/실패와 무관하게 요청마다 닫는다
+                for stream in upload_streams:
+                    stream.close_file()
+
+                if self.metrics is not None and "start" in timing:
+                    timing["end"] = time.perf_counter()
+                    self.metrics.record(info["domain_name"], api_name, timing, ok)
+
+            delay = policy.delay(attempt, retry_after)
+            if self._logger is not None:
+                self._logger.emit(
+                    EV_RETRY, req_id, api_name=api_name,
+                    attempt=attempt, max_attempts=policy.max_attempts, delay=delay, reason=reason,
+                )
+            await asyncio.sleep(delay)
+
+    def _upload_summary(self, progress: Optional[UploadProgress]) -> Dict[str, Any]:
+        if progress is None:
+            return {}
+        return {"upload_bytes": progress.sent, "upload_total": progress.total}
+
+    # ==================================================
+    # RETRY / RATE LIMIT
+    # ==================================================
+    def _retry_policy(self, domain_name: str, api_name: str) -> RetryPolicy:
+        key = (domain_name, api_name)
+        policy = self._retry_policies.get(key)
+        if policy is None:
+            domain = self.domains[domain_name]
+            api = domain["apis"][api_name]
+            cfg = {**self._base_retry, **(domain.get("retry") or {}), **(api.get("retry") or {})}
+            policy = RetryPolicy(cfg)
+            self._retry_policies[key] = policy
+        return policy
+
+    def _rate_limiter(self, domain_name: str) -> Optional[TokenBucket]:
+        if domain_name not in self._rate_limiters:
+            rl = self.domains[domain_name].get("rate_limit") or {}
+            rps = rl.get("rps")
+            self._rate_limiters[domain_name] = TokenBucket(rps, rl.get("burst")) if rps else None
+        return self._rate_limiters[domain_name]
+
+    def _response_cache(self, domain_name: str, api_name: str) -> Optional[ResponseCache]:
+        key = (domain_name, api_name)
+        if key not in self._caches:
+            api = self.domains[domain_name]["apis"][api_name]
+            cfg = api.get("cache")
+            cache = None
+            if cfg:
+                if api["method"].upper() not in CACHEABLE_METHODS:
+                    raise ValueError(f"[CONFIG ERROR] cache is only for GET/HEAD apis: {domain_name}.{api_name}")
+                # callback / json_items 는 요청마다 콜백이 달라 결과를 공유할 수 없음
+                if (api.get("response") or {}).get("mode", MODE_BUFFER) not in (MODE_BUFFER, MODE_SPOOL):
+                    raise ValueError(f"[CONFIG ERROR] cache requires response mode buffer/spool: {domain_name}.{api_name}")
+                cache = ResponseCache(cfg)
+            self._caches[key] = cache
+        return self._caches[key]
+
+    # ==================================================
+    # TEMPLATE
+    # ==================================================
+    def _api_template(self, domain_name: str, api_name: str) -> Dict[str, Template]:
+        """
+        path / headers 템플릿을 api 별로 한 번만 컴파일한다.
+        """
+        key = (domain_name, api_name)
+        tpl = self._api_templates.get(key)
+        if tpl is None:
+            api = self.domains[domain_name]["apis"][api_name]
+            tpl = {
+                "path": Template(api["path"]),
+                "headers": Template(api.get("headers", {})),
             }
+            self._api_templates[key] = tpl
+        return tpl
+
+    def _body_template(self, domain_name: str, api_name: str, cfg: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        body 템플릿을 api 별로 한 번만 준비한다.
+        file_path 는 최초 1회만 읽고 파싱 (요청 루프에서 파일 I/O 없음).
+        """
+        key = (domain_name, api_name)
+        tpl = self._body_templates.get(key)
+        if tpl is not None:
+            return tpl
+
+        body_type = cfg.get("type", "none")
+        tpl = {"type": body_type, "whole_key": None}
+
+        if body_type == "json":
+            if "file_path" in cfg:
+                tpl["value"] = Template(json.loads(self._read_file(cfg["file_path"])))
+            else:
+                value = cfg.get("value")
+                # value 가 "{key}" 하나면 파라미터 값을 (타입 그대로) 사용
+                if isinstance(value, str) and value.startswith("{") and value.endswith("}"):
+                    tpl["whole_key"] = value[1:-1]
+                tpl["value"] = Template(value)
+        elif body_type == "text":
+            if "file_path" in cfg:
+                # 기존 동작 유지: 파일 텍스트는 치환하지 않음
+                tpl["text"] = self._read_file(cfg["file_path"])
+            else:
+                tpl["value"] = Template(cfg.get("value", ""))
+        elif body_type == "multipart":
+            tpl["files"] = [(f["param"], f["path"].strip("{}")) for f in cfg.get("files", [])]
+            tpl["data"] = Template(cfg.get("data", {}))
+
+        self._body_templates[key] = tpl
+        return tpl
 
     # ==================================================
     # BODY HANDLER
     # ==================================================
-    def _handle_json(self, cfg, params):
-        if "file_path" in cfg:
-            raw = self._read_file(cfg["file_path"])
-            data = json.loads(raw)
-            return self._replace_obj(data, params)
-
-        value = cfg.get("value")
-        if isinstance(value, str) and value.startswith("{") and value.endswith("}"):
-            key = value[1:-1]
-            return params.get(key, value)
-        return self._replace_obj(value, params)
-
-    def _handle_text(self, cfg, params):
-        if "file_path" in cfg:
-            return self._read_file(cfg["file_path"])
-        return self._replace(cfg.get("value", ""), params)
-
-    def _build_multipart(self, cfg, params):
+    def _handle_json(self, tpl, params):
+        whole_key = tpl["whole_key"]
+        if whole_key is not None:
+            return params.get(whole_key, tpl["value"].source)
+        return tpl["value"].render(params)
+
+    def _handle_text(self, tpl, params):
+        if "text" in tpl:
+            return tpl["text"]
+        return tpl["value"].render(params)
+
+    def _build_multipart(self, tpl, params, progress: UploadProgress, streams: List[FileStream]):
+        """
+        파일은 FileStream(크기를 아는 async payload)으로 넣는다 → 전송 중에만 열리고 끝나면 닫힘.
+        생성한 stream 은 streams 에 추가 (호출 측에서 요청 종료 후 close)
+        """
         form = FormData()
 
-        for f in cfg.get("files", []):
-            key = f["path"].strip("{}")
+        for param_name, key in tpl["files"]:
             raw_path = str(params[key]).strip()
 
             raw_path = os.path.expandvars(os.path.expanduser(raw_path))
@@ -190,14 +575,17 @@ class AsyncRestUtil:
             if not path.exists() or not path.is_file():
                 raise FileNotFoundError(f"multipart file not found: {path}")
 
+            stream = FileStream(path, self.upload_chunk_size, progress)
+            streams.append(stream)
+
             form.add_field(
-                name=f["param"],
-                value=path.open("rb"),
+                name=param_name,
+                value=stream,
                 filename=path.name,
                 content_type="application/octet-stream",
             )
 
-        data_fields = self._replace_obj(cfg.get("data", {}), params)
+        data_fields = tpl["data"].render(params)
         for k, v in data_fields.items():
             form.add_field(k, str(v))
 
@@ -231,9 +619,6 @@ class AsyncRestUtil:
     # ==================================================
     # LOG
     # ==================================================
-    def _pretty(self, obj):
-        return json.dumps(obj, ensure_ascii=False, indent=2)
-
     def _log_request(
         self,
         req_id,
@@ -246,40 +631,32 @@ class AsyncRestUtil:
         body_def=None,
         body_params=None,
     ):
-        if not self.is_log:
+        if self._logger is None:
             return
-        print(f"\n===== REQUEST [{req_id}] =====")
-        print(f"> {api_name}")
-        print(f"{method} {url}")
-        if headers:
-            print("Headers:")
-            print(self._pretty(headers) if self.log_pretty_head else headers)
-        print("-----")
+        fields = {"api_name": api_name, "method": method, "url": url, "headers": headers}
         if json_data is not None:
-            print(self._pretty(json_data) if self.log_pretty_req else json_data)
+            fields["json"] = json_data
         elif isinstance(data, str):
-            print(data)
+            fields["text"] = data
         elif isinstance(data, FormData) and body_def and body_params:
-            print("MULTIPART: files + data")
-            for f in body_def.get("files", []):
-                key = f["path"].strip("{}")
-                print(f"  File Param: {f['param']}, Filename: {Path(body_params[key]).name}")
-            for k, v in self._replace_obj(body_def.get("data", {}), body_params).items():
-                print(f"  Data Param: {k}, Value: {v}")
-        print("==============================")
+            fields["multipart"] = {
+                "files": [
+                    (f["param"], Path(body_params[f["path"].strip("{}")]).name)
+                    for f in body_def.get("files", [])
+                ],
+                "data": self._replace_obj(body_def.get("data", {}), body_params),
+            }
+        self._logger.emit(EV_REQUEST, req_id, **fields)
+
+    def _stream_summary(self, body: Dict[str, Any]) -> str:
+        parts = [f"[STREAM:{body['response_mode']}] size={body['response_size']}"]
+        if "response_file" in body:
+            parts.append(f"file={body['response_file']}")
+        if "response_items" in body:
+            parts.append(f"items={body['response_items']}")
+        return " ".join(parts)
 
     def _log_response(self, req_id, api_name, status, body):
-        if not self.is_log:
+        if self._logger is None:
             return
-        print(f"\n===== RESPONSE [{req_id}] =====")
-        print(f"> {api_name}")
-        print("STATUS:", status)
-        print("-----")
-        if self.log_pretty_res:
-            try:
-                print(self._pretty(json.loads(body)))
-            except Exception:
-                print(body)
-        else:
-            print(body)
-        print("==============================")
+        self._logger.emit(EV_RESPONSE, req_id, api_name=api_name, status=status, body=body)
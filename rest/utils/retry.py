@@ -0,0 +1,119 @@
+# retry.py
+import time
+import random
+import asyncio
+import builtins
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+
+class RetryPolicy:
+    """
+    재시도 정책 (config 의 retry 블록)
+
+      retry:
+        max_attempts: 3                  # 최초 호출 포함 총 시도 횟수
+        statuses: [429, 502, 503, 504]   # 재시도할 HTTP 상태
+        exceptions: [ClientConnectionError, TimeoutError]
+        backoff_base: 0.5                # 지수 백오프 시작값(초)
+        backoff_max: 30                  # 백오프 상한(초)
+        jitter: true
+        respect_retry_after: true        # Retry-After 헤더 우선
+        retry_after_max: 120             # Retry-After 상한(초)
+    """
+
+    DEFAULT_STATUSES = (429, 502, 503, 504)
+    DEFAULT_EXCEPTIONS = ("ClientConnectionError", "ServerDisconnectedError", "TimeoutError")
+
+    def __init__(self, cfg: Optional[Dict[str, Any]] = None):
+        cfg = cfg or {}
+        self.max_attempts = max(1, int(cfg.get("max_attempts", 1)))
+        self.statuses = frozenset(int(s) for s in cfg.get("statuses", self.DEFAULT_STATUSES))
+        self.exceptions = self._resolve_exceptions(cfg.get("exceptions", self.DEFAULT_EXCEPTIONS))
+        self.backoff_base = float(cfg.get("backoff_base", 0.5))
+        self.backoff_max = float(cfg.get("backoff_max", 30))
+        self.jitter = bool(cfg.get("jitter", True))
+        self.respect_retry_after = bool(cfg.get("respect_retry_after", True))
+        self.retry_after_max = float(cfg.get("retry_after_max", 120))
+
+    @staticmethod
+    def _resolve_exceptions(names) -> Tuple[type, ...]:
+        out = []
+        for name in names or []:
+            exc = getattr(aiohttp, name, None) or getattr(asyncio, name, None) or getattr(builtins, name, None)
+            if not (isinstance(exc, type) and issubclass(exc, BaseException)):
+                raise ValueError(f"[CONFIG ERROR] unknown retry exception: {name}")
+            out.append(exc)
+        return tuple(out)
+
+    def can_retry(self, attempt: int) -> bool:
+        return attempt < self.max_attempts
+
+    def retry_on_status(self, status: int) -> bool:
+        return status in self.statuses
+
+    def retry_on_exception(self, e: BaseException) -> bool:
+        return bool(self.exceptions) and isinstance(e, self.exceptions)
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        attempt 번째 실패 후 대기 시간(초)
+        """
+        if self.respect_retry_after and retry_after:
+            sec = parse_retry_after(retry_after)
+            if sec is not None:
+                return min(sec, self.retry_after_max)
+
+        d = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            d = d / 2 + random.uniform(0, d / 2)
+        return d
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Retry-After: 초(정수) 또는 HTTP-date
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return max(0.0, (dt - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    초당 요청 수 제한 (token bucket)
+
+      rate_limit:
+        rps: 20      # 초당 토큰 보충 수
+        burst: 20    # 최대 누적 토큰 (순간 허용량)
+    """
+
+    def __init__(self, rps: float, burst: Optional[float] = None):
+        self.rate = float(rps)
+        self.capacity = float(burst if burst else max(1.0, self.rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
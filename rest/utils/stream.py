@@ -0,0 +1,214 @@
+# stream.py
+import json
+import codecs
+import asyncio
+import inspect
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+
+# 응답 처리 방식 (apis.<name>.response.mode)
+MODE_BUFFER = "buffer"          # 기존 방식: resp.text() 전체를 결과에 보관
+MODE_SPOOL = "spool"            # 파일로 저장, 결과에는 경로/크기만
+MODE_CALLBACK = "callback"      # chunk 를 on_chunk(chunk, meta) 로 전달
+MODE_JSON_ITEMS = "json_items"  # 최상위 JSON 배열 원소를 on_item(item, meta) 로 하나씩 전달
+
+STREAM_MODES = (MODE_SPOOL, MODE_CALLBACK, MODE_JSON_ITEMS)
+
+
+async def _maybe_await(v):
+    if inspect.isawaitable(v):
+        await v
+
+
+class JsonArrayStream:
+    """
+    최상위 JSON 배열을 chunk 단위로 받아 완성된 원소만 꺼내는 증분 파서.
+    원소 1개 크기만큼만 버퍼에 유지한다.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._buf = ""
+        self._pos = 0
+        self._started = False
+        self._closed = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> list:
+        self._buf = self._buf[self._pos:] + self._text.decode(chunk, final=final)
+        self._pos = 0
+        items = []
+
+        while not self._closed:
+            self._skip_ws()
+            if self._pos >= len(self._buf):
+                break
+
+            ch = self._buf[self._pos]
+            if not self._started:
+                if ch != "[":
+                    raise ValueError("json_items mode expects a top-level JSON array")
+                self._started = True
+                self._pos += 1
+                continue
+            if ch == ",":
+                self._pos += 1
+                continue
+            if ch == "]":
+                self._closed = True
+                self._pos += 1
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                break   # 원소가 아직 다 오지 않음
+
+            # 숫자 등은 버퍼 끝에서 잘렸을 수 있으므로("1." / "12") 뒤에 구분자(, ])가 올 때까지 대기
+            nxt = end
+            while nxt < len(self._buf) and self._buf[nxt] in " \t\r\n":
+                nxt += 1
+            if not final and (nxt >= len(self._buf) or self._buf[nxt] not in ",]"):
+                break
+
+            items.append(item)
+            self._pos = end
+
+        if final and not self._closed:
+            raise ValueError("unexpected end of JSON array")
+        return items
+
+    def _skip_ws(self):
+        while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+            self._pos += 1
+
+
+async def read_stream(
+    resp: aiohttp.ClientResponse,
+    mode: str,
+    meta: Dict[str, Any],
+    spool_dir: str,
+    chunk_size: int,
+    on_chunk: Optional[Callable] = None,
+    on_item: Optional[Callable] = None,
+) -> Dict[str, Any]:
+    """
+    응답 body 를 메모리에 모으지 않고 처리한다. 결과 dict 에 넣을 요약 정보 반환.
+    on_chunk / on_item 은 sync / async 모두 가능.
+    """
+    size = 0
+    out: Dict[str, Any] = {"response_body": None, "response_mode": mode}
+
+    if mode == MODE_SPOOL:
+        d = Path(spool_dir)
+        d.mkdir(parents=True, exist_ok=True)
+        path = d / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{meta['req_id']}_{meta['api_name']}.body"
+        # 받는 동안은 .part 에 쓰고, 응답을 끝까지 받았을 때만 최종 이름으로 바꾼다
+        # (오류/재시도/취소 시 반쪽짜리 파일은 삭제)
+        part = path.with_name(path.name + ".part")
+        try:
+            with open(part, "wb") as f:
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    f.write(chunk)
+                    size += len(chunk)
+            part.replace(path)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+        out["response_file"] = str(path.resolve())
+
+    elif mode == MODE_CALLBACK:
+        if on_chunk is None:
+            raise ValueError("response mode 'callback' requires on_chunk in request info")
+        async for chunk in resp.content.iter_chunked(chunk_size):
+            size += len(chunk)
+            await _maybe_await(on_chunk(chunk, meta))
+
+    elif mode == MODE_JSON_ITEMS:
+        if on_item is None:
+            raise ValueError("response mode 'json_items' requires on_item in request info")
+        parser = JsonArrayStream(resp.charset or "utf-8")
+        count = 0
+        async for chunk in resp.content.iter_chunked(chunk_size):
+            size += len(chunk)
+            for item in parser.feed(chunk):
+                count += 1
+                await _maybe_await(on_item(item, meta))
+        for item in parser.feed(b"", final=True):
+            count += 1
+            await _maybe_await(on_item(item, meta))
+        out["response_items"] = count
+
+    else:
+        raise ValueError(f"unknown response mode: {mode}")
+
+    out["response_size"] = size
+    return out
+
+
+# ==================================================
+# 업로드 (multipart 파일 스트리밍)
+# ==================================================
+class UploadProgress:
+    """
+    요청 1건의 업로드 진행 상황 (multipart 파일 전체 합계)
+    on_progress(sent, total, meta) 가 있으면 chunk 마다 호출
+    """
+
+    def __init__(self, meta: Dict[str, Any], on_progress: Optional[Callable] = None):
+        self.meta = meta
+        self.on_progress = on_progress
+        self.sent = 0
+        self.total = 0
+
+    async def add(self, n: int) -> None:
+        self.sent += n
+        if self.on_progress is not None:
+            await _maybe_await(self.on_progress(self.sent, self.total, self.meta))
+
+
+class FileStream(aiohttp.payload.Payload):
+    """
+    multipart 파일 필드용 async 파일 payload.
+    - size 를 알려주므로 multipart 전체 Content-Length 가 계산된다 (chunked 전송 안 함)
+    - 전송이 시작될 때 파일을 열고, 끝나거나 close_file() 시 반드시 닫는다 (fd 누수 방지)
+    - chunk 크기 지정, 읽기는 thread 로 넘겨 event loop 를 막지 않음
+    - 메모리는 chunk 1개 크기만 사용
+    """
+
+    def __init__(self, path: Path, chunk_size: int, progress: UploadProgress):
+        super().__init__(path, content_type="application/octet-stream", filename=path.name)
+        self.path = path
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._size = path.stat().st_size
+        self._fp = None
+        progress.total += self._size
+
+    async def write(self, writer) -> None:
+        loop = asyncio.get_running_loop()
+        self._fp = open(self.path, "rb")
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, self._fp.read, self.chunk_size)
+                if not chunk:
+                    break
+                await writer.write(chunk)
+                await self.progress.add(len(chunk))
+        finally:
+            self.close_file()
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        # 파일 전체를 메모리로 읽지 않는다
+        raise TypeError("FileStream payload cannot be decoded")
+
+    def _close(self) -> None:
+        self.close_file()
+
+    def close_file(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
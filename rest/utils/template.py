@@ -0,0 +1,66 @@
+# template.py
+import re
+from typing import Any, Dict
+
+# {key} placeholder
+_SLOT_RE = re.compile(r"\{([^{}]+)\}")
+
+_CONST = 0
+_STR = 1
+_DICT = 2
+_LIST = 3
+
+
+class Template:
+    """
+    문자열 / dict / list 템플릿을 한 번만 파싱해서 placeholder 위치를 미리 계산해 둔다.
+    render(params) 는 슬롯만 채운다 (요청마다 구조 전체 str.replace 반복 없음).
+
+    규칙 (기존 _replace 와 동일):
+    - params 에 있는 key 만 치환, 없으면 "{key}" 그대로 유지
+    - 값은 str() 로 변환
+    """
+
+    __slots__ = ("source", "_node", "has_slots")
+
+    def __init__(self, source: Any):
+        self.source = source
+        self._node = self._compile(source)
+        self.has_slots = self._node[0] != _CONST
+
+    @classmethod
+    def _compile(cls, obj: Any) -> tuple:
+        if isinstance(obj, dict):
+            items = [(k, cls._compile(v)) for k, v in obj.items()]
+            return (_DICT, items)
+        if isinstance(obj, list):
+            return (_LIST, [cls._compile(v) for v in obj])
+        if isinstance(obj, str):
+            # split 결과: [literal, key, literal, key, ..., literal]
+            parts = _SLOT_RE.split(obj)
+            if len(parts) == 1:
+                return (_CONST, obj)
+            return (_STR, parts)
+        return (_CONST, obj)
+
+    def render(self, params: Dict[str, Any]) -> Any:
+        return self._render(self._node, params or {})
+
+    @classmethod
+    def _render(cls, node: tuple, params: Dict[str, Any]) -> Any:
+        kind, value = node
+        if kind == _CONST:
+            return value
+        if kind == _STR:
+            out = []
+            for i, part in enumerate(value):
+                if i % 2 == 0:
+                    out.append(part)
+                elif part in params:
+                    out.append(str(params[part]))
+                else:
+                    out.append("{" + part + "}")
+            return "".join(out)
+        if kind == _DICT:
+            return {k: cls._render(v, params) for k, v in value}
+        return [cls._render(v, params) for v in value]
@@ -1,13 +1,23 @@
 import os
+import re
 import time
 import json
 import yaml
 import requests
 import subprocess
 import tempfile
-from typing import Any, Dict, List, Optional, Union, Tuple
+from urllib3.exceptions import ProxyError as Urllib3ProxyError
+from collections import deque
+from contextlib import closing
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union, Tuple
 from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
 
+from github_cache import HttpCache, DEFAULT_HTTP_CACHE_DIR
+from github_state import PrStateStore
+from github_rate import RateGovernor
+
 
 def load_config(path: str = "./config/github.config.yml") -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
@@ -26,6 +36,39 @@ class ProxyAuthError(GitHubAPIError):
     pass
 
 
+# http.client 가 CONNECT 실패 시 올리는 OSError 형식 ("Tunnel connection failed: 407 Proxy ...")
+_TUNNEL_STATUS_RE = re.compile(r"^Tunnel connection failed: (\d{3})\b")
+
+
+def _proxy_error_status(e: BaseException) -> Optional[int]:
+    """
+    requests 의 ProxyError 에서 proxy 가 돌려준 HTTP 상태 코드를 찾는다 (없으면 None)
+    - e.response 가 있으면 그 status_code
+    - 없으면 예외 체인(args / reason / __cause__)에서 urllib3 ProxyError 를 찾고
+      그 original_error(http.client 의 CONNECT 실패)에서 상태 코드를 꺼낸다
+    """
+    resp = getattr(e, "response", None)
+    if resp is not None and getattr(resp, "status_code", None):
+        return int(resp.status_code)
+
+    seen = set()
+    stack: List[BaseException] = [e]
+    while stack:
+        cur = stack.pop()
+        if id(cur) in seen:
+            continue
+        seen.add(id(cur))
+        if isinstance(cur, Urllib3ProxyError):
+            orig = cur.original_error
+            if isinstance(orig, OSError) and orig.args:
+                m = _TUNNEL_STATUS_RE.match(str(orig.args[0]))
+                if m:
+                    return int(m.group(1))
+        nxt = [*cur.args, getattr(cur, "reason", None), cur.__cause__, getattr(cur, "original_error", None)]
+        stack.extend(x for x in nxt if isinstance(x, BaseException))
+    return None
+
+
 class GitHubAPI:
     def __init__(self, config_path: str = "./config/github.config.yml"):
         cfg = load_config(config_path)
@@ -39,9 +82,20 @@ class GitHubAPI:
         self.auto_rate_limit_wait = bool(gh.get("auto_rate_limit_wait", True))
         self.max_retries = int(gh.get("max_retries", 3))
         self.retry_backoff_sec = float(gh.get("retry_backoff_sec", 1.0))
-        self.is_session = bool(gh.get("is_session", True))
+        # session: 연결을 재사용하는 requests.Session (기본값)
+        # curl: 호출마다 curl 프로세스 실행, 명시적으로 지정할 때만 사용
+        # (transport 가 없으면 기존 is_session: false 를 curl 로 해석)
+        self.transport = str(gh.get("transport") or ("session" if gh.get("is_session", True) else "curl")).lower()
+        if self.transport not in ("session", "curl"):
+            raise ValueError(f"unknown github.transport: {self.transport}")
+        self.is_session = self.transport == "session"
         self.is_pretty_console = bool(gh.get("is_pretty_console", False))
         self.is_limit = bool(gh.get("is_limit", True))
+        self.review_workers = max(1, int(gh.get("review_workers", 8)))
+        self.page_workers = max(1, int(gh.get("page_workers", 4)))
+        self.pr_source = str(gh.get("pr_source", "rest")).lower()
+        self.graphql_page_size = min(100, max(1, int(gh.get("graphql_page_size", 50))))
+        self.graphql_url = (gh.get("graphql_url") or "").strip() or self._default_graphql_url()
 
         proxy_cfg = (gh.get("proxy") or {})
         proxies = {
@@ -49,16 +103,55 @@ class GitHubAPI:
             "https": proxy_cfg.get("https"),
         }
         self.proxies = {k: v for k, v in proxies.items() if v}
+        no_proxy = proxy_cfg.get("no_proxy") or ""
+        if isinstance(no_proxy, (list, tuple)):
+            no_proxy = ",".join(str(h).strip() for h in no_proxy if str(h).strip())
+        self.no_proxy = str(no_proxy).strip()
 
         self.verify_ssl = bool(proxy_cfg.get("verify_ssl", True))
         self.ca_bundle = (proxy_cfg.get("ca_bundle") or "").strip()
         self.verify = self.ca_bundle if self.ca_bundle else self.verify_ssl
 
+        cache_cfg = (gh.get("http_cache") or {})
+        self.http_cache = None
+        if cache_cfg.get("enabled", False):
+            self.http_cache = HttpCache(
+                cache_cfg.get("dir") or DEFAULT_HTTP_CACHE_DIR,
+                int(cache_cfg.get("max_mb", 200)),
+            )
+
+        # 승인 리포트 상태 저장: 닫힌 PR 중 updated_at 이 그대로인 것은 다시 조회하지 않음
+        pr_state_path = (gh.get("pr_state_path") or "").strip()
+        self.pr_state = PrStateStore(pr_state_path) if pr_state_path else None
+
+        # rate limit resource(core / search / graphql) 별 예산 1개, 모든 worker thread 가 공유
+        rl_cfg = (gh.get("rate_limit") or {})
+        self.rate_governor = RateGovernor(
+            reserve=int(rl_cfg.get("reserve", 5)),
+            pace_below=float(rl_cfg.get("pace_below", 0.2)),
+            pause_on_limit=self.auto_rate_limit_wait,
+            default_retry_sec=self.retry_backoff_sec,
+            max_concurrent=int(rl_cfg.get("max_concurrent", 10)),
+            min_write_interval=float(rl_cfg.get("min_write_interval_sec", 1.0)),
+        )
+
         self.session = None
         if self.is_session:
             self.session = requests.Session()
+            pool_size = max(10, self.review_workers * self.page_workers)
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
             if self.proxies:
-                self.session.proxies.update(self.proxies)
+                # 설정한 proxy 가 HTTP(S)_PROXY 환경변수보다 우선 (curl -x 와 동일)
+                # proxy / no_proxy 는 요청마다 _request_proxies() 로 지정
+                self.session.trust_env = False
+
+    def _default_graphql_url(self) -> str:
+        # GitHub Enterprise 는 https://host/api/v3 → https://host/api/graphql
+        if self.base_url.endswith("/api/v3"):
+            return self.base_url[: -len("/v3")] + "/graphql"
+        return self.base_url + "/graphql"
 
     def print_output(self, data: Any):
         if isinstance(data, (dict, list)):
@@ -93,11 +186,14 @@ class GitHubAPI:
             return text
 
     def _parse_next_link(self, link_header: Optional[str]) -> Optional[str]:
+        return self._parse_link(link_header, "next")
+
+    def _parse_link(self, link_header: Optional[str], rel: str) -> Optional[str]:
         if not link_header:
             return None
         parts = [p.strip() for p in link_header.split(",")]
         for part in parts:
-            if 'rel="next"' in part:
+            if f'rel="{rel}"' in part:
                 start = part.find("<") + 1
                 end = part.find(">", start)
                 if start > 0 and end > start:
@@ -113,6 +209,9 @@ class GitHubAPI:
         except ValueError:
             return None
 
+    def rate_limit_state(self) -> Dict[str, Dict[str, Any]]:
+        return self.rate_governor.state()
+
     def _maybe_wait_rate_limit(self, resp: requests.Response) -> bool:
         if not self.auto_rate_limit_wait:
             return False
@@ -120,12 +219,11 @@ class GitHubAPI:
             return False
         remaining = resp.headers.get("X-RateLimit-Remaining")
         reset_epoch = self._rate_limit_reset_epoch(resp.headers)
+        # 응답을 받을 때 governor 가 이미 해당 resource 를 멈춰 두었다
+        # True 를 반환하면 재시도하고, 재시도는 rate_governor.acquire() 에서 대기
         if remaining == "0" and reset_epoch:
-            wait_sec = max(0, reset_epoch - int(time.time())) + 1
-            time.sleep(wait_sec)
             return True
-        if resp.status_code == 429:
-            time.sleep(self.retry_backoff_sec)
+        if resp.status_code == 429 or resp.headers.get("Retry-After"):
             return True
         return False
 
@@ -187,6 +285,8 @@ class GitHubAPI:
             cmd += ["-x", self.proxies["https"]]
         elif self.proxies.get("http"):
             cmd += ["-x", self.proxies["http"]]
+        if self.proxies and self.no_proxy:
+            cmd += ["--noproxy", self.no_proxy]
 
         if self.ca_bundle:
             cmd += ["--cacert", self.ca_bundle]
@@ -259,7 +359,24 @@ class GitHubAPI:
         body: Any,
     ) -> Tuple[Any, Dict[str, str], int]:
         final_url = self._merge_url_params(url, params)
-        status_code, resp_headers, body_text = self._curl_call(method, final_url, headers, body)
+
+        entry = None
+        send_headers = headers
+        if self.http_cache is not None and method == "GET":
+            entry = self.http_cache.get(final_url, headers)
+            send_headers = {**headers, **self.http_cache.conditional_headers(entry)}
+
+        self.rate_governor.acquire(final_url, method)
+        try:
+            status_code, resp_headers, body_text = self._curl_call(method, final_url, send_headers, body)
+        except BaseException:
+            self.rate_governor.release(final_url)
+            raise
+        self.rate_governor.observe(final_url, status_code, resp_headers)
+
+        if entry is not None and status_code == 304:
+            entry = self.http_cache.revalidated(final_url, headers, entry, resp_headers)
+            return self._decode_text(entry["body"]), dict(entry["headers"]), entry["status"]
 
         if status_code == 407:
             via = resp_headers.get("Via", "") or ""
@@ -270,8 +387,75 @@ class GitHubAPI:
             msg = resp_headers.get("Status", "") or "Request failed"
             raise GitHubAPIError(status_code, msg, body_text)
 
+        if self.http_cache is not None and method == "GET" and status_code == 200:
+            self.http_cache.store(final_url, headers, status_code, resp_headers, body_text)
+
         return self._decode_text(body_text), resp_headers, status_code
 
+    def _page_range(self, next_url: str, last_url: Optional[str]) -> List[str]:
+        # next=...&page=N, last=...&page=M 이고 page 외 나머지 URL 이 같으면 → N..M 페이지 URL 목록
+        if not last_url:
+            return []
+        n_parts, l_parts = urlsplit(next_url), urlsplit(last_url)
+        n_query, l_query = parse_qsl(n_parts.query, keep_blank_values=True), parse_qsl(l_parts.query, keep_blank_values=True)
+        n_page, l_page = dict(n_query).get("page", ""), dict(l_query).get("page", "")
+        if not (n_page.isdigit() and l_page.isdigit()):
+            return []
+        if (n_parts.scheme, n_parts.netloc, n_parts.path) != (l_parts.scheme, l_parts.netloc, l_parts.path):
+            return []
+        if [kv for kv in n_query if kv[0] != "page"] != [kv for kv in l_query if kv[0] != "page"]:
+            return []
+
+        urls = []
+        for page in range(int(n_page), int(l_page) + 1):
+            query = urlencode([(k, str(page) if k == "page" else v) for k, v in n_query])
+            urls.append(urlunsplit((n_parts.scheme, n_parts.netloc, n_parts.path, query, n_parts.fragment)))
+        return urls
+
+    def _iter_next_pages(
+        self,
+        link_header: Optional[str],
+        fetch_page: Callable[[str], Tuple[Any, Dict[str, str]]],
+    ) -> Iterator[Any]:
+        # 첫 페이지 이후 rel="next" 를 따라간다. rel="last" 로 페이지 수를 알면
+        # 나머지 페이지를 동시에 받고 페이지 순서대로 yield 한다.
+        next_url = self._parse_link(link_header, "next")
+        last_url = self._parse_link(link_header, "last")
+        while next_url:
+            urls = self._page_range(next_url, last_url) if self.page_workers > 1 else []
+            resp_headers: Dict[str, str] = {}
+            if len(urls) > 1:
+                # 동시에 받는 페이지는 page_workers 개까지만
+                # → 호출 측이 중간에 멈추면 나머지 페이지는 요청하지 않음
+                workers = min(self.page_workers, len(urls))
+                ex = ThreadPoolExecutor(max_workers=workers)
+                todo = iter(urls)
+                in_flight = deque(ex.submit(fetch_page, u) for u in islice(todo, workers))
+                try:
+                    while in_flight:
+                        payload, resp_headers = in_flight.popleft().result()
+                        nxt = next(todo, None)
+                        if nxt is not None:
+                            in_flight.append(ex.submit(fetch_page, nxt))
+                        yield payload
+                finally:
+                    # 호출 측이 중간에 닫으면 대기 중인 요청은 취소, 실행 중인 요청은 끝날 때까지 기다림
+                    for fut in in_flight:
+                        fut.cancel()
+                    ex.shutdown(wait=True, cancel_futures=True)
+            else:
+                payload, resp_headers = fetch_page(next_url)
+                yield payload
+
+            # 조회 중 항목이 추가되면 마지막 페이지에 next 가 더 있을 수 있다
+            next_url = self._parse_link(resp_headers.get("Link"), "next")
+            last_url = self._parse_link(resp_headers.get("Link"), "last")
+
+    def _session_fetch_page(self, method: str, url: str, headers: Dict[str, str]) -> Tuple[Any, Dict[str, str]]:
+        # 첫 페이지와 같은 재시도 규칙 (max_retries 초과 시 GitHubAPIError)
+        resp = self._session_send(method, url, None, None, None, headers)
+        return self._decode_requests(resp), resp.headers
+
     def _curl_collect_all_pages(
         self,
         method: str,
@@ -295,9 +479,11 @@ class GitHubAPI:
         else:
             return first_payload
 
-        next_url = self._parse_next_link(resp_headers.get("Link"))
-        while next_url:
-            payload, resp_headers, _ = self._curl_request_once(method, next_url, headers, None, None)
+        def fetch_page(page_url: str) -> Tuple[Any, Dict[str, str]]:
+            payload, page_headers, _ = self._curl_request_once(method, page_url, headers, None, None)
+            return payload, page_headers
+
+        for payload in self._iter_next_pages(resp_headers.get("Link"), fetch_page):
             if payload_kind == "dict_items":
                 if isinstance(payload, dict):
                     aggregated.extend(list(payload.get(item_key or "items", [])))
@@ -308,7 +494,6 @@ class GitHubAPI:
                     aggregated.extend(payload)
                 else:
                     aggregated.append(payload)
-            next_url = self._parse_next_link(resp_headers.get("Link"))
 
         if payload_kind == "dict_items":
             base_payload[item_key] = aggregated
@@ -337,23 +522,8 @@ class GitHubAPI:
         else:
             return first_payload
 
-        next_url = self._parse_next_link(first_resp.headers.get("Link"))
-        while next_url:
-            resp = self.session.request(
-                method,
-                next_url,
-                headers=headers,
-                timeout=self.timeout,
-                verify=self.verify,
-            )
-
-            if self._maybe_wait_rate_limit(resp):
-                continue
-
-            if not (200 <= resp.status_code < 300):
-                self._raise_for_status(resp)
-
-            payload = self._decode_requests(resp)
+        fetch_page = lambda page_url: self._session_fetch_page(method, page_url, headers)
+        for payload in self._iter_next_pages(first_resp.headers.get("Link"), fetch_page):
             if payload_kind == "dict_items":
                 if isinstance(payload, dict):
                     agg.extend(payload.get(item_key, []))
@@ -365,13 +535,77 @@ class GitHubAPI:
                 else:
                     agg.append(payload)
 
-            next_url = self._parse_next_link(resp.headers.get("Link"))
-
         if payload_kind == "dict_items":
             base_payload[item_key] = agg
             return base_payload
         return agg
 
+    def _session_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json_body: Optional[Dict[str, Any]],
+        data_body: Optional[Union[Dict[str, Any], str, bytes]],
+        headers: Dict[str, str],
+    ) -> requests.Response:
+        entry = None
+        send_headers = headers
+        cacheable = self.http_cache is not None and method == "GET"
+        if cacheable:
+            cache_url = self._merge_url_params(url, params)
+            entry = self.http_cache.get(cache_url, headers)
+            send_headers = {**headers, **self.http_cache.conditional_headers(entry)}
+
+        self.rate_governor.acquire(url, method)
+        try:
+            resp = self.session.request(
+                method,
+                url,
+                params=params,
+                json=json_body,
+                data=data_body,
+                headers=send_headers,
+                proxies=self._request_proxies(url),
+                timeout=self.timeout,
+                verify=self.verify,
+            )
+        except requests.exceptions.ProxyError as e:
+            self.rate_governor.release(url)
+            # proxy 경유 HTTPS: CONNECT 의 407 은 응답이 아니라 예외로 올라온다
+            if _proxy_error_status(e) == 407:
+                raise ProxyAuthError(407, self._friendly_proxy_407_message(), str(e)) from e
+            raise
+        except BaseException:
+            self.rate_governor.release(url)
+            raise
+        self.rate_governor.observe(url, resp.status_code, resp.headers)
+
+        if entry is not None and resp.status_code == 304:
+            entry = self.http_cache.revalidated(cache_url, headers, entry, resp.headers)
+            return self._cached_response(entry, cache_url)
+        if cacheable and resp.status_code == 200:
+            self.http_cache.store(cache_url, headers, resp.status_code, resp.headers, resp.text)
+        return resp
+
+    def _request_proxies(self, url: str) -> Dict[str, str]:
+        # proxy.no_proxy 에 해당하는 host 는 proxy 없이 직접 연결
+        if not self.proxies:
+            return {}
+        if self.no_proxy and requests.utils.should_bypass_proxies(url, no_proxy=self.no_proxy):
+            return {}
+        return dict(self.proxies)
+
+    def _cached_response(self, entry: Dict[str, Any], url: str) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = entry["status"]
+        resp._content = entry["body"].encode("utf-8")
+        resp.encoding = "utf-8"
+        resp.headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+        resp.url = url
+        resp.reason = "Not Modified (cached)"
+        return resp
+
     def _decode_requests(self, resp: requests.Response) -> Any:
         if resp.status_code == 204:
             return None
@@ -403,19 +637,29 @@ class GitHubAPI:
             payload, _, _ = self._curl_request_once(method, url, req_headers, params, json if json is not None else data)
             return payload
 
+        resp = self._session_send(method, url, params, json, data, req_headers)
+
+        if not paginate:
+            return self._decode_requests(resp)
+
+        if self.is_limit:
+            return self._decode_requests(resp)
+
+        return self._requests_collect_all_pages(resp, method, json, data, req_headers, item_key)
+
+    def _session_send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        data: Optional[Union[Dict[str, Any], str, bytes]],
+        req_headers: Dict[str, str],
+    ) -> requests.Response:
         attempt = 0
         while True:
             try:
-                resp = self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    json=json,
-                    data=data,
-                    headers=req_headers,
-                    timeout=self.timeout,
-                    verify=self.verify,
-                )
+                resp = self._session_request(method, url, params, json, data, req_headers)
             except (requests.ConnectionError, requests.Timeout) as e:
                 attempt += 1
                 if attempt > self.max_retries:
@@ -439,23 +683,64 @@ class GitHubAPI:
             if not (200 <= resp.status_code < 300):
                 self._raise_for_status(resp)
 
-            if not paginate:
-                return self._decode_requests(resp)
+            return resp
 
-            if self.is_limit:
-                return self._decode_requests(resp)
+    def iter_pages(
+        self,
+        path_or_url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Any]:
+        # GET 결과를 페이지 단위로 받는 대로 yield (순회를 멈추면 이후 페이지는 조회 안 함)
+        url = self._full_url(path_or_url)
+        req_headers = self._headers(headers)
 
-            return self._requests_collect_all_pages(resp, method, json, data, req_headers, item_key)
+        if self.is_session:
+            resp = self._session_send("GET", url, params, None, None, req_headers)
+            first_payload, link_header = self._decode_requests(resp), resp.headers.get("Link")
+            fetch_page = lambda page_url: self._session_fetch_page("GET", page_url, req_headers)
+        else:
+            first_payload, resp_headers, _ = self._curl_request_once("GET", url, req_headers, params, None)
+            link_header = resp_headers.get("Link")
+            fetch_page = lambda page_url: self._curl_request_once("GET", page_url, req_headers, None, None)[:2]
+
+        yield first_payload
+        if self.is_limit:
+            return
+        yield from self._iter_next_pages(link_header, fetch_page)
+
+    def iter_items(
+        self,
+        path_or_url: str,
+        params: Optional[Dict[str, Any]] = None,
+        item_key: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Any]:
+        for payload in self.iter_pages(path_or_url, params=params, headers=headers):
+            if item_key and isinstance(payload, dict):
+                yield from payload.get(item_key, [])
+            elif isinstance(payload, list):
+                yield from payload
+            else:
+                yield payload
 
     def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Any:
-        url = self.base_url + "/graphql"
         return self.request(
             "POST",
-            url,
+            self.graphql_url,
             json={"query": query, "variables": variables or {}},
             paginate=False,
         )
 
+    def graphql_data(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        payload = self.graphql(query, variables)
+        if not isinstance(payload, dict):
+            raise GitHubAPIError(0, "GraphQL returned a non-JSON response", str(payload))
+        if payload.get("errors"):
+            message = "; ".join(str(e.get("message", e)) for e in payload["errors"] if isinstance(e, dict))
+            raise GitHubAPIError(200, message or "GraphQL error", json.dumps(payload, ensure_ascii=False))
+        return payload.get("data") or {}
+
 
 def _extract_approvals_from_reviews(reviews: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str], List[str], List[Dict[str, Any]]]:
     approved_events = []
@@ -501,90 +786,295 @@ def _get_pr_approval_info(gh, owner: str, repo: str, pr_number: int) -> Dict[str
     }
 
 
-def get_prs_created_by_users(
+def _get_pr_approval_infos(
     gh,
     owner: str,
     repo: str,
-    users: Optional[List[str]] = None,
-    created_after: Optional[str] = None,
-    include_approval_events: bool = False,
-    state: str = "all",
+    prs: List[Dict[str, Any]],
+    workers: int,
+    store: Optional[PrStateStore] = None,
 ) -> List[Dict[str, Any]]:
-    if not users:
-        prs = gh.request(
-            "GET",
-            f"/repos/{owner}/{repo}/pulls",
-            params={"state": state, "per_page": 100},
-            paginate=True,
-        )
+    infos: List[Optional[Dict[str, Any]]] = [store.get(owner, repo, pr) if store else None for pr in prs]
+    todo = [i for i, info in enumerate(infos) if info is None]
+
+    pr_numbers = [prs[i]["number"] for i in todo]
+    workers = min(max(1, workers), len(pr_numbers))
+    if workers <= 1:
+        fetched = [_get_pr_approval_info(gh, owner, repo, n) for n in pr_numbers]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            fetched = list(ex.map(lambda n: _get_pr_approval_info(gh, owner, repo, n), pr_numbers))
+
+    for i, info in zip(todo, fetched):
+        infos[i] = info
+    if store:
+        store.put_many(owner, repo, ((prs[i], infos[i]) for i in todo))
+    return infos
+
+
+def _pr_item(pr: Dict[str, Any], author: Optional[str], approval_info: Dict[str, Any], include_approval_events: bool) -> Dict[str, Any]:
+    item = {
+        "number": pr["number"],
+        "title": pr.get("title"),
+        "author": author,
+        "state": pr.get("state"),
+        "created_at": pr.get("created_at"),
+        "url": pr.get("html_url"),
+        "first_approved_at": approval_info["first_approved_at"],
+        "last_approved_at": approval_info["last_approved_at"],
+        "approvers": approval_info["approvers"],
+    }
+    if include_approval_events:
+        item["approved_events"] = approval_info["approved_events"]
+    return item
+
+
+_GQL_PR_FIELDS = """
+number
+title
+state
+createdAt
+updatedAt
+url
+author { login __typename }
+reviews(first: 100) {
+  pageInfo { hasNextPage endCursor }
+  nodes { databaseId state submittedAt author { login __typename } }
+}
+"""
+
+_GQL_REPO_PRS = """
+query($owner: String!, $repo: String!, $first: Int!, $after: String, $states: [PullRequestState!]) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(first: $first, after: $after, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { %s }
+    }
+  }
+}
+""" % _GQL_PR_FIELDS
+
+_GQL_SEARCH_PRS = """
+query($q: String!, $first: Int!, $after: String) {
+  search(query: $q, type: ISSUE, first: $first, after: $after) {
+    pageInfo { hasNextPage endCursor }
+    nodes { ... on PullRequest { %s } }
+  }
+}
+""" % _GQL_PR_FIELDS
+
+_GQL_PR_REVIEWS = """
+query($owner: String!, $repo: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviews(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes { databaseId state submittedAt author { login __typename } }
+      }
+    }
+  }
+}
+"""
 
-        result = []
-        for pr in prs:
-            if created_after and pr.get("created_at", "")[:10] < created_after:
-                continue
+_GQL_STATES = {"open": ["OPEN"], "closed": ["CLOSED", "MERGED"]}
 
-            pr_number = pr["number"]
-            approval_info = _get_pr_approval_info(gh, owner, repo, pr_number)
+# is_limit 일 때 REST 는 첫 페이지(per_page=100)만 조회 → GraphQL 도 같은 개수의 첫 페이지만
+_REST_PAGE_SIZE = 100
 
-            item = {
-                "number": pr_number,
-                "title": pr.get("title"),
-                "author": (pr.get("user") or {}).get("login"),
-                "state": pr.get("state"),
-                "created_at": pr.get("created_at"),
-                "url": pr.get("html_url"),
-                "first_approved_at": approval_info["first_approved_at"],
-                "last_approved_at": approval_info["last_approved_at"],
-                "approvers": approval_info["approvers"],
-            }
-            if include_approval_events:
-                item["approved_events"] = approval_info["approved_events"]
 
-            result.append(item)
+def _graphql_login(actor: Optional[Dict[str, Any]]) -> str:
+    # REST user.login 과 같은 값: Bot 은 "<login>[bot]", 삭제된 계정(null)은 "ghost"
+    if not actor:
+        return "ghost"
+    if actor.get("__typename") == "Bot":
+        return f"{actor.get('login')}[bot]"
+    return actor.get("login")
+
+
+def _graphql_review(node: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": node.get("databaseId"),
+        "state": node.get("state"),
+        "submitted_at": node.get("submittedAt"),
+        "user": {"login": _graphql_login(node.get("author"))},
+    }
 
-        result.sort(key=lambda x: (x["created_at"] or "", x["number"]), reverse=True)
-        return result
 
-    merged: Dict[int, Dict[str, Any]] = {}
+def _graphql_pr(gh, owner: str, repo: str, node: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    # GraphQL PullRequest node → REST 의 pr 형태 + approval 정보
+    reviews_conn = node.get("reviews") or {}
+    reviews = [_graphql_review(r) for r in reviews_conn.get("nodes") or []]
+
+    # review 는 REST 와 같이 state 구분 없이 100개씩 (is_limit 면 첫 페이지만)
+    page_info = reviews_conn.get("pageInfo") or {}
+    while page_info.get("hasNextPage") and not gh.is_limit:
+        data = gh.graphql_data(_GQL_PR_REVIEWS, {
+            "owner": owner, "repo": repo, "number": node["number"], "after": page_info.get("endCursor"),
+        })
+        conn = ((data.get("repository") or {}).get("pullRequest") or {}).get("reviews") or {}
+        reviews.extend(_graphql_review(r) for r in conn.get("nodes") or [])
+        page_info = conn.get("pageInfo") or {}
+
+    pr = {
+        "number": node["number"],
+        "title": node.get("title"),
+        "state": "open" if node.get("state") == "OPEN" else "closed",
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "html_url": node.get("url"),
+        "user": {"login": _graphql_login(node.get("author"))},
+    }
+    first_at, last_at, approvers, approved_events = _extract_approvals_from_reviews(reviews)
+    return pr, {
+        "first_approved_at": first_at,
+        "last_approved_at": last_at,
+        "approvers": approvers,
+        "approved_events": approved_events,
+    }
+
 
+def _collect_prs_graphql(
+    gh,
+    owner: str,
+    repo: str,
+    users: Optional[List[str]],
+    created_after: Optional[str],
+    state: str,
+) -> Tuple[List[Tuple[Dict[str, Any], Optional[str]]], List[Dict[str, Any]]]:
+    selected: List[Tuple[Dict[str, Any], Optional[str]]] = []
+    infos: List[Dict[str, Any]] = []
+    first = _REST_PAGE_SIZE if gh.is_limit else gh.graphql_page_size
+
+    if not users:
+        after = None
+        while True:
+            data = gh.graphql_data(_GQL_REPO_PRS, {
+                "owner": owner, "repo": repo, "first": first, "after": after, "states": _GQL_STATES.get(state),
+            })
+            conn = (data.get("repository") or {}).get("pullRequests") or {}
+            past_window = False
+            for node in conn.get("nodes") or []:
+                # created 내림차순: 이후 node 는 모두 더 오래된 PR
+                if created_after and (node.get("createdAt") or "")[:10] < created_after:
+                    past_window = True
+                    break
+                pr, info = _graphql_pr(gh, owner, repo, node)
+                selected.append((pr, pr["user"]["login"]))
+                infos.append(info)
+            page_info = conn.get("pageInfo") or {}
+            if past_window or not page_info.get("hasNextPage") or gh.is_limit:
+                break
+            after = page_info.get("endCursor")
+        return selected, infos
+
+    seen = set()
     for user in users:
-        q = f"is:pr repo:{owner}/{repo} author:{user}"
+        q = f"is:pr repo:{owner}/{repo} author:{user} sort:created-desc"
         if created_after:
             q += f" created:>={created_after}"
         if state in ("open", "closed"):
             q += f" state:{state}"
 
-        res = gh.request(
-            "GET",
-            "/search/issues",
-            params={"q": q, "per_page": 100, "sort": "created", "order": "desc"},
-            paginate=True,
-            item_key="items",
+        after = None
+        while True:
+            data = gh.graphql_data(_GQL_SEARCH_PRS, {"q": q, "first": first, "after": after})
+            conn = data.get("search") or {}
+            for node in conn.get("nodes") or []:
+                if not node or "number" not in node or node["number"] in seen:
+                    continue
+                seen.add(node["number"])
+                pr, info = _graphql_pr(gh, owner, repo, node)
+                selected.append((pr, user))
+                infos.append(info)
+            page_info = conn.get("pageInfo") or {}
+            if not page_info.get("hasNextPage") or gh.is_limit:
+                break
+            after = page_info.get("endCursor")
+
+    return selected, infos
+
+
+def _collect_prs_rest(
+    gh,
+    owner: str,
+    repo: str,
+    users: Optional[List[str]],
+    created_after: Optional[str],
+    state: str,
+    workers: int,
+) -> Tuple[List[Tuple[Dict[str, Any], Optional[str]]], List[Dict[str, Any]]]:
+    # (pr, author) 를 찾은 순서대로 모으고, review 는 그 다음에 병렬로 조회
+    selected: List[Tuple[Dict[str, Any], Optional[str]]] = []
+
+    if not users:
+        prs = gh.iter_items(
+            f"/repos/{owner}/{repo}/pulls",
+            params={"state": state, "per_page": 100, "sort": "created", "direction": "desc"},
         )
 
-        for it in res.get("items", []):
-            pr_number = it["number"]
-
-            if pr_number not in merged:
-                approval_info = _get_pr_approval_info(gh, owner, repo, pr_number)
-
-                item = {
-                    "number": pr_number,
-                    "title": it.get("title"),
-                    "author": user,
-                    "state": it.get("state"),
-                    "created_at": it.get("created_at"),
-                    "url": it.get("html_url"),
-                    "first_approved_at": approval_info["first_approved_at"],
-                    "last_approved_at": approval_info["last_approved_at"],
-                    "approvers": approval_info["approvers"],
-                }
-                if include_approval_events:
-                    item["approved_events"] = approval_info["approved_events"]
-
-                merged[pr_number] = item
-
-    result = sorted(merged.values(), key=lambda x: (x["created_at"] or "", x["number"]), reverse=True)
+        # break 후 바로 닫아서 미리 받던 페이지 요청/thread 를 review 조회 전에 정리
+        with closing(prs):
+            for pr in prs:
+                # 최신순: created_after 보다 오래된 PR 이 나오면 남은 페이지는 조회하지 않음
+                if created_after and pr.get("created_at", "")[:10] < created_after:
+                    break
+                selected.append((pr, (pr.get("user") or {}).get("login")))
+    else:
+        seen = set()
+        for user in users:
+            q = f"is:pr repo:{owner}/{repo} author:{user}"
+            if created_after:
+                q += f" created:>={created_after}"
+            if state in ("open", "closed"):
+                q += f" state:{state}"
+
+            items = gh.iter_items(
+                "/search/issues",
+                params={"q": q, "per_page": 100, "sort": "created", "order": "desc"},
+                item_key="items",
+            )
+
+            for it in items:
+                if it["number"] not in seen:
+                    seen.add(it["number"])
+                    selected.append((it, user))
+
+    infos = _get_pr_approval_infos(gh, owner, repo, [pr for pr, _ in selected], workers, getattr(gh, "pr_state", None))
+    return selected, infos
+
+
+def get_prs_created_by_users(
+    gh,
+    owner: str,
+    repo: str,
+    users: Optional[List[str]] = None,
+    created_after: Optional[str] = None,
+    include_approval_events: bool = False,
+    state: str = "all",
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    workers = workers if workers is not None else getattr(gh, "review_workers", 1)
+
+    collected = None
+    if getattr(gh, "pr_source", "rest") == "graphql":
+        try:
+            collected = _collect_prs_graphql(gh, owner, repo, users, created_after, state)
+            if getattr(gh, "pr_state", None) is not None:
+                gh.pr_state.put_many(owner, repo, ((pr, info) for (pr, _), info in zip(*collected)))
+        except ProxyAuthError:
+            raise
+        except GitHubAPIError as e:
+            print(f"[WARN] GraphQL PR query failed, falling back to REST: {e}")
+
+    if collected is None:
+        collected = _collect_prs_rest(gh, owner, repo, users, created_after, state, workers)
+    selected, infos = collected
+
+    result = [
+        _pr_item(pr, author, info, include_approval_events)
+        for (pr, author), info in zip(selected, infos)
+    ]
+    result.sort(key=lambda x: (x["created_at"] or "", x["number"]), reverse=True)
     return result
 
 
@@ -623,4 +1113,10 @@ if __name__ == "__main__":
     gh.print_output(result)
 
     result = get_pr_files(gh, "YOUR_ORG", "abc", 123)
-    gh.print_output(result)
\ No newline at end of file
+    gh.print_output(result)
+
+    if gh.http_cache is not None:
+        print(f"[HTTP CACHE] {gh.http_cache.stats()}")
+    if gh.pr_state is not None:
+        print(f"[PR STATE] {gh.pr_state.stats()}")
+    print(f"[RATE LIMIT] {gh.rate_limit_state()}")
\ No newline at end of file
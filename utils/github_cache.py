@@ -0,0 +1,133 @@
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# GitHubAPI 조건부 요청 캐시 (ETag / Last-Modified)
+# - (url, accept, token) 1건당 JSON 파일 1개: cache_dir/<hex 2자리>/<sha256>.json
+# - 파일 mtime = 최근 사용 시각, max_mb 초과 시 오래된 파일부터 삭제
+# - 304 응답은 저장된 body 로 반환 (rate limit 차감 없음)
+CACHE_VERSION = 1
+DEFAULT_HTTP_CACHE_DIR = "./cache/github_http"
+
+# body 와 함께 보관할 응답 헤더 (Link 는 다음 페이지 조회에 필요)
+_KEEP_HEADERS = ("Content-Type", "Link", "ETag", "Last-Modified")
+_REFRESH_HEADERS = ("Link", "ETag", "Last-Modified")
+
+
+def _pick_headers(resp_headers: Dict[str, str], names) -> Dict[str, str]:
+    # curl(HTTP/2) 은 헤더 이름을 소문자로 준다
+    lower = {str(k).lower(): v for k, v in (resp_headers or {}).items()}
+    return {k: lower[k.lower()] for k in names if lower.get(k.lower())}
+
+
+class HttpCache:
+    def __init__(self, cache_dir: str = DEFAULT_HTTP_CACHE_DIR, max_mb: int = 200):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max(0, int(max_mb)) * 1024 * 1024
+        self.hits = 0          # 304 → 캐시에서 반환
+        self.misses = 0        # 200 전체 응답
+        self.stored = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    def _path(self, url: str, headers: Dict[str, str]) -> Path:
+        h = hashlib.sha256()
+        for part in (url, headers.get("Accept", ""), headers.get("Authorization", "")):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        key = h.hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, url: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        p = self._path(url, headers)
+        try:
+            with open(p, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("version") != CACHE_VERSION or entry.get("url") != url:
+            return None
+        return entry
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        if not entry:
+            return {}
+        out = {}
+        if entry["headers"].get("ETag"):
+            out["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            out["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return out
+
+    def revalidated(self, url: str, headers: Dict[str, str], entry: Dict[str, Any], resp_headers: Dict[str, str]) -> Dict[str, Any]:
+        # 304: 저장된 body 유지, 서버가 새 ETag/Last-Modified/Link 를 주면 갱신, LRU 용 mtime 갱신
+        with self._lock:
+            self.hits += 1
+        changed = False
+        for k, v in _pick_headers(resp_headers, _REFRESH_HEADERS).items():
+            if entry["headers"].get(k) != v:
+                entry["headers"][k] = v
+                changed = True
+        p = self._path(url, headers)
+        if changed:
+            self._write(p, entry)
+        else:
+            try:
+                os.utime(p)
+            except OSError:
+                pass
+        return entry
+
+    def store(self, url: str, headers: Dict[str, str], status: int, resp_headers: Dict[str, str], body: str) -> None:
+        with self._lock:
+            self.misses += 1
+        kept = _pick_headers(resp_headers, _KEEP_HEADERS)
+        if not (kept.get("ETag") or kept.get("Last-Modified")):
+            return
+        entry = {"version": CACHE_VERSION, "url": url, "status": status, "headers": kept, "body": body}
+        self._write(self._path(url, headers), entry)
+        with self._lock:
+            self.stored += 1
+
+    def _write(self, p: Path, entry: Dict[str, Any]) -> None:
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            old = p.stat().st_size if p.exists() else 0
+            tmp = p.with_name(f"{p.name}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, p)
+            new = p.stat().st_size
+        except OSError:
+            return
+        self._account(new - old)
+
+    def _account(self, delta: int) -> None:
+        if not self.max_bytes:
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = sum(f.stat().st_size for f in self.cache_dir.rglob("*.json"))
+            else:
+                self._size += delta
+            if self._size <= self.max_bytes:
+                return
+            files = sorted(self.cache_dir.rglob("*.json"), key=lambda f: f.stat().st_mtime)
+            total = sum(f.stat().st_size for f in files)
+            for f in files:
+                if total <= self.max_bytes * 0.9:
+                    break
+                try:
+                    size = f.stat().st_size
+                    f.unlink()
+                except OSError:
+                    continue
+                total -= size
+                self.evicted += 1
+            self._size = total
+
+    def stats(self) -> Dict[str, int]:
+        return {"hit_304": self.hits, "miss": self.misses, "stored": self.stored, "evicted": self.evicted}
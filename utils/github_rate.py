@@ -0,0 +1,201 @@
+import time
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# GitHubAPI 호출 전체(thread 포함)가 공유하는 rate limit 예산
+# - 응답마다 해당 resource 예산 갱신 (X-RateLimit-Resource: core / search / graphql)
+# - 요청 전마다 acquire() 호출: resource 가 멈춤 상태(한도 도달 / Retry-After)면 대기하고,
+#   remaining 이 pace_below * limit 아래로 내려가면 남은 예산을 reset 까지 남은 시간에 나눠 보냄
+# - resource 별 reserve 건은 쓰지 않고 남겨서 403 전에 멈춘다
+# - secondary rate limit 방지: resource 별 동시 요청 수를 max_concurrent 로 제한하고,
+#   변경 요청(POST/PUT/PATCH/DELETE)과 search 요청은 서로 min_write_interval 초 이상 띄운다
+#   (요청이 끝나면 observe() 또는 release() 가 동시 요청 수를 돌려놓는다)
+RESOURCES = ("core", "search", "graphql")
+MUTATING_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    if not headers:
+        return None
+    v = headers.get(name)
+    if v is None:
+        # curl(HTTP/2) 은 헤더 이름을 소문자로 준다
+        lname = name.lower()
+        for k, hv in headers.items():
+            if str(k).lower() == lname:
+                return hv
+    return v
+
+
+def _int(v: Optional[str]) -> Optional[int]:
+    try:
+        return int(v) if v is not None else None
+    except ValueError:
+        return None
+
+
+class _Budget:
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: Optional[int] = None      # epoch 초
+        self.next_slot = 0.0
+        self.interval = 0.0
+        self.paused_until = 0.0
+        self.probe_until = 0.0               # 예산 모름: 응답이 올 때까지 요청 1건씩만
+        self.unmetered = False               # 응답에 rate limit 헤더 없음 (Enterprise 에서 한도 미사용)
+        self.in_flight = 0                   # 응답을 기다리는 요청 수
+        self.next_write_slot = 0.0           # 다음 변경/search 요청을 보낼 수 있는 시각
+
+
+class RateGovernor:
+    PROBE_TIMEOUT_SEC = 10.0
+
+    def __init__(
+        self,
+        reserve: int = 5,
+        pace_below: float = 0.2,
+        pause_on_limit: bool = True,
+        default_retry_sec: float = 1.0,
+        max_concurrent: int = 10,
+        min_write_interval: float = 1.0,
+    ):
+        self.reserve = max(0, int(reserve))
+        self.pace_below = min(1.0, max(0.0, float(pace_below)))
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.min_write_interval = max(0.0, float(min_write_interval))
+        self.pause_on_limit = pause_on_limit
+        self.default_retry_sec = default_retry_sec
+        self.waited_sec = 0.0
+        self._lock = threading.Lock()
+        self._budgets: Dict[str, _Budget] = {r: _Budget() for r in RESOURCES}
+
+    def resource_for(self, url: str) -> str:
+        path = urlsplit(url).path
+        if path.endswith("/graphql"):
+            return "graphql"
+        if "/search/" in path:
+            return "search"
+        return "core"
+
+    def is_write(self, url: str, method: str = "GET") -> bool:
+        # GraphQL 은 조회도 POST 라서 method 로 구분하지 않는다 (이 클라이언트는 query 만 보냄)
+        resource = self.resource_for(url)
+        if resource == "search":
+            return True
+        return resource != "graphql" and method.upper() in MUTATING_METHODS
+
+    def acquire(self, url: str, method: str = "GET") -> None:
+        resource = self.resource_for(url)
+        write = self.is_write(url, method)
+        while True:
+            with self._lock:
+                b = self._budgets.setdefault(resource, _Budget())
+                wait, reserved = self._reserve_slot(b, time.time(), write)
+                self.waited_sec += max(0.0, wait)
+            if wait > 0:
+                time.sleep(wait)
+            if reserved:
+                return
+
+    def _reserve_slot(self, b: _Budget, now: float, write: bool = False) -> Tuple[float, bool]:
+        # (대기 초, slot 확보 여부) 반환. 멈춤/동시 요청 초과 상태면 대기 후 다시 시도
+        if b.paused_until > now:
+            return b.paused_until - now, False
+        if b.in_flight >= self.max_concurrent:
+            return 0.05, False
+
+        wait, reserved = self._reserve_budget(b, now)
+        if not reserved:
+            return wait, False
+        b.in_flight += 1
+        if write:
+            # 변경/search 요청끼리는 min_write_interval 간격 (예산 pacing 과 겹치면 더 늦은 쪽)
+            slot = max(now + wait, b.next_write_slot)
+            b.next_write_slot = slot + self.min_write_interval
+            wait = slot - now
+        return wait, True
+
+    def _reserve_budget(self, b: _Budget, now: float) -> Tuple[float, bool]:
+
+        if b.reset is not None and b.reset <= now:
+            # reset 시각이 지남: 다음 응답 전까지 예산 모름
+            b.remaining, b.reset, b.interval = None, None, 0.0
+
+        if b.remaining is None or b.reset is None:
+            if b.unmetered:
+                return 0.0, True
+            if b.probe_until > now:
+                return min(0.05, b.probe_until - now), False
+            b.probe_until = now + self.PROBE_TIMEOUT_SEC
+            return 0.0, True
+
+        if b.remaining <= self.reserve:
+            b.paused_until = b.reset + 1
+            return b.paused_until - now, False
+
+        if b.limit and b.remaining > b.limit * self.pace_below:
+            b.interval = 0.0
+        else:
+            b.interval = max(0.0, b.reset - now) / (b.remaining - self.reserve)
+
+        slot = max(now, b.next_slot)
+        b.next_slot = slot + b.interval
+        b.remaining -= 1
+        return slot - now, True
+
+    def release(self, url: str) -> None:
+        # 응답 없이 끝난 요청(연결 실패/타임아웃): probe 를 풀어서 다음 요청이 PROBE_TIMEOUT_SEC 동안 막히지 않게 한다
+        resource = self.resource_for(url)
+        with self._lock:
+            b = self._budgets.setdefault(resource, _Budget())
+            b.probe_until = 0.0
+            b.in_flight = max(0, b.in_flight - 1)
+
+    def observe(self, url: str, status: int, headers: Any) -> None:
+        resource = (_header(headers, "X-RateLimit-Resource") or self.resource_for(url)).lower()
+        limit = _int(_header(headers, "X-RateLimit-Limit"))
+        remaining = _int(_header(headers, "X-RateLimit-Remaining"))
+        reset = _int(_header(headers, "X-RateLimit-Reset"))
+        retry_after = _int(_header(headers, "Retry-After"))
+
+        with self._lock:
+            # 동시 요청 수는 acquire() 때와 같은 resource(url 기준)로 돌려놓는다
+            sent = self._budgets.setdefault(self.resource_for(url), _Budget())
+            sent.in_flight = max(0, sent.in_flight - 1)
+            b = self._budgets.setdefault(resource, _Budget())
+            b.probe_until = 0.0
+            if limit is not None:
+                b.limit = limit
+            b.unmetered = remaining is None
+            if remaining is not None and reset is not None:
+                if b.reset is None or reset > b.reset:
+                    b.reset, b.remaining = reset, remaining
+                elif b.remaining is None or remaining < b.remaining:
+                    # 응답 도착 순서가 섞이므로 가장 작은 값이 최신
+                    b.remaining = remaining
+
+            if self.pause_on_limit and status in (403, 429):
+                now = time.time()
+                if retry_after is not None:
+                    b.paused_until = max(b.paused_until, now + retry_after)
+                elif remaining == 0 and reset:
+                    b.paused_until = max(b.paused_until, reset + 1)
+                elif status == 429:
+                    b.paused_until = max(b.paused_until, now + self.default_retry_sec)
+
+    def state(self) -> Dict[str, Dict[str, Any]]:
+        now = time.time()
+        out = {}
+        with self._lock:
+            for name, b in self._budgets.items():
+                out[name] = {
+                    "limit": b.limit,
+                    "remaining": b.remaining,
+                    "reset_in_sec": max(0, int(b.reset - now)) if b.reset else None,
+                    "pace_interval_sec": round(b.interval, 3),
+                    "paused_for_sec": round(max(0.0, b.paused_until - now), 1),
+                    "in_flight": b.in_flight,
+                }
+        return out
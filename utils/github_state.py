@@ -0,0 +1,72 @@
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# 승인 리포트에서 이미 처리한 PR 의 로컬 상태
+# - PR 이 open 이 아니고 updated_at 이 그대로면 저장된 approval 을 재사용
+#   (새 review 가 달리면 updated_at 이 바뀜)
+# - 그 외에는 다시 조회
+DEFAULT_PR_STATE_PATH = "./cache/github_pr_state.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pr_state (
+    repo        TEXT    NOT NULL,
+    number      INTEGER NOT NULL,
+    state       TEXT,
+    updated_at  TEXT,
+    approval    TEXT    NOT NULL,
+    checked_at  TEXT,
+    PRIMARY KEY (repo, number)
+);
+"""
+
+
+class PrStateStore:
+    def __init__(self, path: str = DEFAULT_PR_STATE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self.reused = 0
+        self.fetched = 0
+
+    def close(self) -> None:
+        self._db.close()
+
+    def get(self, owner: str, repo: str, pr: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if pr.get("state") == "open" or not pr.get("updated_at"):
+            return None
+        row = self._db.execute(
+            "SELECT updated_at, approval FROM pr_state WHERE repo = ? AND number = ?",
+            (f"{owner}/{repo}", pr["number"]),
+        ).fetchone()
+        if row is None or row[0] != pr["updated_at"]:
+            return None
+        self.reused += 1
+        return json.loads(row[1])
+
+    def put_many(self, owner: str, repo: str, items: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]]) -> None:
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = []
+        for pr, approval in items:
+            rows.append((
+                f"{owner}/{repo}",
+                pr["number"],
+                pr.get("state"),
+                pr.get("updated_at"),
+                json.dumps(approval, ensure_ascii=False),
+                now,
+            ))
+        self.fetched += len(rows)
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO pr_state (repo, number, state, updated_at, approval, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def stats(self) -> Dict[str, int]:
+        return {"reused": self.reused, "fetched": self.fetched}
@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# utils/ 의 스크립트는 같은 디렉터리 모듈을 바로 import 한다 (cd utils && python zip.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from github_fake import FakeGitHub  # noqa: E402
+
+
+def _merge(base: dict, over: dict) -> dict:
+    out = dict(base)
+    for k, v in over.items():
+        out[k] = _merge(out[k], v) if isinstance(v, dict) and isinstance(out.get(k), dict) else v
+    return out
+
+
+@pytest.fixture
+def fake_github():
+    server = FakeGitHub().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_gh(tmp_path):
+    """
+    base_url 을 로컬 서버로 둔 github.config.yml 을 만들고 GitHubAPI 생성
+    overrides 는 github: 아래에 병합 (dict 는 재귀 병합)
+    """
+    import github
+
+    def make(url: str, **overrides) -> "github.GitHubAPI":
+        gh = {
+            "token": "test-token",
+            "base_url": url + "/api/v3",
+            "timeout": 5,
+            "auto_rate_limit_wait": True,
+            "rate_limit": {"reserve": 5, "pace_below": 0.2, "max_concurrent": 10, "min_write_interval_sec": 0},
+            "max_retries": 2,
+            "retry_backoff_sec": 0.01,
+            "is_limit": False,
+            "transport": "session",
+            "review_workers": 4,
+            "page_workers": 4,
+            "pr_source": "rest",
+            "pr_state_path": "",
+            "http_cache": {"enabled": False, "dir": str(tmp_path / "http_cache")},
+        }
+        path = tmp_path / f"github_{len(list(tmp_path.glob('github_*.yml')))}.yml"
+        path.write_text(yaml.safe_dump({"github": _merge(gh, overrides)}), encoding="utf-8")
+        return github.GitHubAPI(str(path))
+
+    return make
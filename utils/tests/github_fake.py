@@ -0,0 +1,303 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+API = "/api/v3"
+
+
+class Request:
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes, peer: Tuple[str, int]):
+        parts = urlsplit(target)
+        self.method = method
+        self.target = target
+        self.path = parts.path
+        self.query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        self.headers = headers
+        self.body = body
+        self.peer = peer
+        self.match: Optional[re.Match] = None
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8")) if self.body else None
+
+
+# handler(req) → (status, headers, body) / body 가 dict, list 면 JSON 으로 보냄
+Handler = Callable[[Request], Tuple[int, Dict[str, str], Any]]
+
+
+class FakeGitHub:
+    """
+    thread 로 도는 HTTP/1.1 서버 (keep-alive). 요청 기록과 동시 처리 수(peak)를 남긴다.
+    route 는 (method, path 정규식) → handler
+    """
+
+    def __init__(self):
+        self.routes: List[Tuple[str, re.Pattern, Handler]] = []
+        self.requests: List[Request] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._httpd.block_on_close = False
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+
+    def route(self, method: str, pattern: str, handler: Handler) -> None:
+        self.routes.append((method, re.compile(pattern + "$"), handler))
+
+    def start(self) -> "FakeGitHub":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def paths(self, method: Optional[str] = None) -> List[str]:
+        with self._lock:
+            return [r.target for r in self.requests if method is None or r.method == method]
+
+    def _dispatch(self, req: Request) -> Tuple[int, Dict[str, str], Any]:
+        for method, pattern, handler in self.routes:
+            m = pattern.match(req.path)
+            if m and method == req.method:
+                req.match = m
+                return handler(req)
+        return 404, {}, {"message": "Not Found"}
+
+    def _handler_class(self):
+        fake = self
+
+        class H(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _serve(self):
+                n = int(self.headers.get("Content-Length") or 0)
+                req = Request(self.command, self.path, dict(self.headers.items()), self.rfile.read(n) if n else b"",
+                              self.client_address)
+                with fake._lock:
+                    fake.requests.append(req)
+                    fake.in_flight += 1
+                    fake.peak = max(fake.peak, fake.in_flight)
+                try:
+                    status, headers, body = fake._dispatch(req)
+                finally:
+                    with fake._lock:
+                        fake.in_flight -= 1
+
+                if isinstance(body, (dict, list)):
+                    data = json.dumps(body).encode("utf-8")
+                    headers = {"Content-Type": "application/json; charset=utf-8", **headers}
+                else:
+                    data = (body or "").encode("utf-8") if isinstance(body, str) else (body or b"")
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                if data and status != 304:
+                    self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _serve
+
+        return H
+
+
+def paginate(req: Request, items: List[Any], default_per_page: int = 30) -> Tuple[Dict[str, str], List[Any]]:
+    """
+    GitHub REST 와 같은 page/per_page 페이지와 Link(next/last) 헤더
+    """
+    per_page = int(req.query.get("per_page", default_per_page))
+    page = int(req.query.get("page", 1))
+    last = max(1, -(-len(items) // per_page))
+    host = req.headers.get("Host")
+
+    def link(p: int) -> str:
+        return f"http://{host}{req.path}?" + urlencode({**req.query, "page": p})
+
+    rels = []
+    if page < last:
+        rels.append(f'<{link(page + 1)}>; rel="next"')
+        rels.append(f'<{link(last)}>; rel="last"')
+    if page > 1:
+        rels.append(f'<{link(1)}>; rel="first"')
+    headers = {"Link": ", ".join(rels)} if rels else {}
+    return headers, items[(page - 1) * per_page:page * per_page]
+
+
+# ==================================================
+# PR / review 데이터를 REST 와 GraphQL 양쪽 모양으로 제공
+# ==================================================
+def _rest_login(actor: Optional[Dict[str, str]]) -> str:
+    if actor is None:
+        return "ghost"
+    return f"{actor['login']}[bot]" if actor.get("type") == "Bot" else actor["login"]
+
+
+def _gql_actor(actor: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    if actor is None:
+        return None
+    return {"login": actor["login"], "__typename": actor.get("type", "User")}
+
+
+def user(login: str, kind: str = "User") -> Dict[str, str]:
+    return {"login": login, "type": kind}
+
+
+class FakeRepo:
+    """
+    owner/repo 1개의 PR 목록.
+    pr: number, title, state(open/closed/merged), created_at, updated_at, author, reviews
+    review: id, state, submitted_at, author
+    """
+
+    def __init__(self, owner: str = "o", name: str = "r", review_delay: float = 0.0, gql_review_page: int = 100):
+        self.owner = owner
+        self.name = name
+        self.prs: List[Dict[str, Any]] = []
+        self.review_delay = review_delay
+        self.gql_review_page = gql_review_page
+        self.graphql_error: Optional[str] = None
+
+    def add_pr(self, number: int, created_at: str, author=None, state: str = "closed",
+               updated_at: Optional[str] = None, reviews: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        pr = {
+            "number": number,
+            "title": f"PR {number}",
+            "state": state,
+            "created_at": created_at,
+            "updated_at": updated_at or created_at,
+            "author": author,
+            "reviews": reviews or [],
+        }
+        self.prs.append(pr)
+        return pr
+
+    def _sorted(self) -> List[Dict[str, Any]]:
+        return sorted(self.prs, key=lambda p: p["created_at"], reverse=True)
+
+    def _html_url(self, pr) -> str:
+        return f"https://github.example/{self.owner}/{self.name}/pull/{pr['number']}"
+
+    # ---------- REST ----------
+    def rest_pr(self, pr) -> Dict[str, Any]:
+        return {
+            "number": pr["number"],
+            "title": pr["title"],
+            "state": "open" if pr["state"] == "open" else "closed",
+            "created_at": pr["created_at"],
+            "updated_at": pr["updated_at"],
+            "html_url": self._html_url(pr),
+            "user": {"login": _rest_login(pr["author"])},
+        }
+
+    def _search(self, q: str) -> List[Dict[str, Any]]:
+        author = re.search(r"author:(\S+)", q)
+        since = re.search(r"created:>=(\S+)", q)
+        state = re.search(r"state:(\w+)", q)
+        out = []
+        for pr in self._sorted():
+            if author and _rest_login(pr["author"]) != author.group(1) and (pr["author"] or {}).get("login") != author.group(1):
+                continue
+            if since and pr["created_at"][:10] < since.group(1):
+                continue
+            if state and ("open" if pr["state"] == "open" else "closed") != state.group(1):
+                continue
+            out.append(pr)
+        return out
+
+    def _rest_pulls(self, req: Request):
+        state = req.query.get("state", "open")
+        prs = [self.rest_pr(p) for p in self._sorted()
+               if state == "all" or ("open" if p["state"] == "open" else "closed") == state]
+        headers, page = paginate(req, prs)
+        return 200, headers, page
+
+    def _rest_reviews(self, req: Request):
+        if self.review_delay:
+            time.sleep(self.review_delay)
+        pr = self._get(int(req.match.group(1)))
+        reviews = [{
+            "id": r["id"],
+            "state": r["state"],
+            "submitted_at": r["submitted_at"],
+            "user": {"login": _rest_login(r["author"])},
+        } for r in pr["reviews"]]
+        headers, page = paginate(req, reviews)
+        return 200, headers, page
+
+    def _rest_search(self, req: Request):
+        items = [self.rest_pr(p) for p in self._search(req.query.get("q", ""))]
+        headers, page = paginate(req, items)
+        return 200, headers, {"total_count": len(items), "incomplete_results": False, "items": page}
+
+    def _get(self, number: int) -> Dict[str, Any]:
+        return next(p for p in self.prs if p["number"] == number)
+
+    # ---------- GraphQL ----------
+    def _gql_reviews(self, pr, after: Optional[str]) -> Dict[str, Any]:
+        start = int(after or 0)
+        chunk = pr["reviews"][start:start + self.gql_review_page]
+        end = start + len(chunk)
+        return {
+            "pageInfo": {"hasNextPage": end < len(pr["reviews"]), "endCursor": str(end)},
+            "nodes": [{
+                "databaseId": r["id"],
+                "state": r["state"],
+                "submittedAt": r["submitted_at"],
+                "author": _gql_actor(r["author"]),
+            } for r in chunk],
+        }
+
+    def gql_pr(self, pr) -> Dict[str, Any]:
+        return {
+            "number": pr["number"],
+            "title": pr["title"],
+            "state": pr["state"].upper(),
+            "createdAt": pr["created_at"],
+            "updatedAt": pr["updated_at"],
+            "url": self._html_url(pr),
+            "author": _gql_actor(pr["author"]),
+            "reviews": self._gql_reviews(pr, None),
+        }
+
+    @staticmethod
+    def _conn(nodes: List[Any], first: int, after: Optional[str]) -> Dict[str, Any]:
+        start = int(after or 0)
+        end = min(len(nodes), start + first)
+        return {"pageInfo": {"hasNextPage": end < len(nodes), "endCursor": str(end)}, "nodes": nodes[start:end]}
+
+    def _graphql(self, req: Request):
+        body = req.json()
+        query, v = body["query"], body["variables"]
+        if self.graphql_error:
+            return 200, {}, {"errors": [{"message": self.graphql_error}]}
+        if "search(" in query:
+            nodes = [self.gql_pr(p) for p in self._search(v["q"])]
+            return 200, {}, {"data": {"search": self._conn(nodes, v["first"], v.get("after"))}}
+        if "pullRequests(" in query:
+            states = v.get("states")
+            nodes = [self.gql_pr(p) for p in self._sorted() if not states or p["state"].upper() in states]
+            return 200, {}, {"data": {"repository": {"pullRequests": self._conn(nodes, v["first"], v.get("after"))}}}
+        pr = self._get(v["number"])
+        return 200, {}, {"data": {"repository": {"pullRequest": {"reviews": self._gql_reviews(pr, v.get("after"))}}}}
+
+    def install(self, server: FakeGitHub) -> "FakeRepo":
+        base = f"{API}/repos/{self.owner}/{self.name}"
+        server.route("GET", base + r"/pulls", self._rest_pulls)
+        server.route("GET", base + r"/pulls/(\d+)/reviews", self._rest_reviews)
+        server.route("GET", API + r"/search/issues", self._rest_search)
+        server.route("POST", r"/api/graphql", self._graphql)
+        return self
+
+
+def review(rid: int, state: str, at: str, author=None) -> Dict[str, Any]:
+    return {"id": rid, "state": state, "submitted_at": at, "author": author}
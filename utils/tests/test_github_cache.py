@@ -0,0 +1,142 @@
+import shutil
+
+import pytest
+
+from github_fake import API, paginate
+
+
+class Resource:
+    """
+    ETag / Last-Modified 를 주고 조건부 요청에는 304 로 답하는 GET 리소스
+    """
+
+    def __init__(self, body, etag='"v1"', last_modified=None, per_page=None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.per_page = per_page
+        self.status = []
+        self.conditional = []
+
+    def __call__(self, req):
+        headers = {}
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        body = self.body
+        if self.per_page:
+            link, body = paginate(req, self.body, self.per_page)
+            headers.update(link)
+
+        sent = {k.lower(): v for k, v in req.headers.items()}
+        cond = {k: sent[k] for k in ("if-none-match", "if-modified-since") if k in sent}
+        self.conditional.append(cond)
+        fresh = (self.etag and cond.get("if-none-match") == self.etag) or \
+                (not self.etag and self.last_modified and cond.get("if-modified-since") == self.last_modified)
+        status = 304 if fresh else 200
+        self.status.append(status)
+        return status, headers, (b"" if fresh else body)
+
+
+def _cached_gh(make_gh, url, tmp_path, **overrides):
+    cfg = {"http_cache": {"enabled": True, "dir": str(tmp_path / "http"), "max_mb": 200}}
+    cfg.update(overrides)
+    return make_gh(url, **cfg)
+
+
+def test_etag_revalidation_returns_cached_body(fake_github, make_gh, tmp_path):
+    res = Resource({"id": 1, "name": "x"})
+    fake_github.route("GET", API + "/repos/o/r", res)
+    gh = _cached_gh(make_gh, fake_github.url, tmp_path)
+
+    first = gh.request("GET", "/repos/o/r")
+    second = gh.request("GET", "/repos/o/r")
+
+    assert first == second == {"id": 1, "name": "x"}
+    assert res.status == [200, 304]
+    assert res.conditional[1] == {"if-none-match": '"v1"'}
+    assert gh.http_cache.stats() == {"hit_304": 1, "miss": 1, "stored": 1, "evicted": 0}
+
+
+def test_last_modified_revalidation(fake_github, make_gh, tmp_path):
+    res = Resource([1, 2, 3], etag=None, last_modified="Wed, 01 May 2024 00:00:00 GMT")
+    fake_github.route("GET", API + "/lm", res)
+    gh = _cached_gh(make_gh, fake_github.url, tmp_path)
+
+    assert gh.request("GET", "/lm") == gh.request("GET", "/lm") == [1, 2, 3]
+    assert res.status == [200, 304]
+    assert res.conditional[1] == {"if-modified-since": "Wed, 01 May 2024 00:00:00 GMT"}
+
+
+def test_changed_resource_replaces_entry(fake_github, make_gh, tmp_path):
+    res = Resource({"v": 1})
+    fake_github.route("GET", API + "/r", res)
+    gh = _cached_gh(make_gh, fake_github.url, tmp_path)
+
+    gh.request("GET", "/r")
+    res.body, res.etag = {"v": 2}, '"v2"'
+    assert gh.request("GET", "/r") == {"v": 2}
+    assert gh.request("GET", "/r") == {"v": 2}
+
+    assert res.status == [200, 200, 304]
+    assert res.conditional[2] == {"if-none-match": '"v2"'}
+
+
+def test_paginated_result_from_304_pages(fake_github, make_gh, tmp_path):
+    res = Resource(list(range(25)), per_page=10)
+    fake_github.route("GET", API + "/items", res)
+    gh = _cached_gh(make_gh, fake_github.url, tmp_path, page_workers=1)
+
+    first = gh.request("GET", "/items", params={"per_page": 10}, paginate=True)
+    second = gh.request("GET", "/items", params={"per_page": 10}, paginate=True)
+
+    # Link 헤더도 캐시에 남아 있어야 304 페이지에서 다음 페이지를 따라간다
+    assert first == second == list(range(25))
+    assert res.status == [200] * 3 + [304] * 3
+
+
+def test_cache_key_includes_token_and_skips_other_requests(fake_github, make_gh, tmp_path):
+    res = Resource({"ok": True})
+    nov = Resource({"ok": True}, etag=None)
+    fake_github.route("GET", API + "/k", res)
+    fake_github.route("GET", API + "/nov", nov)
+    fake_github.route("POST", API + "/k", res)
+    gh = _cached_gh(make_gh, fake_github.url, tmp_path)
+    other = _cached_gh(make_gh, fake_github.url, tmp_path, token="other-token")
+
+    gh.request("GET", "/k")
+    other.request("GET", "/k")
+    gh.request("POST", "/k", json={})
+    gh.request("GET", "/nov")
+    gh.request("GET", "/nov")
+
+    assert res.conditional == [{}, {}, {}]
+    assert nov.status == [200, 200]
+    assert gh.http_cache.stats()["stored"] == 1
+
+
+def test_lru_eviction_keeps_cache_under_max_mb(fake_github, make_gh, tmp_path):
+    big = "x" * (400 * 1024)
+    for n in range(4):
+        fake_github.route("GET", API + f"/big{n}", Resource(big, etag=f'"b{n}"'))
+    gh = _cached_gh(make_gh, fake_github.url, tmp_path, http_cache={"enabled": True, "dir": str(tmp_path / "http"), "max_mb": 1})
+
+    for n in range(4):
+        gh.request("GET", f"/big{n}")
+
+    files = list((tmp_path / "http").rglob("*.json"))
+    assert gh.http_cache.stats()["evicted"] >= 2
+    assert sum(f.stat().st_size for f in files) <= 1024 * 1024
+    # 가장 최근 entry 는 남아 있다
+    assert gh.http_cache.get(f"{gh.base_url}/big3", gh._headers()) is not None
+
+
+@pytest.mark.skipif(shutil.which("curl") is None, reason="curl not installed")
+def test_curl_transport_uses_the_same_cache(fake_github, make_gh, tmp_path):
+    res = Resource({"id": 7})
+    fake_github.route("GET", API + "/c", res)
+    gh = _cached_gh(make_gh, fake_github.url, tmp_path, transport="curl")
+
+    assert gh.request("GET", "/c") == gh.request("GET", "/c") == {"id": 7}
+    assert res.status == [200, 304]
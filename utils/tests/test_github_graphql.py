@@ -0,0 +1,90 @@
+import pytest
+
+import github
+from github_fake import FakeRepo, review, user
+
+
+def _repo() -> FakeRepo:
+    # GraphQL review 는 2개씩 받아서 review 페이지 이어받기도 지나가게 한다
+    repo = FakeRepo(gql_review_page=2)
+    bot = user("renovate", "Bot")
+    repo.add_pr(1, "2024-01-01T00:00:00Z", author=user("alice"), state="merged", updated_at="2024-01-09T00:00:00Z", reviews=[
+        review(11, "COMMENTED", "2024-01-02T00:00:00Z", user("bob")),
+        review(12, "APPROVED", "2024-01-03T00:00:00Z", user("bob")),
+        review(13, "CHANGES_REQUESTED", "2024-01-04T00:00:00Z", user("carol")),
+        review(14, "APPROVED", "2024-01-05T00:00:00Z", user("carol")),
+        review(15, "APPROVED", "2024-01-06T00:00:00Z", None),
+    ])
+    repo.add_pr(2, "2024-02-01T00:00:00Z", author=bot, state="open", reviews=[
+        review(21, "APPROVED", "2024-02-02T00:00:00Z", user("alice")),
+    ])
+    repo.add_pr(3, "2024-03-01T00:00:00Z", author=None, state="closed")
+    repo.add_pr(4, "2024-04-01T00:00:00Z", author=user("alice"), state="open", reviews=[
+        review(41, "APPROVED", "2024-04-02T00:00:00Z", bot),
+        review(42, "DISMISSED", "2024-04-03T00:00:00Z", user("bob")),
+    ])
+    repo.add_pr(5, "2024-05-01T00:00:00Z", author=user("bob"), state="closed", reviews=[
+        review(51, "APPROVED", "2024-05-02T00:00:00Z", user("alice")),
+    ])
+    return repo
+
+
+@pytest.fixture
+def clients(fake_github, make_gh):
+    _repo().install(fake_github)
+    rest = make_gh(fake_github.url, pr_source="rest")
+    gql = make_gh(fake_github.url, pr_source="graphql", graphql_page_size=2)
+    return rest, gql
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"state": "open"},
+    {"state": "closed"},
+    {"created_after": "2024-02-01"},
+    {"users": ["alice"]},
+    {"users": ["alice", "bob"], "state": "closed", "created_after": "2024-01-01"},
+])
+def test_graphql_matches_rest(clients, kwargs):
+    rest, gql = clients
+
+    expected = github.get_prs_created_by_users(rest, "o", "r", include_approval_events=True, **kwargs)
+    actual = github.get_prs_created_by_users(gql, "o", "r", include_approval_events=True, **kwargs)
+
+    assert expected
+    assert actual == expected
+
+
+def test_graphql_result_details(clients, fake_github):
+    _, gql = clients
+
+    result = {x["number"]: x for x in github.get_prs_created_by_users(gql, "o", "r", include_approval_events=True)}
+
+    assert result[1]["approvers"] == ["bob", "carol", "ghost"]
+    assert result[1]["state"] == "closed"
+    assert result[2]["author"] == "renovate[bot]"
+    assert result[3]["author"] == "ghost"
+    assert result[4]["approvers"] == ["renovate[bot]"]
+    # review 는 GraphQL 로 함께 받으므로 REST review 조회가 없다
+    assert not [p for p in fake_github.paths() if "/reviews" in p]
+    assert gql.graphql_url == fake_github.url + "/api/graphql"
+
+
+def test_graphql_error_falls_back_to_rest(fake_github, make_gh, capsys):
+    repo = _repo().install(fake_github)
+    repo.graphql_error = "Field 'search' is not available"
+    rest = make_gh(fake_github.url)
+    gql = make_gh(fake_github.url, pr_source="graphql")
+
+    actual = github.get_prs_created_by_users(gql, "o", "r")
+
+    assert "falling back to REST" in capsys.readouterr().out
+    assert actual == github.get_prs_created_by_users(rest, "o", "r")
+
+
+def test_graphql_data_raises_on_errors(fake_github, make_gh):
+    _repo().install(fake_github).graphql_error = "bad query"
+    gql = make_gh(fake_github.url, pr_source="graphql")
+
+    with pytest.raises(github.GitHubAPIError, match="bad query"):
+        gql.graphql_data("query { viewer { login } }")
@@ -0,0 +1,90 @@
+import shutil
+import threading
+import time
+from contextlib import closing
+
+import pytest
+
+from github_fake import API, paginate
+
+
+def _pages(fake_github, n_items=100, per_page=10, delay=0.05):
+    def handler(req):
+        if "page" in req.query:
+            time.sleep(delay)
+        headers, page = paginate(req, list(range(n_items)), per_page)
+        return 200, headers, page
+
+    fake_github.route("GET", API + "/items", handler)
+
+
+def _prefetch_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("ThreadPoolExecutor")]
+
+
+def test_iter_pages_is_lazy(fake_github, make_gh):
+    _pages(fake_github)
+    gh = make_gh(fake_github.url, page_workers=4)
+
+    pages = gh.iter_pages("/items")
+    assert fake_github.requests == []
+    assert next(pages) == list(range(10))
+    assert len(fake_github.requests) == 1
+    pages.close()
+
+
+def test_early_close_stops_prefetch(fake_github, make_gh):
+    _pages(fake_github)
+    gh = make_gh(fake_github.url, page_workers=3)
+    before = len(_prefetch_threads())
+
+    items = gh.iter_items("/items")
+    with closing(items):
+        got = [x for _, x in zip(range(15), items)]
+
+    assert got == list(range(15))
+    # 첫 페이지 + 동시에 받는 3페이지 + 소비 후 채운 1페이지까지만
+    requested = len(fake_github.requests)
+    assert requested <= 1 + 3 + 1
+    assert len(_prefetch_threads()) == before
+    time.sleep(0.2)
+    assert len(fake_github.requests) == requested
+
+
+def test_full_iteration_matches_paginated_request(fake_github, make_gh):
+    _pages(fake_github, delay=0)
+    gh = make_gh(fake_github.url)
+
+    assert list(gh.iter_items("/items")) == gh.request("GET", "/items", paginate=True) == list(range(100))
+
+
+def test_is_limit_yields_first_page_only(fake_github, make_gh):
+    _pages(fake_github, delay=0)
+    gh = make_gh(fake_github.url, is_limit=True)
+
+    assert list(gh.iter_pages("/items")) == [list(range(10))]
+    assert len(fake_github.requests) == 1
+
+
+def test_iter_items_with_item_key(fake_github, make_gh):
+    def search(req):
+        headers, page = paginate(req, [{"number": n} for n in range(25)], 10)
+        return 200, headers, {"total_count": 25, "items": page}
+
+    fake_github.route("GET", API + "/search/issues", search)
+    gh = make_gh(fake_github.url)
+
+    assert [it["number"] for it in gh.iter_items("/search/issues", item_key="items")] == list(range(25))
+
+
+@pytest.mark.skipif(shutil.which("curl") is None, reason="curl not installed")
+def test_curl_transport_early_close(fake_github, make_gh):
+    _pages(fake_github, delay=0)
+    gh = make_gh(fake_github.url, transport="curl", page_workers=2)
+
+    items = gh.iter_items("/items")
+    with closing(items):
+        got = [x for _, x in zip(range(12), items)]
+
+    assert got == list(range(12))
+    assert len(fake_github.requests) <= 1 + 2 + 1
@@ -0,0 +1,111 @@
+import time
+
+import pytest
+
+import github
+from github_fake import API, paginate
+
+
+class Pages:
+    def __init__(self, n_items, per_page=10, delay=0.0):
+        self.items = list(range(n_items))
+        self.per_page = per_page
+        self.delay = delay
+        self.on_first = None
+
+    def __call__(self, req):
+        if self.delay and "page" in req.query:
+            time.sleep(self.delay)
+        headers, page = paginate(req, self.items, self.per_page)
+        if self.on_first and "page" not in req.query:
+            self.on_first()
+        return 200, headers, page
+
+
+def test_pages_are_prefetched_in_order(fake_github, make_gh):
+    fake_github.route("GET", API + "/items", Pages(70, delay=0.15))
+    gh = make_gh(fake_github.url, page_workers=3)
+
+    t0 = time.monotonic()
+    result = gh.request("GET", "/items", paginate=True)
+    elapsed = time.monotonic() - t0
+
+    assert result == list(range(70))
+    # 나머지 6페이지를 3개씩 → 약 0.3 s (순차면 0.9 s)
+    assert 2 <= fake_github.peak <= 3
+    assert elapsed < 0.75
+
+
+def test_single_page_worker_is_sequential(fake_github, make_gh):
+    fake_github.route("GET", API + "/items", Pages(70, delay=0.02))
+    gh = make_gh(fake_github.url, page_workers=1)
+
+    assert gh.request("GET", "/items", paginate=True) == list(range(70))
+    assert fake_github.peak == 1
+    pages = [r.query.get("page") for r in fake_github.requests]
+    assert pages == [None, "2", "3", "4", "5", "6", "7"]
+
+
+def test_items_added_while_paging_are_followed(fake_github, make_gh):
+    res = Pages(30)
+    # 첫 페이지 이후 항목이 늘어남 → 처음 받은 rel="last" 다음 페이지가 생긴다
+    res.on_first = lambda: res.items.extend(range(30, 45))
+    fake_github.route("GET", API + "/items", res)
+    gh = make_gh(fake_github.url, page_workers=4)
+
+    assert gh.request("GET", "/items", paginate=True) == list(range(45))
+
+
+def test_links_without_page_numbers_are_followed_one_by_one(fake_github, make_gh):
+    def cursor(req):
+        after = int(req.query.get("after", 0))
+        headers = {}
+        if after + 10 < 35:
+            host = req.headers["Host"]
+            headers["Link"] = f'<http://{host}{API}/cursor?after={after + 10}>; rel="next"'
+        return 200, headers, list(range(after, min(after + 10, 35)))
+
+    fake_github.route("GET", API + "/cursor", cursor)
+    gh = make_gh(fake_github.url, page_workers=4)
+
+    assert gh.request("GET", "/cursor", paginate=True) == list(range(35))
+    assert fake_github.peak == 1
+
+
+def test_item_key_pages_are_merged(fake_github, make_gh):
+    def search(req):
+        headers, page = paginate(req, [{"number": n} for n in range(25)], 10)
+        return 200, headers, {"total_count": 25, "items": page}
+
+    fake_github.route("GET", API + "/search/issues", search)
+    gh = make_gh(fake_github.url, page_workers=3)
+
+    result = gh.request("GET", "/search/issues", params={"q": "x"}, paginate=True, item_key="items")
+
+    assert result["total_count"] == 25
+    assert [it["number"] for it in result["items"]] == list(range(25))
+
+
+def test_failed_page_raises(fake_github, make_gh):
+    res = Pages(50)
+
+    def flaky(req):
+        if req.query.get("page") == "3":
+            return 404, {}, {"message": "Not Found"}
+        return res(req)
+
+    fake_github.route("GET", API + "/items", flaky)
+    gh = make_gh(fake_github.url, page_workers=3)
+
+    with pytest.raises(github.GitHubAPIError) as ei:
+        gh.request("GET", "/items", paginate=True)
+    assert ei.value.status_code == 404
+
+
+def test_page_range(make_gh):
+    gh = make_gh("http://127.0.0.1:9")
+    base = "https://h/api/v3/x?per_page=10&page="
+    assert gh._page_range(base + "2", base + "4") == [base + "2", base + "3", base + "4"]
+    assert gh._page_range(base + "2", "https://h/api/v3/y?per_page=10&page=4") == []
+    assert gh._page_range(base + "2", "https://h/api/v3/x?per_page=20&page=4") == []
+    assert gh._page_range(base + "2", None) == []
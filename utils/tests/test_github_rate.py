@@ -0,0 +1,201 @@
+import threading
+import time
+
+import pytest
+
+import github
+import github_rate
+from github_fake import API, FakeRepo, review, user
+from github_rate import RateGovernor
+
+CORE = "https://h/api/v3/repos/o/r"
+SEARCH = "https://h/api/v3/search/issues"
+GRAPHQL = "https://h/api/graphql"
+
+
+class Clock:
+    # time.time / time.sleep 대체: sleep 하면 시각만 앞으로
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, sec):
+        self.sleeps.append(round(sec, 3))
+        self.now += sec
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = Clock()
+    monkeypatch.setattr(github_rate, "time", c)
+    return c
+
+
+def _limits(limit, remaining, reset, resource="core"):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(reset)),
+        "X-RateLimit-Resource": resource,
+    }
+
+
+def test_resources_and_write_calls():
+    gov = RateGovernor()
+    assert [gov.resource_for(u) for u in (CORE, SEARCH, GRAPHQL)] == ["core", "search", "graphql"]
+    assert gov.is_write(CORE, "post") and gov.is_write(CORE, "DELETE")
+    assert not gov.is_write(CORE, "GET")
+    assert gov.is_write(SEARCH, "GET")
+    assert not gov.is_write(GRAPHQL, "POST")
+
+
+def test_plenty_of_budget_sends_without_waiting(clock):
+    gov = RateGovernor()
+    for i in range(5):
+        gov.acquire(CORE)
+        gov.observe(CORE, 200, _limits(5000, 4999 - i, clock.now + 3600))
+    assert clock.sleeps == []
+    assert gov.state()["core"]["remaining"] == 4995
+    assert gov.state()["core"]["in_flight"] == 0
+
+
+def test_low_budget_is_spread_until_reset(clock):
+    gov = RateGovernor(reserve=5, pace_below=0.2)
+    gov.acquire(CORE)
+    gov.observe(CORE, 200, _limits(100, 20, clock.now + 150))
+
+    for _ in range(3):
+        gov.acquire(CORE)
+        gov.observe(CORE, 200, {})   # 헤더 없는 응답은 예산을 바꾸지 않는다
+
+    # 남은 15건(20 - reserve 5)을 150 초에 나눔 → 약 10 초 간격
+    assert clock.sleeps and all(8 <= s <= 11 for s in clock.sleeps)
+    assert len(clock.sleeps) == 2
+
+
+def test_reserve_pauses_until_reset(clock):
+    gov = RateGovernor(reserve=5)
+    reset = clock.now + 60
+    gov.acquire(CORE)
+    gov.observe(CORE, 200, _limits(5000, 5, reset))
+
+    gov.acquire(CORE)
+
+    assert clock.now >= reset + 1
+    assert clock.sleeps[0] == pytest.approx(61, abs=0.01)
+
+
+@pytest.mark.parametrize("status,headers,pause", [
+    (429, {"Retry-After": "30"}, 30),
+    (403, _limits(5000, 0, 1_000_000 + 90), 91),
+    (429, {}, 2.0),
+])
+def test_limit_responses_pause_the_resource(clock, status, headers, pause):
+    gov = RateGovernor(default_retry_sec=2.0)
+    gov.acquire(CORE)
+    gov.observe(CORE, status, headers)
+
+    gov.acquire(SEARCH)          # 다른 resource 는 멈추지 않는다
+    assert clock.sleeps == []
+    gov.acquire(CORE)
+    assert sum(clock.sleeps) == pytest.approx(pause, abs=0.01)
+
+
+def test_pause_disabled(clock):
+    gov = RateGovernor(pause_on_limit=False)
+    gov.acquire(CORE)
+    gov.observe(CORE, 429, {"Retry-After": "30"})
+    gov.acquire(CORE)
+    assert clock.sleeps == []
+
+
+def test_write_calls_are_spaced(clock):
+    gov = RateGovernor(min_write_interval=1.0)
+
+    def call(url, method="GET"):
+        gov.acquire(url, method)
+        gov.observe(url, 200, {})
+        return clock.now
+
+    t0 = clock.now
+    times = [call(CORE, "POST"), call(CORE, "GET"), call(CORE, "PATCH"), call(SEARCH), call(SEARCH), call(GRAPHQL, "POST")]
+
+    assert [round(t - t0, 3) for t in times] == [0, 0, 1.0, 1.0, 2.0, 2.0]
+
+
+def test_in_flight_cap_per_resource():
+    gov = RateGovernor(max_concurrent=2)
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def worker():
+        gov.acquire(CORE)
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        gov.observe(CORE, 200, {})
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert running[1] == 2
+    assert gov.state()["core"]["in_flight"] == 0
+
+
+def test_release_frees_slot_and_probe(clock):
+    gov = RateGovernor(max_concurrent=1)
+    gov.acquire(CORE)
+    gov.release(CORE)
+    gov.acquire(CORE)
+    assert clock.sleeps == []
+
+
+def test_observe_returns_the_slot_of_the_sent_resource(clock):
+    gov = RateGovernor(max_concurrent=1)
+    gov.acquire(SEARCH)
+    # 응답 헤더의 resource 가 달라도 동시 요청 수는 보낸 url 기준으로 돌려놓는다
+    gov.observe(SEARCH, 200, _limits(30, 29, clock.now + 60, resource="code_search"))
+    assert gov.state()["search"]["in_flight"] == 0
+    assert gov.state()["code_search"]["remaining"] == 29
+
+
+# ==================================================
+# GitHubAPI 연동
+# ==================================================
+def test_retry_after_pauses_before_the_retry(fake_github, make_gh):
+    calls = []
+
+    def limited(req):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return 429, {"Retry-After": "1"}, {"message": "secondary rate limit"}
+        return 200, _limits(5000, 4999, time.time() + 3600), {"ok": True}
+
+    fake_github.route("GET", API + "/user", limited)
+    gh = make_gh(fake_github.url)
+
+    assert gh.request("GET", "/user") == {"ok": True}
+    assert calls[1] - calls[0] >= 0.9
+    assert gh.rate_limit_state()["core"]["remaining"] == 4999
+
+
+def test_max_concurrent_bounds_review_fan_out(fake_github, make_gh):
+    repo = FakeRepo(review_delay=0.05)
+    for n in range(1, 9):
+        repo.add_pr(n, f"2024-01-{n:02d}T00:00:00Z", author=user("a"), reviews=[
+            review(n, "APPROVED", "2024-02-01T00:00:00Z", user("b")),
+        ])
+    repo.install(fake_github)
+    gh = make_gh(fake_github.url, review_workers=8, rate_limit={"max_concurrent": 2})
+
+    assert len(github.get_prs_created_by_users(gh, "o", "r")) == 8
+    assert fake_github.peak == 2
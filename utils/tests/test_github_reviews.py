@@ -0,0 +1,72 @@
+import time
+
+import github
+from github_fake import FakeRepo, review, user
+
+
+def _repo(n_prs: int = 8, delay: float = 0.0) -> FakeRepo:
+    repo = FakeRepo(review_delay=delay)
+    for n in range(1, n_prs + 1):
+        repo.add_pr(n, f"2024-01-{n:02d}T00:00:00Z", author=user("alice" if n % 2 else "bob"), reviews=[
+            review(n * 10, "COMMENTED", f"2024-02-{n:02d}T00:00:00Z", user("carol")),
+            review(n * 10 + 1, "APPROVED", f"2024-02-{n:02d}T02:00:00Z", user("dave")),
+            review(n * 10 + 2, "APPROVED", f"2024-02-{n:02d}T01:00:00Z", user("carol")),
+        ])
+    return repo
+
+
+def test_reviews_are_fetched_concurrently_in_pr_order(fake_github, make_gh):
+    _repo(delay=0.2).install(fake_github)
+    gh = make_gh(fake_github.url, review_workers=4)
+
+    t0 = time.monotonic()
+    result = github.get_prs_created_by_users(gh, "o", "r")
+    elapsed = time.monotonic() - t0
+
+    assert [x["number"] for x in result] == list(range(8, 0, -1))
+    # 8건 × 0.2 s 를 4개씩 → 약 0.4 s (순차면 1.6 s)
+    assert elapsed < 1.2
+    assert fake_github.peak >= 2
+    top = result[0]
+    assert top["author"] == "bob"
+    assert top["approvers"] == ["carol", "dave"]
+    assert (top["first_approved_at"], top["last_approved_at"]) == ("2024-02-08T01:00:00Z", "2024-02-08T02:00:00Z")
+
+
+def test_parallel_and_sequential_results_match(fake_github, make_gh):
+    _repo().install(fake_github)
+    gh = make_gh(fake_github.url)
+
+    parallel = github.get_prs_created_by_users(gh, "o", "r", include_approval_events=True, workers=8)
+    sequential = github.get_prs_created_by_users(gh, "o", "r", include_approval_events=True, workers=1)
+
+    assert parallel == sequential
+    assert [e["review_id"] for e in parallel[0]["approved_events"]] == [82, 81]
+
+
+def test_created_after_stops_before_older_pages(fake_github, make_gh):
+    repo = FakeRepo()
+    for n in range(1, 251):
+        repo.add_pr(n, f"2024-{1 + (n - 1) // 28:02d}-{1 + (n - 1) % 28:02d}T00:00:00Z", author=user("alice"))
+    repo.install(fake_github)
+    gh = make_gh(fake_github.url, page_workers=1)
+
+    result = github.get_prs_created_by_users(gh, "o", "r", created_after="2024-09-01")
+
+    assert [x["number"] for x in result] == list(range(250, 224, -1))
+    # 첫 페이지(100건) 안에서 멈추므로 2페이지 이후는 요청하지 않는다
+    pulls = [p for p in fake_github.paths("GET") if "/pulls?" in p]
+    assert len(pulls) == 1
+    reviewed = [p for p in fake_github.paths("GET") if "/reviews" in p]
+    assert len(reviewed) == len(result)
+
+
+def test_search_by_users_deduplicates_prs(fake_github, make_gh):
+    _repo().install(fake_github)
+    gh = make_gh(fake_github.url)
+
+    result = github.get_prs_created_by_users(gh, "o", "r", users=["alice", "bob", "alice"])
+
+    assert sorted(x["number"] for x in result) == list(range(1, 9))
+    assert {x["number"]: x["author"] for x in result}[3] == "alice"
+    assert len([p for p in fake_github.paths("GET") if "/reviews" in p]) == 8
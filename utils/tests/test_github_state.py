@@ -0,0 +1,79 @@
+import github
+from github_fake import FakeRepo, review, user
+from github_state import PrStateStore
+
+
+def _repo() -> FakeRepo:
+    repo = FakeRepo()
+    repo.add_pr(1, "2024-01-01T00:00:00Z", author=user("alice"), state="merged", reviews=[
+        review(11, "APPROVED", "2024-01-02T00:00:00Z", user("bob")),
+    ])
+    repo.add_pr(2, "2024-02-01T00:00:00Z", author=user("bob"), state="closed")
+    repo.add_pr(3, "2024-03-01T00:00:00Z", author=user("alice"), state="open", reviews=[
+        review(31, "APPROVED", "2024-03-02T00:00:00Z", user("carol")),
+    ])
+    return repo
+
+
+def _reviewed(fake_github):
+    return sorted(int(p.split("/pulls/")[1].split("/")[0]) for p in fake_github.paths() if "/reviews" in p)
+
+
+def test_store_reuses_only_unchanged_closed_prs(tmp_path):
+    store = PrStateStore(str(tmp_path / "state.sqlite"))
+    closed = {"number": 1, "state": "closed", "updated_at": "2024-01-09T00:00:00Z"}
+    opened = {"number": 2, "state": "open", "updated_at": "2024-01-09T00:00:00Z"}
+    approval = {"first_approved_at": "a", "last_approved_at": "b", "approvers": ["x"], "approved_events": []}
+    store.put_many("o", "r", [(closed, approval), (opened, approval)])
+
+    assert store.get("o", "r", closed) == approval
+    assert store.get("o", "r", opened) is None
+    assert store.get("o", "r", {**closed, "updated_at": "2024-01-10T00:00:00Z"}) is None
+    assert store.get("o", "other", closed) is None
+    assert store.get("o", "r", {"number": 1, "state": "closed"}) is None
+    assert store.stats() == {"reused": 1, "fetched": 2}
+    store.close()
+
+    # 다른 프로세스 실행에서도 남아 있다
+    again = PrStateStore(str(tmp_path / "state.sqlite"))
+    assert again.get("o", "r", closed) == approval
+    again.close()
+
+
+def test_second_run_only_refetches_open_or_updated_prs(fake_github, make_gh, tmp_path):
+    repo = _repo().install(fake_github)
+    path = str(tmp_path / "state.sqlite")
+
+    first = github.get_prs_created_by_users(make_gh(fake_github.url, pr_state_path=path), "o", "r")
+    assert _reviewed(fake_github) == [1, 2, 3]
+
+    fake_github.requests.clear()
+    gh = make_gh(fake_github.url, pr_state_path=path)
+    assert github.get_prs_created_by_users(gh, "o", "r") == first
+    assert _reviewed(fake_github) == [3]
+    assert gh.pr_state.stats() == {"reused": 2, "fetched": 1}
+
+    # 닫힌 PR 에 review 가 달리면 updated_at 이 바뀌어 다시 조회
+    pr2 = next(p for p in repo.prs if p["number"] == 2)
+    pr2["reviews"].append(review(21, "APPROVED", "2024-04-01T00:00:00Z", user("dave")))
+    pr2["updated_at"] = "2024-04-01T00:00:00Z"
+    fake_github.requests.clear()
+    gh = make_gh(fake_github.url, pr_state_path=path)
+    result = {x["number"]: x for x in github.get_prs_created_by_users(gh, "o", "r")}
+
+    assert _reviewed(fake_github) == [2, 3]
+    assert result[2]["approvers"] == ["dave"]
+
+
+def test_graphql_run_fills_the_store(fake_github, make_gh, tmp_path):
+    _repo().install(fake_github)
+    path = str(tmp_path / "state.sqlite")
+
+    gql = make_gh(fake_github.url, pr_source="graphql", pr_state_path=path)
+    expected = github.get_prs_created_by_users(gql, "o", "r")
+    assert gql.pr_state.stats()["fetched"] == 3
+
+    fake_github.requests.clear()
+    rest = make_gh(fake_github.url, pr_state_path=path)
+    assert github.get_prs_created_by_users(rest, "o", "r") == expected
+    assert _reviewed(fake_github) == [3]
@@ -0,0 +1,137 @@
+import socket
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, ProxyError as Urllib3ProxyError
+
+import github
+from github_fake import API
+
+
+class Proxy407:
+    """
+    모든 요청(CONNECT 포함)에 407 을 돌려주는 proxy
+    """
+
+    def __init__(self):
+        hits = self.hits = []
+
+        class H(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _deny(self):
+                hits.append((self.command, self.path))
+                self.send_response(407)
+                self.send_header("Proxy-Authenticate", 'Basic realm="corp"')
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            do_CONNECT = do_GET = do_POST = _deny
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), H)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True).start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def proxy407():
+    p = Proxy407()
+    yield p
+    p.stop()
+
+
+def _dead_url() -> str:
+    # 바로 닫은 포트 → 연결 거부
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+def _user(req):
+    return 200, {}, {"login": "me"}
+
+
+def test_session_reuses_one_connection_without_subprocess(fake_github, make_gh, monkeypatch):
+    fake_github.route("GET", API + "/user", _user)
+    gh = make_gh(fake_github.url)
+
+    def no_subprocess(*a, **kw):
+        raise AssertionError("session transport must not spawn curl")
+
+    monkeypatch.setattr(subprocess, "run", no_subprocess)
+    results = [gh.request("GET", "/user") for _ in range(5)]
+
+    assert results == [{"login": "me"}] * 5
+    assert len({r.peer for r in fake_github.requests}) == 1
+
+
+def test_transport_selection(fake_github, make_gh):
+    assert make_gh(fake_github.url).transport == "session"
+    assert make_gh(fake_github.url, transport="CURL").session is None
+    # transport 가 없으면 예전 is_session 설정을 따른다
+    assert make_gh(fake_github.url, transport=None, is_session=False).transport == "curl"
+    with pytest.raises(ValueError, match="unknown github.transport"):
+        make_gh(fake_github.url, transport="http2")
+
+
+@pytest.mark.parametrize("no_proxy", ["localhost,127.0.0.1", ["localhost", "127.0.0.1"]])
+def test_no_proxy_hosts_bypass_the_proxy(fake_github, make_gh, monkeypatch, no_proxy):
+    fake_github.route("GET", API + "/user", _user)
+    dead = _dead_url()
+    monkeypatch.setenv("HTTP_PROXY", dead)
+    gh = make_gh(fake_github.url, proxy={"http": dead, "https": dead, "no_proxy": no_proxy})
+
+    assert gh.request("GET", "/user") == {"login": "me"}
+    assert gh.session.trust_env is False
+
+
+def test_proxy_used_for_other_hosts(fake_github, make_gh):
+    dead = _dead_url()
+    gh = make_gh(fake_github.url, proxy={"http": dead, "no_proxy": "example.com"}, max_retries=0)
+
+    with pytest.raises(RuntimeError, match="Request failed after retries") as ei:
+        gh.request("GET", "/user")
+    assert isinstance(ei.value.__cause__, requests.exceptions.ProxyError)
+    assert not fake_github.requests
+
+
+def test_connect_407_raises_proxy_auth_error(make_gh, proxy407):
+    gh = make_gh("https://github.invalid", proxy={"https": proxy407.url})
+
+    with pytest.raises(github.ProxyAuthError) as ei:
+        gh.request("GET", "/user")
+
+    assert ei.value.status_code == 407
+    assert [m for m, _ in proxy407.hits] == ["CONNECT"]   # 재시도하지 않는다
+    assert gh.rate_limit_state()["core"]["in_flight"] == 0
+
+
+def test_plain_http_407_response_raises_proxy_auth_error(make_gh, proxy407):
+    gh = make_gh("http://github.invalid", proxy={"http": proxy407.url})
+
+    with pytest.raises(github.ProxyAuthError, match='Proxy-Authenticate: Basic realm="corp"'):
+        gh.request("GET", "/user")
+    assert len(proxy407.hits) == 1
+
+
+def _chained(message: str) -> requests.exceptions.ProxyError:
+    cause = Urllib3ProxyError("Unable to connect to proxy", OSError(message))
+    return requests.exceptions.ProxyError(MaxRetryError(None, "https://x", cause))
+
+
+def test_proxy_error_status_from_exception_chain():
+    assert github._proxy_error_status(_chained("Tunnel connection failed: 407 Proxy Authentication Required")) == 407
+    assert github._proxy_error_status(_chained("Tunnel connection failed: 403 Forbidden")) == 403
+    assert github._proxy_error_status(_chained("Connection refused")) is None
+    assert github._proxy_error_status(requests.exceptions.ProxyError("boom")) is None
@@ -0,0 +1,96 @@
+import os
+import threading
+import zipfile
+import zlib
+
+import pytest
+
+import zip as zp
+
+MTIME = 1_700_000_000
+
+
+def _write(path, data: bytes):
+    path.write_bytes(data)
+    os.utime(path, (MTIME, MTIME))
+    return path
+
+
+@pytest.mark.parametrize("level", [None, 1, 9])
+def test_compress_entry_matches_zlib_stream(tmp_path, level):
+    # RAW_COPY_BUF 보다 큰 파일: 여러 chunk 로 나눠 압축해도 한 번에 압축한 것과 같아야 한다
+    data = os.urandom(300_000) + b"z" * (zp.RAW_COPY_BUF * 2)
+    src = _write(tmp_path / "big.bin", data)
+    zi = zipfile.ZipInfo("big.bin")
+    zi.compress_type = zipfile.ZIP_DEFLATED
+
+    info, blob = zp.compress_entry(zi, src, level)
+
+    co = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if level is None else level, zlib.DEFLATED, -15)
+    assert blob == co.compress(data) + co.flush()
+    assert (info.file_size, info.CRC, info.compress_size) == (len(data), zlib.crc32(data), len(blob))
+
+
+def test_compress_entry_stored(tmp_path):
+    src = _write(tmp_path / "s.bin", b"stored bytes")
+    zi = zipfile.ZipInfo("s.bin")
+    zi.compress_type = zipfile.ZIP_STORED
+
+    info, blob = zp.compress_entry(zi, src)
+
+    assert blob == b"stored bytes"
+    assert info.compress_size == info.file_size == len(blob)
+
+
+@pytest.fixture
+def patch_set(tmp_path):
+    src_zip = tmp_path / "src.zip"
+    with zipfile.ZipFile(src_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i in range(30):
+            zf.writestr(f"e/{i}.txt", f"old {i}")
+        zf.writestr("s/stored.bin", b"s" * 100, compress_type=zipfile.ZIP_STORED)
+    patch_map = {f"e/{i}.txt": _write(tmp_path / f"p{i}.txt", (f"new {i} " * 5000).encode()) for i in range(0, 30, 2)}
+    patch_map["s/stored.bin"] = _write(tmp_path / "stored.bin", os.urandom(2000))
+    patch_map["add/n.txt"] = _write(tmp_path / "n.txt", b"added " * 1000)
+    return src_zip, patch_map
+
+
+def test_parallel_output_is_byte_identical_to_sequential(tmp_path, patch_set):
+    src_zip, patch_map = patch_set
+    seq, par = tmp_path / "seq.zip", tmp_path / "par.zip"
+
+    assert zp.rebuild_zip_to_new(src_zip, seq, patch_map, compress_workers=1) == (16, 15, 1)
+    assert zp.rebuild_zip_to_new(src_zip, par, patch_map, compress_workers=4) == (16, 15, 1)
+
+    assert seq.read_bytes() == par.read_bytes()
+    with zipfile.ZipFile(par) as zf:
+        assert zf.testzip() is None
+        assert zf.getinfo("s/stored.bin").compress_type == zipfile.ZIP_STORED
+
+
+def test_compressed_blobs_waiting_for_write_are_bounded(tmp_path, patch_set, monkeypatch):
+    src_zip, patch_map = patch_set
+    workers = 2
+    lock = threading.Lock()
+    waiting = {"now": 0, "max": 0}
+    compress, write = zp.compress_entry, zp.write_precompressed
+
+    def counting_compress(*args):
+        result = compress(*args)
+        with lock:
+            waiting["now"] += 1
+            waiting["max"] = max(waiting["max"], waiting["now"])
+        return result
+
+    def counting_write(*args):
+        with lock:
+            waiting["now"] -= 1
+        return write(*args)
+
+    monkeypatch.setattr(zp, "compress_entry", counting_compress)
+    monkeypatch.setattr(zp, "write_precompressed", counting_write)
+
+    zp.rebuild_zip_to_new(src_zip, tmp_path / "out.zip", patch_map, compress_workers=workers)
+
+    assert waiting["now"] == 0
+    assert 0 < waiting["max"] <= workers * 2
@@ -0,0 +1,74 @@
+import os
+import zipfile
+
+import pytest
+
+import zip_index
+
+
+def _make_zip(path, entries):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in entries.items():
+            zf.writestr(name, data)
+    return path
+
+
+def _fields(infos):
+    return [(i.filename, i.date_time, i.compress_size, i.file_size, i.CRC, i.header_offset, i.compress_type, i.flag_bits)
+            for i in infos]
+
+
+def test_second_read_comes_from_cache_without_opening_zip(tmp_path, monkeypatch):
+    src = _make_zip(tmp_path / "a.zip", {"x.txt": "x", "d/y.txt": "y" * 100})
+    cache = tmp_path / "idx"
+
+    infos, complete = zip_index.read_zip_index(src, str(cache))
+    assert complete
+    assert len(list(cache.iterdir())) == 1
+
+    def no_open(*args, **kwargs):
+        raise AssertionError("zip opened on cache hit")
+
+    monkeypatch.setattr(zip_index.zipfile, "ZipFile", no_open)
+    cached, complete = zip_index.read_zip_index(src, str(cache))
+
+    assert not complete
+    assert _fields(cached) == _fields(infos)
+
+
+def test_cache_is_rebuilt_when_zip_changes(tmp_path):
+    src = _make_zip(tmp_path / "a.zip", {"x.txt": "x"})
+    cache = str(tmp_path / "idx")
+    zip_index.load_zip_index(src, cache)
+
+    _make_zip(src, {"x.txt": "x", "new.txt": "n"})
+    st = src.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    infos, complete = zip_index.read_zip_index(src, cache)
+    assert complete
+    assert [i.filename for i in infos] == ["x.txt", "new.txt"]
+
+
+@pytest.mark.parametrize("cache_dir", ["", None])
+def test_no_cache_dir_reads_zip_every_time(tmp_path, cache_dir):
+    src = _make_zip(tmp_path / "a.zip", {"x.txt": "x"})
+
+    infos, complete = zip_index.read_zip_index(src, cache_dir)
+
+    assert complete
+    assert [i.filename for i in infos] == ["x.txt"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.zip"]
+
+
+def test_corrupt_index_file_is_ignored(tmp_path):
+    src = _make_zip(tmp_path / "a.zip", {"x.txt": "x"})
+    cache = tmp_path / "idx"
+    zip_index.load_zip_index(src, str(cache))
+    idx_file = next(cache.iterdir())
+    idx_file.write_text("{not json")
+
+    infos, complete = zip_index.read_zip_index(src, str(cache))
+
+    assert complete
+    assert [i.filename for i in infos] == ["x.txt"]
@@ -0,0 +1,95 @@
+import zipfile
+
+import pytest
+import yaml
+
+import zip as zp
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    (root / "a").mkdir(parents=True)
+    (root / "a" / "x.txt").write_text("patched x")
+    (root / "a" / "new.txt").write_text("added")
+
+    filelist = tmp_path / "filelist.txt"
+    filelist.write_text("a/x.txt\na/new.txt\n")
+
+    def make_zip(path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("a/x.txt", "old x")
+            zf.writestr("a/keep.txt", f"keep {path}")
+        return path
+
+    def write_config(zip_files, **extra):
+        cfg = {
+            "zip_files": [str(p) for p in zip_files],
+            "root_path": str(root),
+            "filelist": str(filelist),
+            "out_path": str(tmp_path / "out"),
+            "is_backup": False,
+            "is_confirm": False,
+            "workers": 2,
+            "compress_workers": 2,
+            "index_cache_dir": str(tmp_path / "index"),
+            **extra,
+        }
+        path = tmp_path / "zip.config.yml"
+        path.write_text(yaml.safe_dump(cfg))
+        monkeypatch.setattr(zp, "CONFIG_FILE", str(path))
+
+    return tmp_path, make_zip, write_config, filelist
+
+
+def test_parallel_patches_every_zip(workspace, capsys):
+    tmp_path, make_zip, write_config, _ = workspace
+    zips = [make_zip(tmp_path / "in" / f"z{i}.jar") for i in range(3)]
+    write_config(zips)
+
+    zp.main()
+
+    out = capsys.readouterr().out
+    assert "✔ DONE: 3/3 zip" in out
+    assert out.count("[SKIP CONFIRM]") == 1
+    for src in zips:
+        with zipfile.ZipFile(tmp_path / "out" / src.name) as zf:
+            assert zf.read("a/x.txt") == b"patched x"
+            assert zf.read("a/new.txt") == b"added"
+            assert zf.read("a/keep.txt") == f"keep {src}".encode()
+
+
+def test_parallel_rejects_same_file_name(workspace, capsys):
+    tmp_path, make_zip, write_config, _ = workspace
+    write_config([make_zip(tmp_path / "in1" / "app.jar"), make_zip(tmp_path / "in2" / "app.jar")])
+
+    zp.main()
+
+    assert "[DUPLICATE] app.jar" in capsys.readouterr().out
+    assert not (tmp_path / "out" / "app.jar").exists()
+
+
+def test_sequential_allows_same_file_name(workspace, capsys):
+    tmp_path, make_zip, write_config, _ = workspace
+    write_config([make_zip(tmp_path / "in1" / "app.jar"), make_zip(tmp_path / "in2" / "app.jar")], workers=1)
+
+    zp.main()
+
+    out = capsys.readouterr().out
+    assert "[DUPLICATE]" not in out
+    assert "✔ DONE: 2/2 zip" in out
+
+
+def test_parallel_miss_aborts_once_before_any_work(workspace, capsys):
+    tmp_path, make_zip, write_config, filelist = workspace
+    filelist.write_text("a/x.txt\na/missing.txt\n")
+    zips = [make_zip(tmp_path / "in" / f"z{i}.jar") for i in range(2)]
+    write_config(zips)
+
+    zp.main()
+
+    out = capsys.readouterr().out
+    assert out.count("✖ ABORT: miss(1) / 2 zip") == 1
+    assert "[SKIP CONFIRM]" not in out
+    assert not any((tmp_path / "out" / z.name).exists() for z in zips)
@@ -0,0 +1,97 @@
+import os
+import struct
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import zip_print as zp
+
+
+def class_bytes(internal_name: str) -> bytes:
+    name = internal_name.encode()
+    pool = b"\x01" + struct.pack(">H", len(name)) + name + b"\x07" + struct.pack(">H", 1)
+    return b"\xca\xfe\xba\xbe\x00\x00\x00\x34" + struct.pack(">H", 3) + pool + struct.pack(">HHH", 0x21, 2, 0)
+
+
+@pytest.fixture
+def cfg(tmp_path):
+    jar = tmp_path / "cfr.jar"
+    jar.write_bytes(b"cfr v1")
+    return {"cfr_jar": str(jar), "use_javap_fallback": False, "decompile_class": True, "decompile_batch": True}
+
+
+def test_put_then_get(tmp_path, cfg):
+    cache = zp.DecompileCache(str(tmp_path / "c"), 10)
+    data = class_bytes("a/B")
+
+    assert cache.get(data, cfg) is None
+    cache.put(data, cfg, zp.TOOL_CFR, "class B {}")
+
+    assert cache.get(data, cfg) == "class B {}"
+    assert (cache.hit, cache.miss) == (1, 1)
+
+
+@pytest.mark.parametrize("tool", [zp.TOOL_JAVAP, zp.TOOL_ERROR])
+def test_results_of_other_tools_are_not_stored(tmp_path, cfg, tool):
+    cache = zp.DecompileCache(str(tmp_path / "c"), 10)
+    data = class_bytes("a/B")
+
+    cache.put(data, cfg, tool, "fallback output")
+
+    assert cache.get(data, cfg) is None
+    assert not (tmp_path / "c").exists()
+
+
+def test_key_depends_on_decompiler_identity(tmp_path, cfg):
+    data = class_bytes("a/B")
+    cache = zp.DecompileCache(str(tmp_path / "c"), 10)
+    cache.put(data, cfg, zp.TOOL_CFR, "v1 output")
+
+    Path(cfg["cfr_jar"]).write_bytes(b"cfr v2")
+    assert zp.DecompileCache(str(tmp_path / "c"), 10).get(data, cfg) is None
+
+    Path(cfg["cfr_jar"]).write_bytes(b"cfr v1")
+    assert zp.DecompileCache(str(tmp_path / "c"), 10).get(data, {**cfg, "decompile_batch": False}) is None
+    assert zp.DecompileCache(str(tmp_path / "c"), 10).get(data, cfg) == "v1 output"
+
+
+def test_evict_removes_least_recently_used_first(tmp_path, cfg):
+    cache = zp.DecompileCache(str(tmp_path / "c"), 1)
+    blobs = [class_bytes(f"a/C{i}") for i in range(3)]
+    for i, data in enumerate(blobs):
+        cache.put(data, cfg, zp.TOOL_CFR, "x" * 400_000)
+        p = cache._path(data, cfg)
+        os.utime(p, (1_000_000 + i, 1_000_000 + i))
+    cache.get(blobs[0], cfg)   # C0 을 최근 사용으로 갱신
+
+    assert cache.evict() == 1
+    assert cache.get(blobs[1], cfg) is None
+    assert cache.get(blobs[0], cfg) is not None
+    assert cache.get(blobs[2], cfg) is not None
+
+
+def test_cache_hit_skips_the_decompiler(tmp_path, cfg, monkeypatch, capsys):
+    src = tmp_path / "app.jar"
+    with zipfile.ZipFile(src, "w") as zf:
+        zf.writestr("a/B.class", class_bytes("a/B"))
+    calls = []
+
+    def fake_cfr(cmd, timeout_sec=60):
+        calls.append(cmd)
+        out_dir = Path(cmd[cmd.index("--outputdir") + 1])
+        (out_dir / "a").mkdir(parents=True, exist_ok=True)
+        (out_dir / "a" / "B.java").write_text("class B {}\n")
+        return 0, ""
+
+    monkeypatch.setattr(zp, "run_cmd", fake_cfr)
+    outputs = []
+    for _ in range(2):
+        cache = zp.DecompileCache(str(tmp_path / "c"), 10)
+        with zipfile.ZipFile(src) as zf:
+            zp.print_zip_sources(src, zf, ["a/B.class"], cfg, cache)
+        outputs.append(capsys.readouterr().out)
+
+    assert len(calls) == 1
+    assert "class B {}" in outputs[1]
+    assert outputs[0] == outputs[1]
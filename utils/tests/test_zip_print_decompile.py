@@ -0,0 +1,126 @@
+import struct
+import time
+from pathlib import Path
+
+import pytest
+
+import zip_print as zp
+
+
+def class_bytes(internal_name: str) -> bytes:
+    # 최소 .class: constant pool = [Long, Utf8 name, Class -> name], this_class = Class
+    name = internal_name.encode()
+    pool = [
+        b"\x05" + struct.pack(">q", 42),                 # #1-2 (long 은 2칸)
+        b"\x01" + struct.pack(">H", len(name)) + name,   # #3
+        b"\x07" + struct.pack(">H", 3),                  # #4
+    ]
+    return b"\xca\xfe\xba\xbe\x00\x00\x00\x34" + struct.pack(">H", 5) + b"".join(pool) + struct.pack(">HHH", 0x21, 4, 0)
+
+
+class FakeCfr:
+    """
+    run_cmd 대체: CFR 처럼 --outputdir 아래 <this_class>.java 를 만든다.
+    inner class(A$B)는 CFR 과 같이 따로 파일을 만들지 않는다.
+    """
+
+    def __init__(self, sleep_sec: float = 0.0):
+        self.sleep_sec = sleep_sec
+        self.calls: list[list[str]] = []
+        self.timeouts: list[float] = []
+
+    def __call__(self, cmd, timeout_sec=60):
+        self.calls.append(cmd)
+        self.timeouts.append(timeout_sec)
+        if self.sleep_sec:
+            time.sleep(min(self.sleep_sec, timeout_sec))
+            if timeout_sec < self.sleep_sec:
+                return 124, "[ERROR] command timeout"
+        out_dir = Path(cmd[cmd.index("--outputdir") + 1])
+        for f in cmd[3:cmd.index("--outputdir")]:
+            name = zp.class_internal_name(Path(f).read_bytes())
+            if "$" in name:
+                continue
+            java = out_dir / f"{name}.java"
+            java.parent.mkdir(parents=True, exist_ok=True)
+            java.write_text(f"// source of {name}\n")
+        return 0, ""
+
+
+@pytest.fixture
+def cfg(tmp_path):
+    jar = tmp_path / "cfr.jar"
+    jar.write_bytes(b"")
+    return {"cfr_jar": str(jar), "use_javap_fallback": False, "decompile_timeout": 30}
+
+
+def test_class_internal_name():
+    assert zp.class_internal_name(class_bytes("com/foo/Bar$Inner")) == "com/foo/Bar$Inner"
+    assert zp.class_internal_name(b"not a class") is None
+    assert zp.class_internal_name(class_bytes("a/B")[:20]) is None
+
+
+def test_match_java_source():
+    java = {"a/B": Path("a/B.java"), "C": Path("C.java")}
+    assert zp._match_java_source("a/B", java) == Path("a/B.java")
+    assert zp._match_java_source("a/B$In$Deep", java) == Path("a/B.java")
+    assert zp._match_java_source("C$1", java) == Path("C.java")
+    assert zp._match_java_source("a/Bx", java) is None
+
+
+def test_batch_maps_output_by_class_name_in_one_run(cfg, monkeypatch):
+    fake = FakeCfr()
+    monkeypatch.setattr(zp, "run_cmd", fake)
+    classes = {
+        "BOOT-INF/classes/com/x/A.class": class_bytes("com/x/A"),
+        "WEB-INF/classes/com/x/B.class": class_bytes("com/x/B"),
+    }
+
+    results = zp.decompile_classes_batch(classes, cfg)
+
+    assert len(fake.calls) == 1
+    assert results["BOOT-INF/classes/com/x/A.class"] == (zp.TOOL_CFR, "// source of com/x/A\n")
+    assert results["WEB-INF/classes/com/x/B.class"] == (zp.TOOL_CFR, "// source of com/x/B\n")
+
+
+def test_inner_class_output_names_the_outer_source(cfg, monkeypatch):
+    monkeypatch.setattr(zp, "run_cmd", FakeCfr())
+    classes = {"a/Outer.class": class_bytes("a/Outer"), "a/Outer$Inner.class": class_bytes("a/Outer$Inner")}
+
+    results = zp.decompile_classes_batch(classes, cfg)
+
+    assert results["a/Outer.class"] == (zp.TOOL_CFR, "// source of a/Outer\n")
+    tool, text = results["a/Outer$Inner.class"]
+    assert tool == zp.TOOL_CFR
+    first, rest = text.split("\n", 1)
+    assert "a/Outer$Inner" in first and "a/Outer.java" in first
+    assert rest == "// source of a/Outer\n"
+
+
+def test_chunks_share_one_batch_deadline(cfg, monkeypatch):
+    fake = FakeCfr(sleep_sec=0.4)
+    monkeypatch.setattr(zp, "run_cmd", fake)
+    monkeypatch.setattr(zp, "CFR_MAX_ARGS_LEN", 1)   # class 1개당 CFR 1회
+    cfg["decompile_timeout"] = 1
+    classes = {f"p/C{i}.class": class_bytes(f"p/C{i}") for i in range(6)}
+
+    t0 = time.monotonic()
+    results = zp.decompile_classes_batch(classes, cfg)
+    elapsed = time.monotonic() - t0
+
+    assert elapsed < 1.5
+    assert len(fake.calls) < len(classes)
+    assert all(b < a for a, b in zip(fake.timeouts, fake.timeouts[1:]))
+    assert fake.timeouts[0] <= 1
+    errors = [text for tool, text in results.values() if tool == zp.TOOL_ERROR]
+    assert errors and all("CFR batch timeout" in text for text in errors)
+
+
+def test_missing_output_without_javap_reports_cfr_error(cfg, monkeypatch):
+    monkeypatch.setattr(zp, "run_cmd", lambda cmd, timeout_sec=60: (1, "boom"))
+
+    results = zp.decompile_classes_batch({"a/B.class": class_bytes("a/B")}, cfg)
+
+    tool, text = results["a/B.class"]
+    assert tool == zp.TOOL_ERROR
+    assert "CFR failed (rc=1)" in text and "boom" in text
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import struct
+import zipfile
+import zlib
+
+import pytest
+
+import zip_print as zp
+from zip_index import iter_central_directory, hash_entry
+
+
+def _make_zip(path, entries, compression=zipfile.ZIP_DEFLATED, prefix=b""):
+    with open(path, "wb") as f:
+        f.write(prefix)
+        with zipfile.ZipFile(f, "w", compression) as zf:
+            for name, data in entries.items():
+                zf.writestr(name, data)
+    return path
+
+
+@pytest.mark.parametrize("prefix", [b"", b"#!/bin/sh\nexit 0\n" * 10])
+def test_central_directory_stream_matches_zipfile(tmp_path, prefix):
+    path = _make_zip(tmp_path / "a.zip", {"x.txt": "x" * 1000, "한글/이름.txt": "k", "d/": ""}, prefix=prefix)
+
+    entries = list(iter_central_directory(path))
+
+    with zipfile.ZipFile(path) as zf:
+        expected = [(i.filename, i.CRC, i.file_size, i.compress_size, i.compress_type, i.date_time, i.header_offset)
+                    for i in zf.infolist()]
+        assert [tuple(e) for e in entries] == expected
+        with open(path, "rb") as fp:
+            for e in entries:
+                assert hash_entry(fp, e) == hashlib.sha256(zf.read(e.filename)).hexdigest()
+
+
+def test_central_directory_stream_reads_zip64_fields(tmp_path):
+    path = tmp_path / "z64.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zf.open("big.txt", "w", force_zip64=True) as w:
+            w.write(b"b" * 1000)
+
+    (entry,) = iter_central_directory(path)
+
+    assert (entry.filename, entry.file_size, entry.CRC) == ("big.txt", 1000, zlib.crc32(b"b" * 1000))
+
+
+def test_diff_reports_added_removed_changed(tmp_path, capsys):
+    left = _make_zip(tmp_path / "l.zip", {"same.txt": "s", "gone.txt": "g", "mod.txt": "v1", "dir/": ""})
+    right = _make_zip(tmp_path / "r.zip", {"same.txt": "s", "mod.txt": "v2!", "new.txt": "n", "dir/": ""})
+    report = tmp_path / "report.jsonl"
+
+    with open(report, "w", encoding="utf-8") as fp:
+        counts = zp.diff_zip(left, right, {}, fp)
+
+    assert counts == {"added": 1, "removed": 1, "changed": 1, "same": 1, "hashed": 0}
+    out = capsys.readouterr().out
+    assert "[ADDED]" in out and "new.txt" in out
+    assert "[REMOVED]" in out and "gone.txt" in out
+    recs = {r["name"]: r for r in map(json.loads, report.read_text(encoding="utf-8").splitlines())}
+    assert {n: r["status"] for n, r in recs.items()} == {"mod.txt": "CHANGED", "new.txt": "ADDED", "gone.txt": "REMOVED"}
+    assert recs["mod.txt"]["before"]["size"] == 2 and recs["mod.txt"]["after"]["size"] == 3
+
+
+def _same_crc_pair(tmp_path):
+    # 내용은 다르지만 CRC/크기가 같은 entry: 우측 zip 의 CRC 필드를 좌측 값으로 덮어쓴다
+    a, b = b"aaaa", b"bbbb"
+    left = _make_zip(tmp_path / "l.zip", {"f.bin": a}, zipfile.ZIP_STORED)
+    right = _make_zip(tmp_path / "r.zip", {"f.bin": b}, zipfile.ZIP_STORED)
+    raw = right.read_bytes()
+    old, new = struct.pack("<L", zlib.crc32(b)), struct.pack("<L", zlib.crc32(a))
+    assert raw.count(old) == 2   # local header + central directory
+    right.write_bytes(raw.replace(old, new))
+    return left, right
+
+
+def test_hash_check_only_when_enabled(tmp_path, capsys):
+    left, right = _same_crc_pair(tmp_path)
+
+    assert zp.diff_zip(left, right, {})["same"] == 1
+
+    counts = zp.diff_zip(left, right, {"diff_verify_hash": True})
+    assert (counts["changed"], counts["hashed"]) == (1, 1)
+    assert "(crc collision)" in capsys.readouterr().out
+
+
+def test_diff_handles_many_entries(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(zp, "DIFF_INSERT_BATCH", 7)
+    left = _make_zip(tmp_path / "l.zip", {f"e{i:03d}": str(i) for i in range(100)})
+    right = _make_zip(tmp_path / "r.zip", {f"e{i:03d}": str(i) if i != 50 else "x" for i in range(1, 101)})
+
+    counts = zp.diff_zip(left, right, {})
+
+    assert (counts["added"], counts["removed"], counts["changed"], counts["same"]) == (1, 1, 1, 98)
+
+
+def test_run_diff_exit_code(tmp_path, capsys):
+    a = _make_zip(tmp_path / "a.zip", {"x": "1"})
+    b = _make_zip(tmp_path / "b.zip", {"x": "2"})
+
+    assert zp.run_diff({"zip_files": [str(a), str(a)]}) == 0
+    assert zp.run_diff({"zip_files": [str(a), str(b)]}) == 1
+    assert zp.run_diff({"zip_files": [str(a)]}) == 2
+    assert zp.run_diff({"zip_files": [str(a), str(tmp_path / "none.zip")]}) == 2
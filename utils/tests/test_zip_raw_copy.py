@@ -0,0 +1,113 @@
+import io
+import os
+import struct
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import zip as zp
+
+
+def _local_record(zip_path: Path, info: zipfile.ZipInfo) -> bytes:
+    # local header + 이름/extra + 압축 데이터 (data descriptor 제외)
+    with open(zip_path, "rb") as f:
+        f.seek(info.header_offset)
+        header = f.read(30)
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        return header + f.read(name_len + extra_len + info.compress_size)
+
+
+class _Unseekable(io.RawIOBase):
+    # zipfile 은 seek 불가 출력에 쓸 때 data descriptor(flag bit 3) 를 붙인다
+    def __init__(self, raw):
+        self.raw = raw
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        return self.raw.write(b)
+
+
+@pytest.fixture
+def src_zip(tmp_path):
+    path = tmp_path / "src.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("a/level1.txt", "low level " * 2000, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+        zf.writestr("a/level9.txt", "high level " * 2000, compress_type=zipfile.ZIP_DEFLATED, compresslevel=9)
+        zf.writestr("b/stored.bin", os.urandom(4096), compress_type=zipfile.ZIP_STORED)
+        zf.writestr("b/bz.txt", "bzip2 " * 1000, compress_type=zipfile.ZIP_BZIP2)
+        zf.writestr("b/lzma.txt", "lzma " * 1000, compress_type=zipfile.ZIP_LZMA)
+        zf.writestr("c/patch_me.txt", "old", compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("dir/", "")
+    return path
+
+
+def test_unchanged_entries_are_copied_byte_for_byte(tmp_path, src_zip):
+    patch = tmp_path / "patch_me.txt"
+    patch.write_text("new content")
+    out = tmp_path / "out.zip"
+
+    patched, kept, added = zp.rebuild_zip_to_new(src_zip, out, {"c/patch_me.txt": patch}, raw_copy=True)
+
+    assert (patched, kept, added) == (1, 6, 0)
+    with zipfile.ZipFile(src_zip) as zs, zipfile.ZipFile(out) as zo:
+        assert zo.testzip() is None
+        assert [i.filename for i in zo.infolist()] == [i.filename for i in zs.infolist()]
+        for si in zs.infolist():
+            if si.filename == "c/patch_me.txt":
+                continue
+            oi = zo.getinfo(si.filename)
+            assert _local_record(out, oi) == _local_record(src_zip, si)
+            assert (oi.CRC, oi.compress_size, oi.file_size, oi.compress_type) == (
+                si.CRC, si.compress_size, si.file_size, si.compress_type)
+        assert zo.read("c/patch_me.txt") == b"new content"
+
+
+def test_raw_copy_and_recompress_give_same_contents(tmp_path, src_zip):
+    patch = tmp_path / "p.txt"
+    patch.write_text("patched")
+    added = tmp_path / "n.txt"
+    added.write_text("added")
+    patch_map = {"c/patch_me.txt": patch, "new/n.txt": added}
+
+    raw_out, re_out = tmp_path / "raw.zip", tmp_path / "re.zip"
+    assert zp.rebuild_zip_to_new(src_zip, raw_out, patch_map, raw_copy=True) == (1, 6, 1)
+    assert zp.rebuild_zip_to_new(src_zip, re_out, patch_map, raw_copy=False) == (1, 6, 1)
+
+    with zipfile.ZipFile(raw_out) as zr, zipfile.ZipFile(re_out) as ze:
+        assert zr.namelist() == ze.namelist()
+        assert zr.namelist()[-1] == "new/n.txt"
+        for name in zr.namelist():
+            assert zr.read(name) == ze.read(name)
+
+
+def test_entries_with_data_descriptor(tmp_path):
+    src = tmp_path / "stream.zip"
+    with open(src, "wb") as f:
+        with zipfile.ZipFile(_Unseekable(f), "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("x.txt", "x" * 5000)
+            with zf.open("y.txt", "w") as w:
+                w.write(b"y" * 5000)
+    with zipfile.ZipFile(src) as zs:
+        assert all(i.flag_bits & 0x08 for i in zs.infolist())
+
+    out = tmp_path / "out.zip"
+    zp.rebuild_zip_to_new(src, out, {}, raw_copy=True)
+
+    assert out.stat().st_size == src.stat().st_size
+    with zipfile.ZipFile(out) as zo:
+        assert zo.testzip() is None
+        assert zo.read("x.txt") == b"x" * 5000
+        assert zo.read("y.txt") == b"y" * 5000
+
+
+def test_falls_back_to_recompress_without_zipfile_internals(tmp_path, src_zip, monkeypatch):
+    monkeypatch.setattr(zp, "supports_direct_write", lambda zf: False)
+    out = tmp_path / "out.zip"
+
+    assert zp.rebuild_zip_to_new(src_zip, out, {}, raw_copy=True) == (0, 7, 0)
+    with zipfile.ZipFile(src_zip) as zs, zipfile.ZipFile(out) as zo:
+        for name in zs.namelist():
+            assert zo.read(name) == zs.read(name)
@@ -1,10 +1,18 @@
 import zipfile
 import shutil
+import struct
+import copy
+import io
+import zlib
+import contextlib
 import yaml
 from pathlib import Path
 from datetime import datetime
 import os
 from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+
+from zip_index import load_zip_index, read_zip_index, DEFAULT_INDEX_DIR
 
 CONFIG_FILE = "./config/zip.config.yml"
 
@@ -164,59 +172,251 @@ def clone_zipinfo(src_info: zipfile.ZipInfo) -> zipfile.ZipInfo:
     return zi
 
 
+LOCAL_HEADER_STRUCT = struct.Struct("<4s2B4HL2L2H")
+LOCAL_HEADER_SIG = b"PK\x03\x04"
+DATA_DESCRIPTOR_SIG = b"PK\x07\x08"
+ZIP64_EXTRA_ID = 0x0001
+RAW_COPY_BUF = 1024 * 1024
+
+# copy_raw_entry / write_precompressed 가 직접 다루는 zipfile.ZipFile 내부 속성.
+# CPython 3.8 ~ 3.13 의 zipfile(3.12+ 는 zipfile/__init__.py) 구현 기준으로 확인.
+# 하나라도 없으면 공개 API(zdst.open(..., "w")) 경로로 처리한다.
+ZIPFILE_WRITE_INTERNALS = ("fp", "start_dir", "_didModify", "filelist", "NameToInfo", "_writecheck", "_writing")
+
+
+def supports_direct_write(zf: zipfile.ZipFile) -> bool:
+    return all(hasattr(zf, name) for name in ZIPFILE_WRITE_INTERNALS)
+
+
+def _has_zip64_extra(extra: bytes) -> bool:
+    i = 0
+    while i + 4 <= len(extra):
+        hid, hlen = struct.unpack("<HH", extra[i:i + 4])
+        if hid == ZIP64_EXTRA_ID:
+            return True
+        i += 4 + hlen
+    return False
+
+
+def copy_raw_entry(src_fp, zdst: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """
+    압축된 entry 를 inflate/deflate 없이 원본 바이트 그대로 복사한다.
+    - local header / 압축 데이터 / data descriptor 를 그대로 옮김
+    - CRC, 크기, 압축 방식은 원본 ZipInfo 값 유지
+    - central directory 는 zdst 가 close 시 기록 (filelist 에 등록)
+    """
+    src_fp.seek(info.header_offset)
+    header = src_fp.read(LOCAL_HEADER_STRUCT.size)
+    fields = LOCAL_HEADER_STRUCT.unpack(header)
+    if fields[0] != LOCAL_HEADER_SIG:
+        raise zipfile.BadZipFile(f"bad local header: {info.filename}")
+
+    name_len, extra_len = fields[10], fields[11]
+    name_extra = src_fp.read(name_len + extra_len)
+    local_extra = name_extra[name_len:]
+
+    # data descriptor (flag bit 3) 는 압축 데이터 뒤에 붙어 있음
+    desc_len = 0
+    if info.flag_bits & 0x08:
+        src_fp.seek(info.header_offset + len(header) + len(name_extra) + info.compress_size)
+        sig = src_fp.read(4)
+        zip64 = _has_zip64_extra(local_extra) or info.compress_size >= zipfile.ZIP64_LIMIT
+        desc_len = (4 if sig == DATA_DESCRIPTOR_SIG else 0) + 4 + (16 if zip64 else 8)
+
+    total = len(header) + len(name_extra) + info.compress_size + desc_len
+
+    if zdst._writing:
+        raise ValueError("raw copy while another write handle is open")
+
+    zdst.fp.seek(zdst.start_dir)
+    new_info = copy.copy(info)
+    new_info.header_offset = zdst.fp.tell()
+    zdst._writecheck(new_info)
+
+    src_fp.seek(info.header_offset)
+    remain = total
+    while remain > 0:
+        chunk = src_fp.read(min(RAW_COPY_BUF, remain))
+        if not chunk:
+            raise zipfile.BadZipFile(f"truncated entry: {info.filename}")
+        zdst.fp.write(chunk)
+        remain -= len(chunk)
+
+    zdst.start_dir = zdst.fp.tell()
+    zdst._didModify = True
+    zdst.filelist.append(new_info)
+    zdst.NameToInfo[new_info.filename] = new_info
+
+
 def build_output_paths(src_zip: Path, out_dir: Path) -> Tuple[Path, Path]:
     final_out = out_dir / src_zip.name
     tmp_out = out_dir / f"{src_zip.stem}_{now_ts()}{src_zip.suffix}"
     return final_out, tmp_out
 
 
+PARALLEL_COMPRESS_TYPES = (zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED)
+
+
+def compress_entry(zinfo: zipfile.ZipInfo, src_path: Path, compresslevel: Optional[int] = None) -> Tuple[zipfile.ZipInfo, bytes]:
+    """
+    파일을 RAW_COPY_BUF 단위로 읽어 zipfile 과 동일한 설정으로 압축한 blob 을 만든다 (thread pool 에서 실행).
+    compresslevel 은 기록할 ZipFile 의 compresslevel (None 이면 zlib 기본값, zipfile 과 동일).
+    zlib 은 압축 중 GIL 을 해제하므로 thread 로도 멀티코어 사용 가능.
+    """
+    co = None
+    if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+        co = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel, zlib.DEFLATED, -15)
+
+    parts: List[bytes] = []
+    size = 0
+    crc = 0
+    with open(src_path, "rb") as f:
+        while True:
+            chunk = f.read(RAW_COPY_BUF)
+            if not chunk:
+                break
+            size += len(chunk)
+            crc = zlib.crc32(chunk, crc)
+            parts.append(co.compress(chunk) if co is not None else chunk)
+    if co is not None:
+        parts.append(co.flush())
+    blob = b"".join(parts)
+
+    zinfo.file_size = size
+    zinfo.CRC = crc
+    zinfo.compress_size = len(blob)
+    return zinfo, blob
+
+
+def write_precompressed(zdst: zipfile.ZipFile, zinfo: zipfile.ZipInfo, blob: bytes) -> None:
+    """
+    미리 압축된 blob 을 entry 로 기록한다.
+    header 는 zdst.open(zinfo, "w") 경로와 동일하게 생성 → 순차 처리와 같은 바이트 결과.
+    """
+    if zdst._writing:
+        raise ValueError("precompressed write while another write handle is open")
+
+    zinfo.flag_bits = 0x00
+    if not zinfo.external_attr:
+        zinfo.external_attr = 0o600 << 16
+    zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+
+    zdst.fp.seek(zdst.start_dir)
+    zinfo.header_offset = zdst.fp.tell()
+    zdst._writecheck(zinfo)
+    zdst._didModify = True
+
+    zdst.fp.write(zinfo.FileHeader(zip64))
+    zdst.fp.write(blob)
+
+    zdst.start_dir = zdst.fp.tell()
+    zdst.filelist.append(zinfo)
+    zdst.NameToInfo[zinfo.filename] = zinfo
+
+
 def rebuild_zip_to_new(
     src_zip: Path,
     out_zip: Path,
     patch_map: Dict[str, Path],
     allow_add: bool = True,
+    raw_copy: bool = True,
+    compress_workers: int = 1,
+    src_infos: Optional[List[zipfile.ZipInfo]] = None,
 ) -> Tuple[int, int, int]:
+    """
+    raw_copy=True 이면 변경되지 않은 entry 는 압축 바이트 그대로 복사(재압축 없음).
+    패치/추가 entry 만 새로 압축하므로 처리 시간이 패치 크기에 비례한다.
+    compress_workers > 1 이면 패치/추가 entry 를 thread pool 에서 미리 압축하고
+    기록은 기존 순서(원본 entry 순서 → 추가 entry)대로 한다.
+    미리 압축하는 entry 는 기록 순서 기준 compress_workers * 2 개까지만 (메모리 상한).
+    src_infos 에 src_zip 의 완전한 infolist 를 넘기면 raw_copy 시 central directory 를 다시 읽지 않는다.
+    """
 
     tmp_zip = out_zip.with_name(f"{out_zip.name}.tmp_{now_ts()}")
 
     patched = 0
     kept = 0
-
-    with zipfile.ZipFile(src_zip, "r") as zsrc, zipfile.ZipFile(tmp_zip, "w") as zdst:
-        src_names = set()
-
-        for info in zsrc.infolist():
-            src_names.add(info.filename)
-
+    added = 0
+
+    with contextlib.ExitStack() as stack:
+        zdst = stack.enter_context(zipfile.ZipFile(tmp_zip, "w"))
+        src_fp = stack.enter_context(open(src_zip, "rb"))
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=max(1, compress_workers)))
+        if not supports_direct_write(zdst):
+            # zipfile 내부 구조가 다른 버전: 재압축 경로로 처리
+            raw_copy = False
+            compress_workers = 1
+
+        # 재압축 경로는 zsrc.open() 이 필요하므로 zip 을 연다
+        zsrc = None
+        if src_infos is None or not raw_copy:
+            zsrc = stack.enter_context(zipfile.ZipFile(src_zip, "r"))
+            src_infos = zsrc.infolist()
+        src_names = {info.filename for info in src_infos}
+
+        # 기록할 entry 의 ZipInfo 를 먼저 확정 (patch → add 순서)
+        new_infos: Dict[str, zipfile.ZipInfo] = {}
+        for info in src_infos:
             if info.filename in patch_map:
-                new_path = patch_map[info.filename]
                 new_info = clone_zipinfo(info)
-                new_info.date_time = file_mtime_to_zip_datetime(new_path)
-
-                with zdst.open(new_info, "w") as w, open(new_path, "rb") as r:
-                    shutil.copyfileobj(r, w)
-
-                patched += 1
-            else:
-                keep_info = clone_zipinfo(info)
-                with zsrc.open(info, "r") as r, zdst.open(keep_info, "w") as w:
-                    shutil.copyfileobj(r, w)
-                kept += 1
+                new_info.date_time = file_mtime_to_zip_datetime(patch_map[info.filename])
+                new_infos[info.filename] = new_info
 
-        added = 0
+        add_names: List[str] = []
         if allow_add:
             for zip_rel, src_path in patch_map.items():
                 if zip_rel in src_names:
                     continue
-
                 zi = zipfile.ZipInfo(filename=zip_rel, date_time=file_mtime_to_zip_datetime(src_path))
                 zi.compress_type = zipfile.ZIP_DEFLATED
                 zi.external_attr = (0o644 & 0xFFFF) << 16
-
-                with zdst.open(zi, "w") as w, open(src_path, "rb") as r:
+                new_infos[zip_rel] = zi
+                add_names.append(zip_rel)
+
+        # 압축은 기록 순서대로 최대 compress_workers * 2 개만 앞서 진행 (메모리의 blob 수 제한)
+        write_order = [info.filename for info in src_infos if info.filename in new_infos] + add_names
+        parallel_names = iter([
+            name for name in write_order
+            if compress_workers > 1 and new_infos[name].compress_type in PARALLEL_COMPRESS_TYPES
+        ])
+        window = max(1, compress_workers) * 2
+        futures: Dict[str, Future] = {}
+
+        def submit_ahead() -> None:
+            while len(futures) < window:
+                name = next(parallel_names, None)
+                if name is None:
+                    return
+                futures[name] = pool.submit(compress_entry, new_infos[name], patch_map[name], zdst.compresslevel)
+
+        submit_ahead()
+
+        def write_new(name: str) -> None:
+            fut = futures.pop(name, None)
+            if fut is not None:
+                # 기록을 마친 뒤에 다음 entry 를 넣어야 메모리의 blob 이 window 개를 넘지 않는다
+                write_precompressed(zdst, *fut.result())
+                submit_ahead()
+                return
+            with zdst.open(new_infos[name], "w") as w, open(patch_map[name], "rb") as r:
+                shutil.copyfileobj(r, w)
+
+        for info in src_infos:
+            if info.filename in new_infos:
+                write_new(info.filename)
+                patched += 1
+            elif raw_copy:
+                copy_raw_entry(src_fp, zdst, info)
+                kept += 1
+            else:
+                keep_info = clone_zipinfo(info)
+                with zsrc.open(info, "r") as r, zdst.open(keep_info, "w") as w:
                     shutil.copyfileobj(r, w)
+                kept += 1
 
-                added += 1
+        for name in add_names:
+            write_new(name)
+            added += 1
 
     if out_zip.exists():
         out_zip.unlink()
@@ -278,25 +478,37 @@ def print_lists_in_format(
         )
 
 
+PatchResult = Dict[str, object]
+
+
 def patch_zip(
     src_zip_file: str,
     root_path: str,
-    filelist_lines: list[str],
+    ok: List[WorkItem],
+    miss: List[WorkItem],
     is_backup: bool,
     out_dir: Path,
     is_confirm: bool,   # ★ 추가
-):
+    raw_copy: bool = True,
+    compress_workers: int = 1,
+    index_cache_dir: Optional[str] = DEFAULT_INDEX_DIR,
+    preconfirmed: bool = False,
+) -> PatchResult:
+    """
+    ok / miss 는 main 에서 한 번만 수행한 precheck 결과 (모든 zip 공유).
+    preconfirmed=True 이면 목록 출력/확인 단계 생략 (병렬 모드에서 main 이 미리 끝낸 경우)
+    반환값: {"zip", "status"(DONE/ABORT/CANCELED), "added", "patched", "kept", "miss"}
+    """
     src_zip = Path(src_zip_file)
     root_path = Path(root_path)
 
-    items = build_work_items(root_path, filelist_lines)
-
-    with zipfile.ZipFile(src_zip, "r") as z:
-        zip_entries = set(z.namelist())
-        zip_total_entries = len(zip_entries)
-        zip_info_map = {zi.filename: zi for zi in z.infolist()}
-
-    ok, miss = precheck_sources(items)
+    # central directory 는 인덱스 캐시에서 (zip 변경 시 자동 재생성)
+    # 캐시 miss 로 zip 을 직접 읽었으면 그 infolist 를 rebuild 에서 재사용
+    src_stat = src_zip.stat()
+    src_infos, complete = read_zip_index(src_zip, index_cache_dir)
+    zip_info_map = {zi.filename: zi for zi in src_infos}
+    zip_entries = set(zip_info_map)
+    zip_total_entries = len(zip_entries)
 
     ok_sorted = sorted(ok, key=lambda x: x[0])
     miss_sorted = sorted(miss, key=lambda x: x[0])
@@ -305,24 +517,36 @@ def patch_zip(
     added_count = sum(1 for zip_rel, _, _, _ in ok_sorted if zip_rel not in zip_entries)
     miss_count = len(miss_sorted)
 
+    result: PatchResult = {
+        "zip": str(src_zip_file),
+        "status": "ABORT",
+        "added": added_count,
+        "patched": patched_count,
+        "kept": zip_total_entries,
+        "miss": miss_count,
+    }
+
     if miss_sorted:
-        print_lists_in_format(zip_entries, zip_info_map, ok_sorted, miss_sorted, root_path)
+        if not preconfirmed:
+            print_lists_in_format(zip_entries, zip_info_map, ok_sorted, miss_sorted, root_path)
         print(
             f"\n✖ ABORT: added({added_count}), patched({patched_count}), "
             f"kept({zip_total_entries}), miss({miss_count})"
         )
-        return
+        return result
 
-    print_lists_in_format(zip_entries, zip_info_map, ok_sorted, [], root_path)
+    if not preconfirmed:
+        print_lists_in_format(zip_entries, zip_info_map, ok_sorted, [], root_path)
 
     # ★★★ 핵심 변경 부분 ★★★
-    if is_confirm:
+    if is_confirm and not preconfirmed:
         print("\nProceed? (y = YES / anything else = NO): ", end="")
         resp = input().strip()
         if resp.lower() != "y":
             print("\n✖ CANCELED")
-            return
-    else:
+            result["status"] = "CANCELED"
+            return result
+    elif not preconfirmed:
         print("\n[SKIP CONFIRM]")
 
     final_out, tmp_out = build_output_paths(src_zip, out_dir)
@@ -331,7 +555,15 @@ def patch_zip(
 
     patch_map = {zip_rel: src_path for zip_rel, src_path, _, _ in ok_sorted}
 
-    patched, kept, added = rebuild_zip_to_new(src_zip, tmp_out, patch_map, allow_add=True)
+    # 확인 대기 중 zip 이 바뀌었으면 rebuild 가 다시 읽음
+    st = src_zip.stat()
+    if (st.st_size, st.st_mtime_ns) != (src_stat.st_size, src_stat.st_mtime_ns):
+        complete = False
+
+    patched, kept, added = rebuild_zip_to_new(
+        src_zip, tmp_out, patch_map, allow_add=True, raw_copy=raw_copy,
+        compress_workers=compress_workers, src_infos=src_infos if complete else None,
+    )
 
     if final_out.exists():
         final_out.unlink()
@@ -343,6 +575,44 @@ def patch_zip(
         f"kept({kept}), miss({miss_count})"
     )
 
+    result.update(status="DONE", added=added, patched=patched, kept=kept)
+    return result
+
+
+def _patch_zip_worker(args: tuple) -> Tuple[str, PatchResult]:
+    """
+    process pool 용 worker.
+    zip 별 콘솔 출력을 버퍼에 모아 한 블록으로 반환한다 (출력 섞임 방지).
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        print(f"\n=== SOURCE ZIP: {args[0]} ===")
+        try:
+            result = patch_zip(*args)
+        except Exception as e:
+            print(f"\n✖ ERROR: {e}")
+            result = {"zip": str(args[0]), "status": "ERROR", "error": str(e)}
+    return buf.getvalue(), result
+
+
+def print_summary(results: List[PatchResult]) -> None:
+    print("\n" + ("=" * 80))
+    print("[SUMMARY]")
+    for r in results:
+        if r["status"] == "ERROR":
+            print(f"[{r['status']:<8}] {r['zip']} | {r.get('error', '')}")
+            continue
+        print(
+            f"[{r['status']:<8}] {r['zip']} | added({r['added']}), patched({r['patched']}), "
+            f"kept({r['kept']}), miss({r['miss']})"
+        )
+
+    done = sum(1 for r in results if r["status"] == "DONE")
+    if done == len(results):
+        print(f"\n✔ DONE: {done}/{len(results)} zip")
+    else:
+        print(f"\n✖ ABORT: done({done}), failed({len(results) - done}) / {len(results)} zip")
+
 
 def main():
     print(f"> {now_str()}\n")
@@ -360,6 +630,11 @@ def main():
     out_dir = ensure_out_dir(out_path)
 
     is_confirm = bool(cfg.get("is_confirm", True))   # ★ 추가 (기본값 true)
+    raw_copy = bool(cfg.get("is_raw_copy", True))   # 미변경 entry 재압축 없이 복사
+    is_backup = bool(cfg.get("is_backup", False))
+    workers = max(1, int(cfg.get("workers", 1)))   # 1 이면 순차 처리
+    compress_workers = int(cfg.get("compress_workers", os.cpu_count() or 1))
+    index_cache_dir = cfg.get("index_cache_dir", DEFAULT_INDEX_DIR)   # "" 이면 캐시 미사용
 
     zip_paths = [Path(z) for z in zip_files]
     missing = [p for p in zip_paths if not p.exists()]
@@ -370,16 +645,84 @@ def main():
             print(f"[MISSING] {p}")
         return
 
+    # precheck 는 한 번만 수행하고 모든 zip 에 공유
+    items = build_work_items(Path(cfg["root_path"]), filelist_lines)
+    ok, miss = precheck_sources(items)
+
+    if workers == 1 or len(zip_files) == 1:
+        results = []
+        for zf in zip_files:
+            print(f"\n=== SOURCE ZIP: {zf} ===")
+            results.append(patch_zip(
+                zf,
+                cfg["root_path"],
+                ok,
+                miss,
+                is_backup,
+                out_dir,
+                is_confirm,   # ★ 전달
+                raw_copy,
+                compress_workers,
+                index_cache_dir,
+            ))
+        if len(results) > 1:
+            print_summary(results)
+        return
+
+    # 병렬 모드: 같은 zip 을 두 번 적은 경우는 한 번만 처리
+    unique: Dict[Path, str] = {}
+    for zf, p in zip(zip_files, zip_paths):
+        unique.setdefault(p.resolve(), zf)
+    zip_files = list(unique.values())
+
+    # 결과/임시 파일이 out_dir/<zip 파일명> 이므로 파일명이 같은 다른 zip 은 동시에 처리 불가
+    by_name: Dict[str, List[str]] = {}
+    for zf in zip_files:
+        by_name.setdefault(Path(zf).name, []).append(zf)
+    dup_names = {name: zfs for name, zfs in by_name.items() if len(zfs) > 1}
+    if dup_names:
+        print("✖ ABORT: 병렬 모드에서 zip_files 에 파일명이 같은 zip 이 있습니다 (out_path 결과가 겹침, workers: 1 로 실행).\n")
+        for name, zfs in dup_names.items():
+            for zf in zfs:
+                print(f"[DUPLICATE] {name} | {zf}")
+        return
+
+    # worker 에서는 input() 불가 → zip 별 목록을 먼저 모두 출력하고 한 번만 확인
+    print(f"[PARALLEL] zip({len(zip_files)}), workers({workers}), ok({len(ok)}), miss({len(miss)})")
+    ok_sorted = sorted(ok, key=lambda x: x[0])
+    miss_sorted = sorted(miss, key=lambda x: x[0])
     for zf in zip_files:
         print(f"\n=== SOURCE ZIP: {zf} ===")
-        patch_zip(
-            zf,
-            cfg["root_path"],
-            filelist_lines,
-            bool(cfg.get("is_backup", False)),
-            out_dir,
-            is_confirm,   # ★ 전달
-        )
+        zip_info_map = {zi.filename: zi for zi in load_zip_index(Path(zf), index_cache_dir)}
+        print_lists_in_format(set(zip_info_map), zip_info_map, ok_sorted, miss_sorted, Path(cfg["root_path"]))
+
+    if miss:
+        print(f"\n✖ ABORT: miss({len(miss)}) / {len(zip_files)} zip")
+        return
+
+    if is_confirm:
+        print("\nProceed all? (y = YES / anything else = NO): ", end="")
+        resp = input().strip()
+        if resp.lower() != "y":
+            print("\n✖ CANCELED")
+            return
+    else:
+        print("\n[SKIP CONFIRM]")
+
+    jobs = [
+        (zf, cfg["root_path"], ok, miss, is_backup, out_dir, False, raw_copy, compress_workers,
+         index_cache_dir, True)
+        for zf in zip_files
+    ]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as ex:
+        # 완료 순서와 무관하게 zip_files 순서대로 출력
+        for report, result in ex.map(_patch_zip_worker, jobs):
+            print(report, end="")
+            results.append(result)
+
+    print_summary(results)
 
 
 if __name__ == "__main__":
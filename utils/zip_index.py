@@ -0,0 +1,264 @@
+import os
+import json
+import zlib
+import struct
+import hashlib
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple
+
+# zip central directory 인덱스 캐시
+# - key: archive 절대경로 + size + mtime
+# - archive 가 바뀌면(size/mtime 불일치) 자동 재생성
+INDEX_VERSION = 1
+DEFAULT_INDEX_DIR = "./cache/zip_index"
+
+# entry 1건 = [filename, date_time, compress_size, file_size, CRC, header_offset, compress_type, flag_bits]
+
+
+def _index_file(cache_dir: Path, zip_path: Path) -> Path:
+    key = hashlib.sha1(str(zip_path.resolve()).encode("utf-8")).hexdigest()
+    return cache_dir / f"{zip_path.stem}_{key[:16]}.json"
+
+
+def _stat_key(zip_path: Path) -> dict:
+    st = zip_path.stat()
+    return {"path": str(zip_path.resolve()), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _to_row(zi: zipfile.ZipInfo) -> list:
+    return [
+        zi.filename,
+        list(zi.date_time),
+        zi.compress_size,
+        zi.file_size,
+        zi.CRC,
+        zi.header_offset,
+        zi.compress_type,
+        zi.flag_bits,
+    ]
+
+
+def _from_row(row: list) -> zipfile.ZipInfo:
+    zi = zipfile.ZipInfo(filename=row[0], date_time=tuple(row[1]))
+    zi.compress_size = row[2]
+    zi.file_size = row[3]
+    zi.CRC = row[4]
+    zi.header_offset = row[5]
+    zi.compress_type = row[6]
+    zi.flag_bits = row[7]
+    return zi
+
+
+def _read_index(idx_path: Path, key: dict) -> Optional[List[zipfile.ZipInfo]]:
+    try:
+        with open(idx_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return None
+
+    if data.get("version") != INDEX_VERSION:
+        return None
+    if any(data.get(k) != v for k, v in key.items()):
+        return None
+    return [_from_row(r) for r in data.get("entries", [])]
+
+
+def _write_index(idx_path: Path, key: dict, infos: List[zipfile.ZipInfo]) -> None:
+    idx_path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": INDEX_VERSION, **key, "entries": [_to_row(zi) for zi in infos]}
+
+    tmp = idx_path.with_name(f"{idx_path.name}.tmp_{os.getpid()}")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, idx_path)
+
+
+def load_zip_index(zip_path: Path, cache_dir: Optional[str] = DEFAULT_INDEX_DIR) -> List[zipfile.ZipInfo]:
+    """
+    zip entry 목록(ZipInfo)을 반환한다.
+    - cache_dir 이 있으면 캐시 사용 (적중 시 zip 을 열지 않음)
+    - cache_dir 이 비어 있으면 매번 zip central directory 를 읽음
+    반환되는 ZipInfo 는 목록/비교/precheck 용 (filename, date_time, 크기, CRC, header_offset 만 보장)
+    """
+    return read_zip_index(zip_path, cache_dir)[0]
+
+
+def read_zip_index(zip_path: Path, cache_dir: Optional[str] = DEFAULT_INDEX_DIR) -> Tuple[List[zipfile.ZipInfo], bool]:
+    """
+    load_zip_index 와 같고 (ZipInfo 목록, complete) 를 반환한다.
+    complete=True 면 zip central directory 를 직접 읽은 완전한 ZipInfo
+    (extra / external_attr 등 포함 → zip 재작성에 그대로 사용 가능)
+    """
+    zip_path = Path(zip_path)
+
+    if not cache_dir:
+        with zipfile.ZipFile(zip_path, "r") as z:
+            return z.infolist(), True
+
+    key = _stat_key(zip_path)
+    idx_path = _index_file(Path(cache_dir), zip_path)
+
+    infos = _read_index(idx_path, key)
+    if infos is not None:
+        return infos, False
+
+    with zipfile.ZipFile(zip_path, "r") as z:
+        infos = z.infolist()
+
+    try:
+        _write_index(idx_path, key, infos)
+    except OSError as e:
+        print(f"[WARN] zip index cache write failed: {e}")
+    return infos, True
+
+
+# ==================================================
+# central directory 스트리밍 (ZipFile 을 만들지 않고 entry 1건씩 읽음)
+# ==================================================
+class CDEntry(NamedTuple):
+    filename: str
+    CRC: int
+    file_size: int
+    compress_size: int
+    compress_type: int
+    date_time: tuple
+    header_offset: int
+
+
+_CD_STRUCT = struct.Struct(zipfile.structCentralDir)
+_FH_STRUCT = struct.Struct(zipfile.structFileHeader)
+_CD_READ_BUF = 256 * 1024
+_HASH_BUF = 1024 * 1024
+
+
+def _zip64_values(extra: bytes, need: List[str]) -> dict:
+    """
+    zip64 extra(0x0001) 에서 0xFFFFFFFF 로 표시된 필드만 순서대로 읽는다.
+    """
+    out: dict = {}
+    i = 0
+    while i + 4 <= len(extra):
+        hid, hlen = struct.unpack("<HH", extra[i:i + 4])
+        if hid == 0x0001:
+            data = extra[i + 4:i + 4 + hlen]
+            for j, field in enumerate(need):
+                if (j + 1) * 8 <= len(data):
+                    out[field] = struct.unpack("<Q", data[j * 8:(j + 1) * 8])[0]
+            break
+        i += 4 + hlen
+    return out
+
+
+def iter_central_directory(zip_path: Path) -> Iterator[CDEntry]:
+    """
+    central directory 를 버퍼 단위로 읽으며 entry 를 하나씩 yield 한다.
+    메모리 사용량이 entry 수와 무관 (100k+ entry 대응).
+    """
+    with open(zip_path, "rb") as fp:
+        endrec = zipfile._EndRecData(fp)
+        if not endrec:
+            raise zipfile.BadZipFile(f"not a zip file: {zip_path}")
+
+        size_cd = endrec[zipfile._ECD_SIZE]
+        offset_cd = endrec[zipfile._ECD_OFFSET]
+        concat = endrec[zipfile._ECD_LOCATION] - size_cd - offset_cd
+        if endrec[zipfile._ECD_SIGNATURE] == zipfile.stringEndArchive64:
+            concat -= zipfile.sizeEndCentDir64 + zipfile.sizeEndCentDir64Locator
+
+        fp.seek(offset_cd + concat)
+        remain = size_cd
+        buf = b""
+        pos = 0
+
+        def fill(n: int) -> bool:
+            # buf[pos:] 에 n 바이트 이상 확보 (부족할 때만 남은 부분을 앞으로 당겨 이어 붙임)
+            nonlocal buf, pos, remain
+            if len(buf) - pos >= n:
+                return True
+            buf = buf[pos:]
+            pos = 0
+            while len(buf) < n and remain > 0:
+                chunk = fp.read(min(_CD_READ_BUF, remain))
+                if not chunk:
+                    break
+                remain -= len(chunk)
+                buf += chunk
+            return len(buf) >= n
+
+        while fill(_CD_STRUCT.size):
+            cd = _CD_STRUCT.unpack_from(buf, pos)
+            if cd[zipfile._CD_SIGNATURE] != zipfile.stringCentralDir:
+                raise zipfile.BadZipFile(f"bad central directory: {zip_path}")
+
+            n_name = cd[zipfile._CD_FILENAME_LENGTH]
+            n_extra = cd[zipfile._CD_EXTRA_FIELD_LENGTH]
+            n_comment = cd[zipfile._CD_COMMENT_LENGTH]
+            rec_len = _CD_STRUCT.size + n_name + n_extra + n_comment
+            if not fill(rec_len):
+                raise zipfile.BadZipFile(f"truncated central directory: {zip_path}")
+
+            p = pos + _CD_STRUCT.size
+            raw_name = buf[p:p + n_name]
+            extra = buf[p + n_name:p + n_name + n_extra]
+            pos += rec_len
+
+            flags = cd[zipfile._CD_FLAG_BITS]
+            name = raw_name.decode("utf-8" if flags & 0x800 else "cp437")
+
+            file_size = cd[zipfile._CD_UNCOMPRESSED_SIZE]
+            compress_size = cd[zipfile._CD_COMPRESSED_SIZE]
+            header_offset = cd[zipfile._CD_LOCAL_HEADER_OFFSET]
+
+            need = []
+            if file_size == 0xFFFFFFFF:
+                need.append("file_size")
+            if compress_size == 0xFFFFFFFF:
+                need.append("compress_size")
+            if header_offset == 0xFFFFFFFF:
+                need.append("header_offset")
+            if need:
+                z64 = _zip64_values(extra, need)
+                file_size = z64.get("file_size", file_size)
+                compress_size = z64.get("compress_size", compress_size)
+                header_offset = z64.get("header_offset", header_offset)
+
+            d, t = cd[zipfile._CD_DATE], cd[zipfile._CD_TIME]
+            date_time = ((d >> 9) + 1980, (d >> 5) & 0xF, d & 0x1F, t >> 11, (t >> 5) & 0x3F, (t & 0x1F) * 2)
+
+            yield CDEntry(
+                name,
+                cd[zipfile._CD_CRC],
+                file_size,
+                compress_size,
+                cd[zipfile._CD_COMPRESS_TYPE],
+                date_time,
+                header_offset + concat,
+            )
+
+
+def hash_entry(fp: BinaryIO, entry: CDEntry) -> Optional[str]:
+    """
+    entry 내용(압축 해제 후)의 sha256. STORED / DEFLATED 만 지원, 그 외 None.
+    """
+    if entry.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+        return None
+
+    fp.seek(entry.header_offset)
+    fh = _FH_STRUCT.unpack(fp.read(_FH_STRUCT.size))
+    if fh[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"bad local header: {entry.filename}")
+    fp.seek(fh[zipfile._FH_FILENAME_LENGTH] + fh[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+
+    h = hashlib.sha256()
+    d = zlib.decompressobj(-15) if entry.compress_type == zipfile.ZIP_DEFLATED else None
+    remain = entry.compress_size
+    while remain > 0:
+        chunk = fp.read(min(_HASH_BUF, remain))
+        if not chunk:
+            break
+        remain -= len(chunk)
+        h.update(d.decompress(chunk) if d else chunk)
+    if d:
+        h.update(d.flush())
+    return h.hexdigest()
@@ -1,10 +1,18 @@
+import os
+import json
 import yaml
+import hashlib
+import sqlite3
 import zipfile
 import subprocess
 import tempfile
+import time
 from pathlib import Path
+from contextlib import closing
 from datetime import datetime
 
+from zip_index import load_zip_index, iter_central_directory, hash_entry, CDEntry, DEFAULT_INDEX_DIR
+
 CONFIG_FILE = "./config/zip_print.config.yml"
 
 
@@ -36,6 +44,21 @@ def load_config() -> dict:
     cfg["decompile_class"] = bool(cfg.get("decompile_class", False))
     cfg["cfr_jar"] = cfg.get("cfr_jar", "")
     cfg["use_javap_fallback"] = bool(cfg.get("use_javap_fallback", True))
+    # class 를 모아서 JVM 1회로 디컴파일 (false 면 파일마다 java 실행)
+    cfg["decompile_batch"] = bool(cfg.get("decompile_batch", True))
+    cfg["decompile_timeout"] = int(cfg.get("decompile_timeout", 300))
+
+    # 디컴파일 결과 캐시 ("" 이면 미사용)
+    cfg["decompile_cache_dir"] = cfg.get("decompile_cache_dir", "./cache/decompile")
+    cfg["decompile_cache_max_mb"] = int(cfg.get("decompile_cache_max_mb", 200))
+
+    # diff 모드: zip_files[0] 기준으로 나머지 zip 과 entry 비교
+    cfg["diff_mode"] = bool(cfg.get("diff_mode", False))
+    cfg["diff_report"] = cfg.get("diff_report", "./out/zip_diff.jsonl")
+    cfg["diff_verify_hash"] = bool(cfg.get("diff_verify_hash", False))
+
+    # zip 인덱스 캐시 디렉토리 ("" 이면 캐시 미사용)
+    cfg["index_cache_dir"] = cfg.get("index_cache_dir", DEFAULT_INDEX_DIR)
 
     return cfg
 
@@ -84,7 +107,7 @@ def read_filelist(filelist_path: str) -> list[str]:
     return items
 
 
-def run_cmd(cmd: list[str], timeout_sec: int = 60) -> tuple[int, str]:
+def run_cmd(cmd: list[str], timeout_sec: float = 60) -> tuple[int, str]:
     """
     외부 커맨드 실행 유틸.
     stdout+stderr 합쳐서 반환.
@@ -109,9 +132,15 @@ def run_cmd(cmd: list[str], timeout_sec: int = 60) -> tuple[int, str]:
         return 1, f"[ERROR] command failed: {e}"
 
 
-def decompile_class_bytes(class_bytes: bytes, cfg: dict) -> str:
+# 디컴파일 결과를 만든 도구 (캐시는 identity 와 같은 도구의 결과만 저장)
+TOOL_CFR = "cfr"
+TOOL_JAVAP = "javap"
+TOOL_ERROR = "error"
+
+
+def decompile_class_bytes(class_bytes: bytes, cfg: dict) -> tuple[str, str]:
     """
-    .class 바이트를 임시 파일로 저장 후 디컴파일 결과 문자열을 반환.
+    .class 바이트를 임시 파일로 저장 후 (도구, 디컴파일 결과 문자열)을 반환.
     - CFR jar가 있으면 outputdir로 .java 생성 후 읽어서 출력
     - 없으면 javap -c로 바이트코드 디스어셈블
     """
@@ -144,24 +173,297 @@ def decompile_class_bytes(class_bytes: bytes, cfg: dict) -> str:
                 java_files = sorted(out_dir.rglob("*.java"))
                 if java_files:
                     try:
-                        return java_files[0].read_text(encoding="utf-8", errors="replace")
+                        return TOOL_CFR, java_files[0].read_text(encoding="utf-8", errors="replace")
                     except Exception as e:
-                        return f"[ERROR] CFR output read failed: {e}"
+                        return TOOL_ERROR, f"[ERROR] CFR output read failed: {e}"
 
                 # 생성 파일이 없으면 CFR 출력(에러 포함) 보여주기
-                return f"[ERROR] CFR failed (rc={rc})\n{out}".rstrip()
+                return TOOL_ERROR, f"[ERROR] CFR failed (rc={rc})\n{out}".rstrip()
 
         # 2) javap fallback (소스가 아니라 바이트코드)
         if use_javap:
-            rc, out = run_cmd(["javap", "-c", "-p", str(class_file)])
-            if rc == 0 and out.strip():
-                return out
-            return f"[ERROR] javap failed (rc={rc})\n{out}".rstrip()
+            return javap_class_bytes(class_bytes)
+
+        return TOOL_ERROR, "[ERROR] decompiler not configured (set cfr_jar or enable javap fallback)"
+
+
+def javap_class_bytes(class_bytes: bytes) -> tuple[str, str]:
+    """
+    javap -c 로 바이트코드 디스어셈블 (소스가 아니라 바이트코드)
+    """
+    with tempfile.TemporaryDirectory() as td:
+        class_file = Path(td) / "Target.class"
+        class_file.write_bytes(class_bytes)
+        rc, out = run_cmd(["javap", "-c", "-p", str(class_file)])
+        if rc == 0 and out.strip():
+            return TOOL_JAVAP, out
+        return TOOL_ERROR, f"[ERROR] javap failed (rc={rc})\n{out}".rstrip()
+
+
+# 커맨드 라인 길이 제한(Windows ~32K) 대비 CFR 1회 호출당 인자 길이 상한
+CFR_MAX_ARGS_LEN = 24000
+
+
+def _chunk_by_arg_len(paths: list[Path], max_len: int) -> list[list[Path]]:
+    chunks: list[list[Path]] = []
+    cur: list[Path] = []
+    cur_len = 0
+    for p in paths:
+        n = len(str(p)) + 3
+        if cur and cur_len + n > max_len:
+            chunks.append(cur)
+            cur, cur_len = [], 0
+        cur.append(p)
+        cur_len += n
+    if cur:
+        chunks.append(cur)
+    return chunks
+
+
+# constant pool tag → 본문 바이트 수 (Utf8(1) 은 길이 가변이라 별도 처리)
+_CP_SIZES = {3: 4, 4: 4, 5: 8, 6: 8, 7: 2, 8: 2, 9: 4, 10: 4, 11: 4, 12: 4, 15: 3, 16: 2, 17: 4, 18: 4, 19: 2, 20: 2}
+
+
+def class_internal_name(class_bytes: bytes) -> str | None:
+    """
+    .class 헤더의 this_class 이름(예: com/foo/Bar$Inner) 반환. 형식이 맞지 않으면 None.
+    CFR 출력 경로는 zip entry 경로가 아니라 이 이름(패키지 + class 명)을 따른다.
+    """
+    b = class_bytes
+    if len(b) < 10 or b[:4] != b"\xca\xfe\xba\xbe":
+        return None
+    try:
+        count = int.from_bytes(b[8:10], "big")
+        utf8: dict[int, str] = {}
+        class_name_idx: dict[int, int] = {}
+        pos = 10
+        i = 1
+        while i < count:
+            tag = b[pos]
+            if tag == 1:
+                n = int.from_bytes(b[pos + 1:pos + 3], "big")
+                utf8[i] = b[pos + 3:pos + 3 + n].decode("utf-8", errors="replace")
+                pos += 3 + n
+            elif tag in _CP_SIZES:
+                if tag == 7:
+                    class_name_idx[i] = int.from_bytes(b[pos + 1:pos + 3], "big")
+                pos += 1 + _CP_SIZES[tag]
+                if tag in (5, 6):
+                    i += 1   # long/double 은 2칸 차지
+            else:
+                return None
+            i += 1
+        this_class = int.from_bytes(b[pos + 2:pos + 4], "big")
+        return utf8.get(class_name_idx.get(this_class, -1))
+    except IndexError:
+        return None
+
+
+def _match_java_source(internal_name: str, java_by_rel: dict[str, Path]) -> Path | None:
+    """
+    class 이름 → CFR 생성 .java 정확히 매핑 (out_dir 기준 상대 경로, 확장자 제외).
+    inner class(A$B)는 바깥 class 소스에 포함되므로 바깥 class(A) 로 한 번 더 찾는다.
+    어느 쪽도 없으면 None (CFR 출력 없음).
+    """
+    path = java_by_rel.get(internal_name)
+    if path is not None:
+        return path
+    head, _, last = internal_name.rpartition("/")
+    if "$" in last:
+        outer = last.split("$", 1)[0]
+        return java_by_rel.get(f"{head}/{outer}" if head else outer)
+    return None
+
+
+def decompile_classes_batch(classes: dict[str, bytes], cfg: dict) -> dict[str, tuple[str, str]]:
+    """
+    여러 .class 를 한 임시 트리에 풀고 CFR 을 한 번(인자 길이 초과 시 묶음 단위)만 실행한다.
+    - 생성된 .java 를 class 이름(this_class) 기준으로 zip entry 에 다시 매핑
+    - 타임아웃은 배치 전체 기준 (decompile_timeout)
+    - CFR 결과가 없는 class 만 javap 로 개별 fallback
+    반환: {entry_name: (도구, 출력 문자열)}
+    """
+    cfr_jar = str(cfg.get("cfr_jar", "")).strip()
+    use_javap = bool(cfg.get("use_javap_fallback", True))
+    timeout_sec = int(cfg.get("decompile_timeout", 300))
+
+    results: dict[str, tuple[str, str]] = {}
+    if not classes:
+        return results
+
+    if not cfr_jar or not Path(cfr_jar).exists():
+        for name, data in classes.items():
+            results[name] = decompile_class_bytes(data, cfg)
+        return results
+
+    cfr_errors: list[str] = []
+
+    with tempfile.TemporaryDirectory() as td:
+        tmp_dir = Path(td)
+        src_dir = tmp_dir / "classes"
+        out_dir = tmp_dir / "cfr_out"
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        class_files: list[Path] = []
+        for name, data in classes.items():
+            p = (src_dir / name).resolve()
+            if src_dir.resolve() not in p.parents:
+                continue   # ../ 등 비정상 경로는 개별 fallback
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_bytes(data)
+            class_files.append(p)
+
+        # 묶음마다 배치 전체 deadline 까지 남은 시간만 준다 (지나면 남은 묶음은 실행 안 함)
+        deadline = time.monotonic() + timeout_sec
+        for chunk in _chunk_by_arg_len(class_files, CFR_MAX_ARGS_LEN):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                cfr_errors.append(f"[ERROR] CFR batch timeout ({timeout_sec}s)")
+                break
+            cmd = ["java", "-jar", str(Path(cfr_jar)), *map(str, chunk), "--outputdir", str(out_dir)]
+            rc, out = run_cmd(cmd, timeout_sec=remaining)
+            if rc != 0:
+                cfr_errors.append(f"[ERROR] CFR failed (rc={rc})\n{out}".rstrip())
+
+        java_by_rel = {
+            jp.relative_to(out_dir).as_posix()[:-len(".java")]: jp
+            for jp in out_dir.rglob("*.java")
+        }
+
+        for name, data in classes.items():
+            internal_name = class_internal_name(data)
+            jp = _match_java_source(internal_name, java_by_rel) if internal_name else None
+            if jp is None:
+                continue
+            try:
+                text = jp.read_text(encoding="utf-8", errors="replace")
+                rel = jp.relative_to(out_dir).as_posix()
+                if rel[:-len(".java")] != internal_name:
+                    # inner class 는 바깥 class 소스 전체가 나오므로 어느 파일인지 표시
+                    text = f"// {internal_name}: inner class, shown inside its outer class source {rel}\n{text}"
+                results[name] = (TOOL_CFR, text)
+            except Exception as e:
+                results[name] = (TOOL_ERROR, f"[ERROR] CFR output read failed: {e}")
+
+    # CFR 이 만들지 못한 class 만 개별 fallback
+    for name, data in classes.items():
+        if name in results:
+            continue
+        if use_javap:
+            results[name] = javap_class_bytes(data)
+        else:
+            results[name] = (TOOL_ERROR, "\n".join(cfr_errors) or "[ERROR] CFR produced no output")
 
-        return "[ERROR] decompiler not configured (set cfr_jar or enable javap fallback)"
+    return results
 
 
-def print_zip_sources(zip_path: Path, zf: zipfile.ZipFile, targets: list[str], cfg: dict) -> None:
+class DecompileCache:
+    """
+    디컴파일 결과 디스크 캐시 (content-addressed).
+    - key: sha256(class 바이트) + 디컴파일러 식별값(CFR jar sha256 + batch 여부 / javap 버전)
+    - 식별값의 도구가 만든 결과만 저장 (CFR 설정 시 javap fallback 결과는 저장 안 함)
+    - 적중 시 외부 프로세스(java/javap) 실행 안 함
+    - 파일 mtime 을 최근 사용 시각으로 사용 → 용량 초과 시 오래된 것부터 삭제(LRU)
+    """
+
+    def __init__(self, cache_dir: str, max_mb: int):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_bytes = max(0, max_mb) * 1024 * 1024
+        self.hit = 0
+        self.miss = 0
+        self._identity: str | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_dir is not None
+
+    def identity(self, cfg: dict) -> str:
+        if self._identity is None:
+            cfr_jar = str(cfg.get("cfr_jar", "")).strip()
+            if cfr_jar and Path(cfr_jar).exists():
+                h = hashlib.sha256(Path(cfr_jar).read_bytes()).hexdigest()
+                # batch 는 inner class 를 바깥 class 소스로 출력하므로 결과가 다르다
+                self._identity = f"{TOOL_CFR}:{h}:batch={bool(cfg.get('decompile_batch', True))}"
+            else:
+                _, out = run_cmd(["javap", "-version"])
+                self._identity = f"{TOOL_JAVAP}:{out.strip()}"
+        return self._identity
+
+    def _path(self, class_bytes: bytes, cfg: dict) -> Path:
+        h = hashlib.sha256()
+        h.update(self.identity(cfg).encode("utf-8"))
+        h.update(b"\0")
+        h.update(class_bytes)
+        key = h.hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, class_bytes: bytes, cfg: dict) -> str | None:
+        if not self.enabled:
+            return None
+        p = self._path(class_bytes, cfg)
+        try:
+            text = p.read_text(encoding="utf-8")
+        except OSError:
+            self.miss += 1
+            return None
+        try:
+            os.utime(p)   # LRU 갱신
+        except OSError:
+            pass
+        self.hit += 1
+        return text
+
+    def put(self, class_bytes: bytes, cfg: dict, tool: str, text: str) -> None:
+        # 실패 결과 / 다른 도구(fallback) 결과는 저장하지 않음 (다음 실행에서 재시도)
+        if not self.enabled or not self.identity(cfg).startswith(tool + ":"):
+            return
+        p = self._path(class_bytes, cfg)
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            tmp = p.with_name(f"{p.name}.tmp_{os.getpid()}")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, p)
+        except OSError as e:
+            print(f"[WARN] decompile cache write failed: {e}")
+
+    def evict(self) -> int:
+        """
+        용량 상한 초과분을 오래 사용하지 않은 순으로 삭제. 삭제 건수 반환.
+        """
+        if not self.enabled or not self.cache_dir.exists():
+            return 0
+
+        files = []
+        total = 0
+        for p in self.cache_dir.rglob("*.txt"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+            total += st.st_size
+
+        removed = 0
+        files.sort()
+        for _, size, p in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+
+def print_zip_sources(
+    zip_path: Path,
+    zf: zipfile.ZipFile,
+    targets: list[str],
+    cfg: dict,
+    cache: DecompileCache | None = None,
+) -> None:
     """
     targets: zip 내부 경로(ZipInfo.filename) 목록
     zip 파일의 마지막에 소스 내용을 추가 출력한다.
@@ -170,25 +472,55 @@ def print_zip_sources(zip_path: Path, zf: zipfile.ZipFile, targets: list[str], c
         return
 
     decompile_class = bool(cfg.get("decompile_class", False))
+    decompile_batch = bool(cfg.get("decompile_batch", True))
 
+    # 1) 읽기 (출력 순서 유지)
+    loaded: list[tuple[str, bytes | None, str]] = []
     for name in targets:
-        print("\n" + ("-" * 80))
-        print(f"[FILE] {name}")
-
         try:
             with zf.open(name, "r") as fp:
-                data = fp.read()
+                loaded.append((name, fp.read(), ""))
         except KeyError:
-            print("[MISS] not found")
-            continue
+            loaded.append((name, None, "[MISS] not found"))
         except Exception as e:
-            print(f"[ERROR] read failed: {e}")
+            loaded.append((name, None, f"[ERROR] read failed: {e}"))
+
+    def is_class(name: str) -> bool:
+        return decompile_class and name.lower().endswith(".class")
+
+    # 2) 캐시 조회 → 나머지 class 만 디컴파일 (batch 면 한 번에)
+    decompiled: dict[str, str] = {}
+    classes = {name: data for name, data, _ in loaded if data is not None and is_class(name)}
+    if cache is not None:
+        for name, data in classes.items():
+            text = cache.get(data, cfg)
+            if text is not None:
+                decompiled[name] = text
+
+    todo = {name: data for name, data in classes.items() if name not in decompiled}
+    if decompile_batch:
+        fresh = decompile_classes_batch(todo, cfg)
+    else:
+        fresh = {name: decompile_class_bytes(data, cfg) for name, data in todo.items()}
+
+    for name, (tool, text) in fresh.items():
+        if cache is not None:
+            cache.put(todo[name], cfg, tool, text)
+        decompiled[name] = text
+
+    # 3) 출력
+    for name, data, err in loaded:
+        print("\n" + ("-" * 80))
+        print(f"[FILE] {name}")
+
+        if data is None:
+            print(err)
             continue
 
         # .class이면 디컴파일 출력
-        if decompile_class and name.lower().endswith(".class"):
+        if is_class(name):
             print("[DECOMPILE]\n")
-            print(decompile_class_bytes(data, cfg))
+            print(decompiled[name])
             continue
 
         # 일반 텍스트 파일 출력
@@ -200,41 +532,193 @@ def print_zip_sources(zip_path: Path, zf: zipfile.ZipFile, targets: list[str], c
         print(text.rstrip("\n"))
 
 
-def list_zip(zip_path: Path, print_line: int, print_src: bool, filelist_targets: list[str], cfg: dict) -> int:
+def list_zip(
+    zip_path: Path,
+    print_line: int,
+    print_src: bool,
+    filelist_targets: list[str],
+    cfg: dict,
+    cache: DecompileCache | None = None,
+) -> int:
     if not zip_path.exists():
         print(f"[ERROR] zip_file not found: {zip_path}")
         return 2
 
     items: list[tuple[datetime, str, zipfile.ZipInfo]] = []
 
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        for zi in zf.infolist():
-            if zi.filename.endswith("/"):
-                continue
-            items.append((zipinfo_dt(zi), zi.filename, zi))
+    # 목록은 인덱스 캐시 사용 (zip 을 열지 않음)
+    for zi in load_zip_index(zip_path, cfg.get("index_cache_dir", DEFAULT_INDEX_DIR)):
+        if zi.filename.endswith("/"):
+            continue
+        items.append((zipinfo_dt(zi), zi.filename, zi))
 
-        # 시간 내림차순, 파일명 오름차순
-        items.sort(key=lambda x: (-x[0].timestamp(), x[1]))
+    # 시간 내림차순, 파일명 오름차순
+    items.sort(key=lambda x: (-x[0].timestamp(), x[1]))
 
-        print(f"[ZIP] {zip_path}")
-        print(f"[COUNT] total_files={len(items)}, print_line={print_line}\n")
+    print(f"[ZIP] {zip_path}")
+    print(f"[COUNT] total_files={len(items)}, print_line={print_line}\n")
 
-        for dt, name, zi in items[:print_line]:
-            print(f"({diff_hms(dt)}) {dt.strftime('%Y-%m-%d %H:%M:%S')} | {to_mb(zi.file_size):6.2f} MB | {name}")
+    for dt, name, zi in items[:print_line]:
+        print(f"({diff_hms(dt)}) {dt.strftime('%Y-%m-%d %H:%M:%S')} | {to_mb(zi.file_size):6.2f} MB | {name}")
 
-        # 기존 출력 유지 + 마지막에 추가 출력
-        if print_src:
-            print_zip_sources(zip_path, zf, filelist_targets, cfg)
+    # 기존 출력 유지 + 마지막에 추가 출력 (소스 출력 시에만 zip 을 연다)
+    if print_src:
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            print_zip_sources(zip_path, zf, filelist_targets, cfg, cache)
             print("\n" + ("-" * 80))
 
     return 0
 
 
+def _entry_json(e: CDEntry) -> dict:
+    return {
+        "crc": f"{e.CRC:08x}",
+        "size": e.file_size,
+        "date_time": datetime(*e.date_time).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+# 좌측 entry 를 sqlite 에 넣을 때 한 번에 기록하는 행 수
+DIFF_INSERT_BATCH = 5000
+
+
+def _entry_row(e: CDEntry) -> tuple:
+    return (*e[:5], json.dumps(e.date_time), e.header_offset)
+
+
+def _row_entry(row: tuple) -> CDEntry:
+    return CDEntry(*row[:5], tuple(json.loads(row[5])), row[6])
+
+
+def diff_zip(left_path: Path, right_path: Path, cfg: dict, report_fp=None) -> dict:
+    """
+    두 zip 의 central directory 만 읽어 ADDED / REMOVED / CHANGED 를 출력한다 (데이터 inflate 없음).
+    - CRC 또는 크기가 다르면 CHANGED
+    - diff_verify_hash 면 CRC/크기가 같은 entry 도 모두 내용 sha256 으로 재확인 (CRC 충돌 대비, 느림)
+    - 양쪽 central directory 모두 스트리밍, 좌측은 임시 sqlite 파일에 기록 후 이름으로 조회
+      → 메모리는 entry 수와 무관 (100k+ entry 대응)
+    - ADDED / CHANGED 는 우측 central directory 순서, REMOVED 는 마지막에 이름순으로 출력
+    report_fp 가 있으면 변경 1건당 JSON 1줄 기록
+    """
+    verify_hash = bool(cfg.get("diff_verify_hash", False))
+    counts = {"added": 0, "removed": 0, "changed": 0, "same": 0, "hashed": 0}
+
+    def emit(status: str, name: str, left: CDEntry | None, right: CDEntry | None, note: str = "") -> None:
+        counts[status.lower()] += 1
+        if status == "ADDED":
+            print(f"[ADDED]   {to_mb(right.file_size):6.2f} MB | {name}")
+        elif status == "REMOVED":
+            print(f"[REMOVED] {to_mb(left.file_size):6.2f} MB | {name}")
+        else:
+            print(
+                f"[CHANGED] crc {left.CRC:08x} -> {right.CRC:08x} | "
+                f"size {left.file_size} -> {right.file_size} | {name}{note}"
+            )
+        if report_fp is not None:
+            rec = {"left": str(left_path), "right": str(right_path), "status": status, "name": name}
+            if left is not None:
+                rec["before"] = _entry_json(left)
+            if right is not None:
+                rec["after"] = _entry_json(right)
+            report_fp.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+    print(f"[DIFF] {left_path}")
+    print(f"    -> {right_path}\n")
+
+    with tempfile.TemporaryDirectory() as td, \
+            closing(sqlite3.connect(str(Path(td) / "left.sqlite"))) as db, \
+            open(left_path, "rb") as lfp, open(right_path, "rb") as rfp:
+        db.execute("PRAGMA journal_mode=OFF")
+        db.execute("PRAGMA synchronous=OFF")
+        db.execute(f"CREATE TABLE base (filename TEXT PRIMARY KEY, {', '.join(CDEntry._fields[1:])})")
+        insert = f"INSERT OR REPLACE INTO base VALUES ({', '.join('?' * len(CDEntry._fields))})"
+
+        batch = []
+        for e in iter_central_directory(left_path):
+            if e.filename.endswith("/"):
+                continue
+            batch.append(_entry_row(e))
+            if len(batch) >= DIFF_INSERT_BATCH:
+                db.executemany(insert, batch)
+                batch.clear()
+        db.executemany(insert, batch)
+
+        for r in iter_central_directory(right_path):
+            if r.filename.endswith("/"):
+                continue
+            row = db.execute("SELECT * FROM base WHERE filename = ?", (r.filename,)).fetchone()
+            if row is None:
+                emit("ADDED", r.filename, None, r)
+                continue
+            db.execute("DELETE FROM base WHERE filename = ?", (r.filename,))
+            l = _row_entry(row)
+
+            if l.CRC != r.CRC or l.file_size != r.file_size:
+                emit("CHANGED", r.filename, l, r)
+                continue
+
+            if verify_hash:
+                counts["hashed"] += 1
+                lh, rh = hash_entry(lfp, l), hash_entry(rfp, r)
+                if lh is not None and rh is not None and lh != rh:
+                    emit("CHANGED", r.filename, l, r, " (crc collision)")
+                    continue
+
+            counts["same"] += 1
+
+        for row in db.execute("SELECT * FROM base ORDER BY filename"):
+            emit("REMOVED", row[0], _row_entry(row), None)
+
+    print(
+        f"\n[DIFF] added({counts['added']}), removed({counts['removed']}), "
+        f"changed({counts['changed']}), same({counts['same']}), hashed({counts['hashed']})"
+    )
+    return counts
+
+
+def run_diff(cfg: dict) -> int:
+    zip_paths = [Path(str(z)) for z in cfg["zip_files"]]
+    if len(zip_paths) < 2:
+        print("[ERROR] diff_mode 는 zip_files 가 2개 이상 필요합니다.")
+        return 2
+
+    missing = [p for p in zip_paths if not p.exists()]
+    if missing:
+        for p in missing:
+            print(f"[ERROR] zip_file not found: {p}")
+        return 2
+
+    report_path = str(cfg.get("diff_report", "") or "")
+    report_fp = None
+    if report_path:
+        Path(report_path).parent.mkdir(parents=True, exist_ok=True)
+        report_fp = open(report_path, "w", encoding="utf-8")
+
+    differs = False
+    try:
+        base = zip_paths[0]
+        for other in zip_paths[1:]:
+            print("=" * 80)
+            counts = diff_zip(base, other, cfg, report_fp)
+            if counts["added"] + counts["removed"] + counts["changed"] > 0:
+                differs = True
+    finally:
+        if report_fp is not None:
+            report_fp.close()
+            print(f"\n[REPORT] {Path(report_path).resolve()}")
+
+    # diff(1) 과 같이 차이가 있으면 1
+    return 1 if differs else 0
+
+
 def main() -> int:
     print(f"> {now_str()}\n")
 
     cfg = load_config()
 
+    if cfg["diff_mode"]:
+        return run_diff(cfg)
+
     print_line = int(cfg.get("print_line", 20))
     if print_line < 1:
         print_line = 1
@@ -242,15 +726,23 @@ def main() -> int:
     print_src = bool(cfg.get("print_src", False))
     filelist_targets = read_filelist(str(cfg.get("filelist", ""))) if print_src else []
 
+    cache = None
+    if print_src and cfg.get("decompile_class") and cfg.get("decompile_cache_dir"):
+        cache = DecompileCache(str(cfg["decompile_cache_dir"]), int(cfg.get("decompile_cache_max_mb", 200)))
+
     # zip_files 전체 순회 출력
     rc = 0
     for z in cfg["zip_files"]:
         zip_path = Path(str(z))
         print("=" * 80)
-        r = list_zip(zip_path, print_line, print_src, filelist_targets, cfg)
+        r = list_zip(zip_path, print_line, print_src, filelist_targets, cfg, cache)
         if r != 0:
             rc = r
 
+    if cache is not None:
+        evicted = cache.evict()
+        print(f"\n[DECOMPILE CACHE] hit={cache.hit}, miss={cache.miss}, evicted={evicted}")
+
     return rc
 
 